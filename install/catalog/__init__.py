@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : __init__.py
+@Path : install/catalog
+@Author : Anfioo
+@Date : 2026/10/17 21:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+from .catalog_record import CatalogRecord
+from .catalog_normalizers import CatalogNormalizers
+from .catalog_store import CatalogDelta, CatalogStore
+from .catalog_refresher import CatalogRefresher
+from .catalog_prefetcher import CatalogPrefetcher, FeedReport
+from .catalog_bundler import CatalogBundler
+
+__all__ = ["CatalogRecord", "CatalogNormalizers", "CatalogDelta", "CatalogStore", "CatalogRefresher", "CatalogPrefetcher",
+           "FeedReport", "CatalogBundler"]
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : catalog_bundler.py
+@Path : install/catalog
+@Author : Anfioo
+@Date : 2026/10/18 01:30
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import shutil
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from install.catalog.catalog_record import CatalogRecord
+from install.catalog.catalog_refresher import CatalogRefresher
+from install.catalog.catalog_store import CatalogStore
+from loader.ini.cache_file_manager import CacheFileManager
+from wing_utils.download.blob_store import BlobStore
+from wing_utils.download.download_utils import DownloadUtils
+from wing_utils.download.offline_bundle_utils import OfflineBundle, OfflineBundleUtils
+from wing_utils.download.rate_limit_utils import DownloadPriority
+
+
+class CatalogBundler:
+    """
+    离线包的导出与导入 (we bundle export / import)
+
+    导出：选中的目录记录 + 它们的安装包 (取自下载仓库，缺失时先下载) + 缓存中的全部版本数据源。
+    导入：在离线模式下用离线包中的数据源重建目录，数据源缺失的工具直接写入包中的记录。
+    """
+
+    def __init__(self, store: Optional[CatalogStore] = None, blob_store: Optional[BlobStore] = None,
+                 downloads_dir: Optional[Path] = None):
+        """
+        :param store: 目录数据库
+        :param blob_store: 下载仓库，导出时从这里取安装包
+        :param downloads_dir: 缺失的安装包下载到这个目录 (按工具分子目录)
+        """
+        self.store = store or CatalogStore()
+        self.blob_store = blob_store
+        self.downloads_dir = downloads_dir
+
+    def select(self, queries: List[str], kind: Optional[str] = None, limit: Optional[int] = 1) -> List[CatalogRecord]:
+        """
+        按查询语句选出记录，每条语句与 we search 相同：工具 + 版本 / 系统 / 架构
+        :param queries: 例如 ["jdk 21 linux x64", "node 20 lts linux x64"]
+        :param kind: 包格式
+        :param limit: 每条语句最多选中的记录数 (按版本从新到旧)
+        :raises ValueError: 语句为空、没有匹配或版本规格不合法
+        """
+        selected: Dict[str, CatalogRecord] = {}
+        for query in queries:
+            terms = query.split()
+            if not terms:
+                raise ValueError("查询语句为空")
+            found = self.store.search(terms[0], kind=kind, limit=limit, **CatalogStore.parse_query(terms[1:]))
+            if not found:
+                raise ValueError(f"目录中没有匹配的安装包: {query}")
+            for record in found:
+                selected.setdefault(record.url, record)
+        return list(selected.values())
+
+    def export(self, path: Union[str, Path], records: List[CatalogRecord], download_missing: bool = True,
+               on_record: Optional[Callable[[CatalogRecord, Path], None]] = None) -> int:
+        """
+        生成离线包
+        :param path: 输出路径
+        :param records: 要打包的记录
+        :param download_missing: 仓库中没有的安装包是否先下载
+        :param on_record: 每个安装包就绪时回调 (用于输出进度)
+        :return: 打包的文件数
+        :raises FileNotFoundError: 安装包不在仓库中且不允许下载
+        """
+        files = []
+        cache = CacheFileManager()
+        for url, file_name in sorted(cache.cached_sources().items()):
+            files.append({"url": url, "path": cache.get_cache_dir() / file_name, "kind": "feed"})
+        for record in records:
+            archive = self._archive_path(record, download_missing)
+            files.append({"url": record.url, "path": archive, "kind": "artifact", "sha256": archive.name,
+                          "name": DownloadUtils.get_filename_from_url(record.url)})
+            if on_record:
+                on_record(record, archive)
+        entries = OfflineBundle.write(path, files, [r.to_dict() for r in records])
+        return len(entries)
+
+    def _archive_path(self, record: CatalogRecord, download_missing: bool) -> Path:
+        """安装包在仓库中的 blob 路径 (文件名即 sha256)"""
+        if self.blob_store is None:
+            raise FileNotFoundError("未提供下载仓库")
+        digest = self.blob_store.digest_for_url(record.url)
+        if digest is None and record.checksum and self.blob_store.get(record.checksum):
+            digest = record.checksum.lower()
+        if digest is None:
+            if not download_missing or self.downloads_dir is None:
+                raise FileNotFoundError(f"下载仓库中没有: {record.url}")
+            DownloadUtils.download(record.url, str(self.downloads_dir / record.tool), checksum=record.checksum,
+                                   store=self.blob_store, priority=DownloadPriority.BACKGROUND)
+            digest = self.blob_store.digest_for_url(record.url)
+        return self.blob_store.blob_path(digest)
+
+    def import_bundle(self, path: Union[str, Path], bundles_dir: Optional[Path] = None) -> Dict[str, Optional[Exception]]:
+        """
+        导入离线包：复制到 bundles_dir (提供时)，启用离线模式并重建目录
+        :return: {工具: None 或失败原因}
+        """
+        path = Path(path)
+        if bundles_dir is not None and path.resolve().parent != Path(bundles_dir).resolve():
+            Path(bundles_dir).mkdir(parents=True, exist_ok=True)
+            path = Path(shutil.copy2(path, Path(bundles_dir) / path.name))
+        OfflineBundleUtils.enable(path)
+        bundle = OfflineBundleUtils.current()
+
+        by_tool: Dict[str, List[CatalogRecord]] = {}
+        for item in bundle.records:
+            by_tool.setdefault(item["tool"], []).append(CatalogRecord(**item))
+        results = CatalogRefresher(self.store).refresh()
+        for tool, error in results.items():
+            # 离线包中没有该工具的数据源时，至少收录导出时选中的记录
+            if error is not None and tool in by_tool:
+                self.store.replace_tool(tool, by_tool[tool], str(path))
+                results[tool] = None
+        return results
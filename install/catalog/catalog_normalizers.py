@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : catalog_normalizers.py
+@Path : install/catalog
+@Author : Anfioo
+@Date : 2026/10/17 21:50
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+from install.catalog.catalog_record import ANY, CatalogRecord
+from install.retrieval_flow_builder.maven_flow_builder import MAVEN_DOWNLOAD_BASE
+from install.retrieval_flow_builder.npm_flow_builder import NPMRetrievalFlowBuilder
+from wing_utils.common.version_utils import VersionUtils
+
+# 包格式按文件名后缀识别，长后缀在前
+KIND_SUFFIXES = ("tar.gz", "tar.xz", "tar.bz2", "tar.Z", "tgz", "zip", "7z", "msi", "exe", "pkg", "dmg", "sh")
+
+CMAKE_FILE_PATTERN = re.compile(
+    r"^cmake-(?P<version>\d+\.\d+\.\d+(?:-rc\d+)?)-(?P<os>[A-Za-z]+)[\d.]*-(?P<arch>[A-Za-z0-9_]+)\.(?P<ext>.+)$")
+MINICONDA_FILE_PATTERN = re.compile(
+    r"^Miniconda(?P<major>\d)-(?:(?P<latest>latest)|(?:(?P<py>py\d+)_)?(?P<version>\d[\d.]*(?:-\d+)?))"
+    r"-(?P<os>[A-Za-z]+)-(?P<arch>[A-Za-z0-9_]+)\.(?P<ext>sh|exe|pkg)$")
+
+
+class CatalogNormalizers:
+    """
+    把各工具的数据源转换成 CatalogRecord 列表
+    输入都是构建器已经解析好的结构 (JSON / 版本列表 / 目录页面的文件列表)，不发起网络请求。
+    """
+
+    @staticmethod
+    def jdk(feed: Dict[str, Any]) -> List[CatalogRecord]:
+        """JetBrains jdks.json"""
+        records = []
+        for jdk in feed.get("jdks", []):
+            vendor, version = jdk.get("vendor"), jdk.get("jdk_version")
+            if not vendor or not version:
+                continue
+            lts = VersionUtils.is_java_lts(version)
+            for pkg in jdk.get("packages", []):
+                url = pkg.get("url")
+                if not url:
+                    continue
+                records.append(CatalogRecord(
+                    tool="jdk", vendor=vendor, version=version,
+                    os=CatalogRecord.normalize_os(pkg.get("os")), arch=CatalogRecord.normalize_arch(pkg.get("arch")),
+                    kind=_kind_of(pkg.get("archive_file_name") or url), url=url,
+                    size=pkg.get("archive_size"), checksum=pkg.get("sha256"), lts=lts))
+        return records
+
+    @staticmethod
+    def node(index: List[Dict[str, Any]], base_url: str) -> List[CatalogRecord]:
+        """
+        Node.js index.json
+        :param base_url: 取得 index.json 的镜像根地址，下载地址基于它拼接
+        """
+        records = []
+        for release in index:
+            version = release.get("version", "")
+            for file_type in release.get("files", []):
+                if file_type in ("headers", "src"):
+                    continue
+                filename, url = NPMRetrievalFlowBuilder.parse_download_url(base_url, version, file_type)
+                platform = file_type.split("-")
+                records.append(CatalogRecord(
+                    tool="node", vendor="Node.js", version=version.lstrip("v"),
+                    os=CatalogRecord.normalize_os(platform[0]),
+                    arch=CatalogRecord.normalize_arch(platform[1] if len(platform) > 1 else None),
+                    kind=_kind_of(filename), url=url, lts=bool(release.get("lts"))))
+        return records
+
+    @staticmethod
+    def go(feed: List[Dict[str, Any]]) -> List[CatalogRecord]:
+        """go.dev/dl/?mode=json&include=all"""
+        records = []
+        for release in feed:
+            for f in release.get("files", []):
+                # 源码包没有系统 / 架构
+                if f.get("kind") == "source" or not f.get("os"):
+                    continue
+                records.append(CatalogRecord(
+                    tool="go", vendor="Go", version=f.get("version", release.get("version", "")).removeprefix("go"),
+                    os=CatalogRecord.normalize_os(f["os"]), arch=CatalogRecord.normalize_arch(f.get("arch")),
+                    kind=_kind_of(f["filename"]), url=f"https://go.dev/dl/{f['filename']}",
+                    size=f.get("size"), checksum=f.get("sha256")))
+        return records
+
+    @staticmethod
+    def maven(versions: List[str]) -> List[CatalogRecord]:
+        """maven-metadata.xml 中的版本列表"""
+        records = []
+        for version in versions:
+            # 下载地址固定在 maven-3 目录下，其它大版本没有对应的二进制包
+            if not version.startswith("3."):
+                continue
+            for fmt in ("bin.zip", "bin.tar.gz"):
+                filename = f"apache-maven-{version}-{fmt}"
+                records.append(CatalogRecord(
+                    tool="maven", vendor="Apache", version=version, os=ANY, arch=ANY,
+                    kind=_kind_of(filename), url=f"{MAVEN_DOWNLOAD_BASE}/{version}/binaries/{filename}"))
+        return records
+
+    @staticmethod
+    def cmake(version_url: str, files_info: List[Dict[str, str]]) -> List[CatalogRecord]:
+        """
+        cmake.org/files/vX.Y/ 目录中的安装包
+        :param version_url: 版本目录地址 (以 / 结尾)
+        :param files_info: CMakeRetrievalFlowBuilder.parse_files 的结果
+        """
+        records = []
+        for info in files_info:
+            match = CMAKE_FILE_PATTERN.match(info["name"])
+            if not match or _kind_of(info["name"]) is None:
+                continue
+            records.append(CatalogRecord(
+                tool="cmake", vendor="Kitware", version=match["version"],
+                os=CatalogRecord.normalize_os(match["os"]), arch=CatalogRecord.normalize_arch(match["arch"]),
+                kind=_kind_of(info["name"]), url=f"{version_url}{info['name']}", size=_parse_size(info.get("size"))))
+        return records
+
+    @staticmethod
+    def miniconda(files: List[Dict[str, str]], base_url: str) -> List[CatalogRecord]:
+        """
+        repo.anaconda.com/miniconda/ 目录中的安装包
+        latest 文件与某个带版本号的文件内容相同 (摘要一致) 时只保留带版本号的那一条
+        :param files: MinicondaRetrievalFlowBuilder.parse_listing 的结果
+        """
+        versioned, latest = [], []
+        for f in files:
+            match = MINICONDA_FILE_PATTERN.match(f["filename"])
+            if not match:
+                continue
+            flavor = f"Miniconda{match['major']}" + (f" ({match['py']})" if match["py"] else "")
+            record = CatalogRecord(
+                tool="miniconda", vendor=flavor, version=match["version"] or "latest",
+                os=CatalogRecord.normalize_os(match["os"]), arch=CatalogRecord.normalize_arch(match["arch"]),
+                kind=match["ext"], url=f"{base_url}{f['filename']}", size=_parse_size(f.get("size")),
+                checksum=f.get("sha256") or None)
+            (latest if match["latest"] else versioned).append(record)
+        known = {r.checksum for r in versioned if r.checksum}
+        return versioned + [r for r in latest if r.checksum not in known]
+
+
+def _kind_of(filename: str) -> Optional[str]:
+    for suffix in KIND_SUFFIXES:
+        if filename.endswith("." + suffix):
+            return suffix
+    return None
+
+
+def _parse_size(text: Optional[str]) -> Optional[int]:
+    """目录页面里的大小 (例如 47M、1.2K、74.3 MiB) 转为字节数"""
+    match = re.match(r"\s*([\d.]+)\s*([KMGT]?)", text or "", re.IGNORECASE)
+    if not match:
+        return None
+    try:
+        value = float(match.group(1))
+    except ValueError:
+        return None
+    return int(value * 1024 ** " KMGT".index(match.group(2).upper() or " "))
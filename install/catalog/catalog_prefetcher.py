@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : catalog_prefetcher.py
+@Path : install/catalog
+@Author : Anfioo
+@Date : 2026/10/17 23:00
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from install.catalog.catalog_refresher import CatalogRefresher
+from install.retrieval_flow_builder.cmake_flow_builder import CMAKE_BASE_URL, CMakeRetrievalFlowBuilder
+from install.retrieval_flow_builder.go_flow_builder import GO_API_URL, GoRetrievalFlowBuilder
+from install.retrieval_flow_builder.jdk_catalog import JDK_FEED_URL, JdkCatalog
+from install.retrieval_flow_builder.maven_flow_builder import MAVEN_METADATA_URL, MavenRetrievalFlowBuilder
+from install.retrieval_flow_builder.miniconda_flow_builder import CONDA_PAGE_URL, MinicondaRetrievalFlowBuilder
+from install.retrieval_flow_builder.npm_flow_builder import MIRRORS, NPMRetrievalFlowBuilder
+from wing_utils.download.rate_limit_utils import BandwidthScheduler, DownloadPriority
+
+
+@dataclass
+class FeedReport:
+    tool: str
+    name: str
+    url: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _Feed:
+    tool: str
+    name: str
+    url: str
+    load: Callable[[], Any]
+    # 根据本次结果生成后续要拉取的数据源 (CMake 主目录 -> 各版本目录)
+    then: Optional[Callable[[Any], List["_Feed"]]] = None
+
+
+class CatalogPrefetcher:
+    """
+    并发预取所有版本数据源 (we catalog refresh)
+
+    每个数据源都经过构建器的 load_* 方法，也就是 CacheFileManager 的条件请求与缓存文件，
+    预取之后交互式安装直接命中缓存。默认 ttl=0：无论缓存是否过期都重新验证一次 (未变化时只是 304)。
+    适合放在 cron / systemd timer 中定时执行。
+    """
+
+    MAX_WORKERS = 8
+
+    def __init__(self, max_workers: int = MAX_WORKERS, ttl: float = 0):
+        """
+        :param max_workers: 同时进行的请求数
+        :param ttl: 缓存有效期 (秒)，未过期的数据源不联网
+        """
+        self.max_workers = max(1, max_workers)
+        self.ttl = ttl
+
+    def feeds(self) -> List[_Feed]:
+        """全部一级数据源"""
+        ttl = self.ttl
+        feeds = [_Feed("jdk", "jdk", JDK_FEED_URL, lambda: JdkCatalog.load(stale_while_revalidate=False, ttl=ttl))]
+        for name, base_url in MIRRORS.items():
+            feeds.append(_Feed("node", f"node ({name})", f"{base_url}/index.json",
+                               lambda b=base_url: NPMRetrievalFlowBuilder.load_index(b, ttl=ttl)))
+        feeds += [
+            _Feed("go", "go", GO_API_URL, lambda: GoRetrievalFlowBuilder.load_feed(ttl=ttl)),
+            _Feed("maven", "maven", MAVEN_METADATA_URL, lambda: MavenRetrievalFlowBuilder.load_versions(ttl=ttl)),
+            _Feed("cmake", "cmake", CMAKE_BASE_URL, lambda: CMakeRetrievalFlowBuilder.load_version_dirs(ttl=ttl),
+                  then=self._cmake_version_feeds),
+            _Feed("miniconda", "miniconda", CONDA_PAGE_URL,
+                  lambda: MinicondaRetrievalFlowBuilder.load_listing(ttl=ttl)),
+        ]
+        return feeds
+
+    def _cmake_version_feeds(self, version_dirs: List[str]) -> List[_Feed]:
+        return [_Feed("cmake", f"cmake {d}", CMakeRetrievalFlowBuilder.version_url(d),
+                      lambda d=d: CMakeRetrievalFlowBuilder.load_files(d, ttl=self.ttl))
+                for d in version_dirs[:CatalogRefresher.CMAKE_VERSION_DIRS]]
+
+    def run(self, on_report: Optional[Callable[[FeedReport], None]] = None) -> List[FeedReport]:
+        """
+        并发拉取全部数据源，单个失败不影响其它
+        :param on_report: 每个数据源完成时回调 (用于实时输出)
+        :return: 各数据源的耗时与错误，按完成顺序排列
+        """
+        reports: List[FeedReport] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="catalog-prefetch") as pool:
+            pending: Dict[Future, _Feed] = {pool.submit(self._timed, feed): feed for feed in self.feeds()}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    feed = pending.pop(future)
+                    report, result = future.result()
+                    reports.append(report)
+                    if on_report:
+                        on_report(report)
+                    # 后续数据源由主线程提交，工作线程内不等待其它任务，线程池占满时也不会死锁
+                    if report.ok and feed.then:
+                        for follow in feed.then(result):
+                            pending[pool.submit(self._timed, follow)] = follow
+        return reports
+
+    @staticmethod
+    def _timed(feed: _Feed):
+        start = time.perf_counter()
+        try:
+            # 预取是后台任务，限速时让位给交互式安装
+            with BandwidthScheduler.priority_scope(DownloadPriority.BACKGROUND):
+                result = feed.load()
+            error = None
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        return FeedReport(feed.tool, feed.name, feed.url, time.perf_counter() - start, error), result
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : catalog_record.py
+@Path : install/catalog
+@Author : Anfioo
+@Date : 2026/10/17 21:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+from wing_utils.common.version_utils import VersionUtils
+
+# 各数据源的系统 / 架构写法不同，统一成以下名称
+OS_ALIASES = {
+    "windows": "windows", "win": "windows", "win32": "windows",
+    "linux": "linux",
+    "macos": "macos", "mac": "macos", "macosx": "macos", "osx": "macos", "darwin": "macos",
+    "aix": "aix", "freebsd": "freebsd", "sunos": "sunos", "solaris": "sunos",
+}
+ARCH_ALIASES = {
+    "x64": "x64", "x86_64": "x64", "amd64": "x64",
+    "x86": "x86", "386": "x86", "i386": "x86", "i686": "x86",
+    "aarch64": "aarch64", "arm64": "aarch64",
+    "arm": "arm", "armv6l": "arm", "armv7l": "arm", "armhf": "arm",
+    "ppc64le": "ppc64le", "ppc64": "ppc64", "s390x": "s390x", "riscv64": "riscv64", "loong64": "loong64",
+    "universal": "universal",
+}
+# 与平台无关的包 (Maven 等) 使用的系统 / 架构
+ANY = "any"
+
+
+@dataclass
+class CatalogRecord:
+    """
+    统一目录中的一条安装包记录
+
+    tool: 工具 (jdk / node / go / maven / cmake / miniconda)
+    vendor: 发行方 (JDK 厂商，其它工具为官方名称)
+    version: 规范化后的版本号 (去掉 v / go 等前缀)
+    os / arch: 规范化后的系统与架构，平台无关时为 any
+    kind: 包格式 (zip / tar.gz / msi / pkg / sh ...)
+    url: 下载地址
+    size: 字节数 (未知时为 None)
+    checksum: sha256 十六进制摘要 (未知时为 None)
+    lts: 是否为长期支持版本
+    """
+    tool: str
+    vendor: str
+    version: str
+    os: str
+    arch: str
+    kind: str
+    url: str
+    size: Optional[int] = None
+    checksum: Optional[str] = None
+    lts: bool = False
+
+    @property
+    def version_key(self) -> str:
+        """可直接按字符串比较的版本排序键 (VersionUtils.encode)"""
+        return VersionUtils.encode(VersionUtils.key(self.version))
+
+    @property
+    def key(self) -> str:
+        """
+        跨刷新稳定的记录标识：厂商 + 版本 + 文件名
+        不用完整 url，换镜像 (只有地址前缀不同) 时记录视为更新而不是删除后新增
+        """
+        return f"{self.vendor}|{self.version}|{self.url.rstrip('/').rsplit('/', 1)[-1]}"
+
+    @property
+    def prerelease(self) -> bool:
+        return VersionUtils.is_prerelease(self.version)
+
+    @staticmethod
+    def normalize_os(name: Optional[str]) -> str:
+        if not name:
+            return ANY
+        return OS_ALIASES.get(name.lower(), name.lower())
+
+    @staticmethod
+    def normalize_arch(name: Optional[str]) -> str:
+        if not name:
+            return ANY
+        return ARCH_ALIASES.get(name.lower(), name.lower())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : catalog_refresher.py
+@Path : install/catalog
+@Author : Anfioo
+@Date : 2026/10/17 22:20
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from install.catalog.catalog_normalizers import CatalogNormalizers
+from install.catalog.catalog_record import CatalogRecord
+from install.catalog.catalog_store import CatalogDelta, CatalogStore
+from install.retrieval_flow_builder.cmake_flow_builder import CMAKE_BASE_URL, CMakeRetrievalFlowBuilder
+from install.retrieval_flow_builder.go_flow_builder import GO_API_URL, GoRetrievalFlowBuilder
+from install.retrieval_flow_builder.jdk_catalog import JDK_CACHE_FILE_NAME, JDK_CACHE_TTL, JDK_FEED_URL
+from install.retrieval_flow_builder.maven_flow_builder import MAVEN_DOWNLOAD_BASE, MAVEN_METADATA_URL, \
+    MavenRetrievalFlowBuilder
+from install.retrieval_flow_builder.miniconda_flow_builder import CONDA_PAGE_URL, MinicondaRetrievalFlowBuilder
+from install.retrieval_flow_builder.npm_flow_builder import MIRRORS, NPMRetrievalFlowBuilder
+from loader.ini.cache_file_manager import CacheFileManager
+from wing_utils.download.rate_limit_utils import BandwidthScheduler, DownloadPriority
+
+
+class CatalogRefresher:
+    """
+    从各工具的数据源拉取数据、规范化后写入 CatalogStore
+
+    数据都经过 CacheFileManager 获取 (条件请求，未过期时不联网，与构建器共用缓存文件)；
+    单个数据源失败不影响其它工具，目录中保留它上一次的数据。
+    """
+
+    # 目录中某工具的数据超过这个时间 (秒) 视为过期，由后台刷新
+    MAX_AGE = 6 * 60 * 60
+    # CMake 只收录最近的几个主版本目录 (每个目录一次请求)
+    CMAKE_VERSION_DIRS = 3
+    TOOLS = ("jdk", "node", "go", "maven", "cmake", "miniconda")
+
+    _background: Optional[threading.Thread] = None
+    _background_lock = threading.Lock()
+
+    def __init__(self, store: Optional[CatalogStore] = None):
+        self.store = store or CatalogStore()
+        # 最近一次刷新中各工具的改动 (新增 / 更新 / 删除条数)
+        self.deltas: Dict[str, CatalogDelta] = {}
+
+    def refresh(self, tools: Optional[Iterable[str]] = None,
+                priority: DownloadPriority = DownloadPriority.BACKGROUND) -> Dict[str, Optional[Exception]]:
+        """
+        刷新指定工具 (默认全部)，只把与上一次相比的差异写入目录
+        :param priority: 请求的限速优先级，用户正在等待结果时传 INTERACTIVE
+        :return: {工具: None 或失败原因}
+        """
+        results: Dict[str, Optional[Exception]] = {}
+        for tool in tools or self.TOOLS:
+            try:
+                with BandwidthScheduler.priority_scope(priority):
+                    records, origin = getattr(self, f"fetch_{tool}")()
+                self.deltas[tool] = self.store.sync_tool(tool, records, origin)
+                results[tool] = None
+            except Exception as e:
+                results[tool] = e
+        return results
+
+    def stale_tools(self, tools: Optional[Iterable[str]] = None, max_age: float = MAX_AGE) -> List[str]:
+        """从未刷新或已过期的工具"""
+        sources = self.store.sources()
+        now = time.time()
+        return [tool for tool in tools or self.TOOLS
+                if tool not in sources or now - sources[tool]["refreshed_at"] > max_age]
+
+    def refresh_in_background(self, tools: Optional[Iterable[str]] = None,
+                              max_age: float = MAX_AGE) -> Optional[threading.Thread]:
+        """
+        在后台线程刷新过期的工具，已有后台刷新在进行时不重复启动
+        :return: 启动的线程，没有需要刷新的工具时返回 None
+        """
+        stale = self.stale_tools(tools, max_age)
+        if not stale:
+            return None
+        with self._background_lock:
+            if CatalogRefresher._background is not None and CatalogRefresher._background.is_alive():
+                return None
+            thread = threading.Thread(target=self.refresh, args=(stale,), daemon=True)
+            CatalogRefresher._background = thread
+            thread.start()
+        return thread
+
+    def upstream_hosts(self) -> Set[str]:
+        """
+        已知的上游主机：各数据源与固定下载地址的主机，加上目录中记录的下载地址的主机
+        镜像代理默认只允许这些主机
+        """
+        urls = [JDK_FEED_URL, GO_API_URL, MAVEN_METADATA_URL, MAVEN_DOWNLOAD_BASE, CMAKE_BASE_URL, CONDA_PAGE_URL,
+                *MIRRORS.values()]
+        hosts = {urlsplit(url).hostname.lower() for url in urls}
+        try:
+            hosts |= self.store.hosts()
+        except Exception:
+            # 目录损坏或不可读时只用固定的主机
+            pass
+        return hosts
+
+    @classmethod
+    def wait(cls, timeout: float = 30) -> bool:
+        """等待后台刷新结束 (命令退出前调用)，超时返回 False"""
+        thread = cls._background
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    # =========================
+    # 数据源
+    # =========================
+
+    @staticmethod
+    def fetch_jdk() -> Tuple[List[CatalogRecord], str]:
+        feed = CacheFileManager().fetch_json(JDK_CACHE_FILE_NAME, JDK_FEED_URL, ttl=JDK_CACHE_TTL)
+        return CatalogNormalizers.jdk(feed), JDK_FEED_URL
+
+    @staticmethod
+    def fetch_node() -> Tuple[List[CatalogRecord], str]:
+        """依次尝试各镜像，使用第一个成功的"""
+        error: Optional[Exception] = None
+        for base_url in MIRRORS.values():
+            try:
+                index = NPMRetrievalFlowBuilder.load_index(base_url)
+            except Exception as e:
+                error = e
+                continue
+            return CatalogNormalizers.node(index, base_url), f"{base_url}/index.json"
+        raise error
+
+    @staticmethod
+    def fetch_go() -> Tuple[List[CatalogRecord], str]:
+        return CatalogNormalizers.go(GoRetrievalFlowBuilder.load_feed()), GO_API_URL
+
+    @staticmethod
+    def fetch_maven() -> Tuple[List[CatalogRecord], str]:
+        return CatalogNormalizers.maven(MavenRetrievalFlowBuilder.load_versions()), MAVEN_METADATA_URL
+
+    @classmethod
+    def fetch_cmake(cls) -> Tuple[List[CatalogRecord], str]:
+        records = []
+        version_dirs = CMakeRetrievalFlowBuilder.load_version_dirs()[:cls.CMAKE_VERSION_DIRS]
+        for version_dir, files in CMakeRetrievalFlowBuilder.load_files_concurrently(version_dirs).items():
+            records += CatalogNormalizers.cmake(CMakeRetrievalFlowBuilder.version_url(version_dir), files)
+        return records, CMAKE_BASE_URL
+
+    @staticmethod
+    def fetch_miniconda() -> Tuple[List[CatalogRecord], str]:
+        return CatalogNormalizers.miniconda(MinicondaRetrievalFlowBuilder.load_listing(), CONDA_PAGE_URL), CONDA_PAGE_URL
@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : catalog_store.py
+@Path : install/catalog
+@Author : Anfioo
+@Date : 2026/10/17 22:05
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
+from urllib.parse import urlsplit
+
+from install.catalog.catalog_record import ANY, ARCH_ALIASES, OS_ALIASES, CatalogRecord
+from loader.ini.cache_file_manager import CacheFileManager
+from wing_utils.common.version_utils import VersionUtils
+
+# 命令行里的工具别名
+TOOL_ALIASES = {
+    "jdk": "jdk", "java": "jdk",
+    "node": "node", "nodejs": "node", "npm": "node",
+    "go": "go", "golang": "go",
+    "maven": "maven", "mvn": "maven",
+    "cmake": "cmake",
+    "miniconda": "miniconda", "conda": "miniconda",
+}
+
+RECORD_COLUMNS = ("tool", "vendor", "version", "os", "arch", "kind", "url", "size", "checksum", "lts")
+# 写入 records 表的列 (与 _to_row 的顺序一致)
+ROW_COLUMNS = ("tool", "record_key", "url", "vendor", "version", "version_key", "os", "arch", "kind", "size",
+               "checksum", "lts", "prerelease")
+
+
+# 来自数据源的列，同步时据此判断记录是否变化
+SOURCE_COLUMNS = ("url", "vendor", "version", "os", "arch", "kind", "size", "checksum", "lts")
+
+
+@dataclass
+class CatalogDelta:
+    """一次同步对某个工具的改动"""
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        """同步后的记录数"""
+        return self.inserted + self.updated + self.unchanged
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    tool TEXT NOT NULL,
+    record_key TEXT NOT NULL,
+    url TEXT NOT NULL,
+    vendor TEXT NOT NULL,
+    version TEXT NOT NULL,
+    version_key TEXT NOT NULL,
+    os TEXT NOT NULL,
+    arch TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    size INTEGER,
+    checksum TEXT,
+    lts INTEGER NOT NULL DEFAULT 0,
+    prerelease INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (tool, record_key)
+);
+CREATE INDEX IF NOT EXISTS idx_records_platform ON records (tool, os, arch, version_key);
+CREATE TABLE IF NOT EXISTS sources (
+    tool TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL,
+    record_count INTEGER NOT NULL,
+    origin TEXT
+);
+"""
+
+
+class CatalogStore:
+    """
+    统一安装包目录的本地 SQLite 数据库 (缓存目录下的 catalog.sqlite3)
+
+    records 表每行一个 CatalogRecord，(tool, os, arch, version_key) 上建有索引，
+    "某工具在某平台上的版本" 这类查询只走索引，不读任何 feed；
+    sources 表记录每个工具最近一次刷新的时间与条数，供后台刷新判断是否过期。
+    使用 WAL 日志，后台刷新写入时查询不会被阻塞。
+    """
+
+    DB_FILE_NAME = "catalog.sqlite3"
+    # 表结构变化时递增，旧库直接重建 (目录可以随时从数据源重新生成)
+    SCHEMA_VERSION = 3
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """
+        :param db_path: 数据库路径，默认放在缓存目录下
+        """
+        self.db_path = Path(db_path) if db_path else CacheFileManager().get_cache_dir() / self.DB_FILE_NAME
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """每次操作单独连接 (sqlite 连接不能跨线程共享)，with 块结束时提交或回滚"""
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn:
+            with conn:
+                yield conn
+
+    def _init_schema(self):
+        with self._connect() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                conn.executescript("DROP TABLE IF EXISTS records; DROP TABLE IF EXISTS sources;")
+            conn.executescript(SCHEMA)
+            conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            conn.execute("PRAGMA journal_mode = WAL")
+
+    # =========================
+    # 写入
+    # =========================
+
+    def replace_tool(self, tool: str, records: Iterable[CatalogRecord], origin: Optional[str] = None) -> int:
+        """
+        用新数据整体替换某个工具的记录 (内部按差异同步，见 sync_tool)
+        :return: 替换后的条数
+        """
+        return self.sync_tool(tool, records, origin).total
+
+    def sync_tool(self, tool: str, records: Iterable[CatalogRecord], origin: Optional[str] = None) -> CatalogDelta:
+        """
+        把某个工具的记录同步为新数据：与库中上一次的数据按 CatalogRecord.key 比较，
+        只写入新增、变化的行并删除消失的行 (单个事务，查询方不会看到一半的数据)。
+        数据源每次只变动少数条目，排序键与 (tool, os, arch, version_key) 索引也只随这些行更新。
+        :param tool: 工具名
+        :param records: 规范化后的记录
+        :param origin: 数据来源地址 (展示用)
+        :return: 改动统计
+        """
+        # 同一数据源中重复的条目以最后一条为准
+        incoming = {record.key: record for record in records}
+        delta = CatalogDelta()
+        with self._connect() as conn:
+            # 只比较源字段；排序键等派生列只为新增 / 变化的行计算
+            previous = {row[0]: row[1:] for row in conn.execute(
+                f"SELECT record_key, {', '.join(SOURCE_COLUMNS)} FROM records WHERE tool = ?", (tool,))}
+            upserts = []
+            for key, record in incoming.items():
+                old = previous.pop(key, None)
+                if old is None:
+                    delta.inserted += 1
+                elif old != _source_of(record):
+                    delta.updated += 1
+                else:
+                    delta.unchanged += 1
+                    continue
+                upserts.append(_to_row(record))
+            delta.deleted = len(previous)
+            if previous:
+                conn.executemany("DELETE FROM records WHERE tool = ? AND record_key = ?",
+                                 [(tool, key) for key in previous])
+            if upserts:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO records ({', '.join(ROW_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(ROW_COLUMNS))})", upserts)
+            conn.execute("INSERT OR REPLACE INTO sources (tool, refreshed_at, record_count, origin) "
+                         "VALUES (?, ?, ?, ?)", (tool, time.time(), delta.total, origin))
+        return delta
+
+    # =========================
+    # 查询
+    # =========================
+
+    def search(self, tool: str, version: Optional[str] = None, os: Optional[str] = None,
+               arch: Optional[str] = None, kind: Optional[str] = None, vendor: Optional[str] = None,
+               lts: Optional[bool] = None, limit: Optional[int] = 20) -> List[CatalogRecord]:
+        """
+        查询记录，按版本从新到旧排列
+        :param tool: 工具名 (支持别名，例如 java / nodejs)
+        :param version: 版本规格 (VersionUtils.parse_spec)，例如 "20"、"17.0"、">=17 <22"、"lts latest"；
+                        latest 表示只要最新的一个正式版
+        :param os: 系统 (支持别名)；平台无关的包 (os 为 any) 总会匹配
+        :param arch: 架构 (支持别名)；平台无关的包总会匹配
+        :param kind: 包格式，例如 zip / tar.gz / msi
+        :param vendor: 发行方，忽略大小写的部分匹配
+        :param lts: True 只要 LTS 版本
+        :param limit: 最多返回的条数，None 表示不限
+        """
+        clauses, params = ["tool = ?"], [TOOL_ALIASES.get(tool.lower(), tool.lower())]
+        if os:
+            clauses.append("os IN (?, ?)")
+            params += [CatalogRecord.normalize_os(os), ANY]
+        if arch:
+            clauses.append("arch IN (?, ?)")
+            params += [CatalogRecord.normalize_arch(arch), ANY]
+        if version:
+            # 版本条件都是排序键上的区间，直接走 (tool, os, arch, version_key) 索引
+            spec = VersionUtils.parse_spec(version)
+            if spec.lower is not None:
+                clauses.append("version_key >= ?")
+                params.append(VersionUtils.encode(spec.lower))
+            if spec.upper is not None:
+                clauses.append("version_key < ?")
+                params.append(VersionUtils.encode(spec.upper))
+            for lo, hi in spec.excludes:
+                clauses.append("NOT (version_key >= ? AND version_key < ?)")
+                params += [VersionUtils.encode(lo), VersionUtils.encode(hi)]
+            if spec.lts:
+                lts = True
+            if spec.latest:
+                clauses.append("prerelease = 0")
+                limit = 1
+        if kind:
+            clauses.append("kind = ?")
+            params.append(kind.lower().lstrip("."))
+        if vendor:
+            clauses.append("vendor LIKE ? ESCAPE '\\'")
+            params.append(f"%{_escape_like(vendor)}%")
+        if lts is not None:
+            clauses.append("lts = ?")
+            params.append(int(lts))
+
+        sql = (f"SELECT {', '.join(RECORD_COLUMNS)} FROM records WHERE {' AND '.join(clauses)} "
+               f"ORDER BY version_key DESC, vendor, os, arch, kind")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as conn:
+            return [_from_row(row) for row in conn.execute(sql, params)]
+
+    def latest(self, tool: str, **filters) -> Optional[CatalogRecord]:
+        """最新的一条匹配记录，参数同 search"""
+        found = self.search(tool, limit=1, **filters)
+        return found[0] if found else None
+
+    def sources(self) -> Dict[str, Dict[str, Union[float, int, str]]]:
+        """各工具的刷新时间、条数与数据来源"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT tool, refreshed_at, record_count, origin FROM sources").fetchall()
+        return {tool: {"refreshed_at": at, "count": count, "origin": origin} for tool, at, count, origin in rows}
+
+    def hosts(self) -> Set[str]:
+        """目录中所有下载地址的主机名 (小写)"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT DISTINCT url FROM records").fetchall()
+        return {host.lower() for host in (urlsplit(url).hostname for url, in rows) if host}
+
+    def age(self, tool: str) -> Optional[float]:
+        """某工具距上次刷新的秒数，从未刷新时返回 None"""
+        source = self.sources().get(tool)
+        return time.time() - source["refreshed_at"] if source else None
+
+    @staticmethod
+    def parse_query(terms: Iterable[str]) -> Dict[str, str]:
+        """
+        解析命令行查询词：we search node 20 linux x64 / we search jdk ">=17 <22" lts linux aarch64 latest
+        系统、架构按别名识别，其余 (版本、比较条件、lts / latest) 合并为版本规格
+        :return: search 的参数 (os / arch / version)
+        """
+        query: Dict[str, str] = {}
+        spec = []
+        for term in terms:
+            word = term.lower()
+            if word in OS_ALIASES:
+                query["os"] = word
+            elif word in ARCH_ALIASES:
+                query["arch"] = word
+            else:
+                spec.append(term)
+        if spec:
+            query["version"] = " ".join(spec)
+        return query
+
+
+def _to_row(record: CatalogRecord) -> tuple:
+    return (record.tool, record.key, record.url, record.vendor, record.version, record.version_key, record.os,
+            record.arch, record.kind, record.size, record.checksum, int(record.lts), int(record.prerelease))
+
+
+def _source_of(record: CatalogRecord) -> tuple:
+    return (record.url, record.vendor, record.version, record.os, record.arch, record.kind, record.size,
+            record.checksum, int(record.lts))
+
+
+def _from_row(row: tuple) -> CatalogRecord:
+    record = CatalogRecord(*row)
+    record.lts = bool(record.lts)
+    return record
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
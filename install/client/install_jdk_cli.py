@@ -8,10 +8,13 @@ from install.client.ini.jdk_ini_manager import JdksManager
 from install.client.install_base_cli import BaseInstallCLIData
 
 from loader import DownloadsManager
+from loader.ini.bandwidth_manager import BandwidthManager
 from loader.ini.extract_manager import ExtractManager
+from loader.ini.mirror_proxy_manager import MirrorProxyManager
+from loader.ini.offline_bundle_manager import OfflineBundleManager
 from wing_ui.file_browser_ui import RichFileBrowser
 
-from wing_utils.extract import UniversalExtractor
+from wing_utils.extract import ToolchainRootUtils, UniversalExtractor
 from loader.ini.theme_manager import ThemeManager
 from wing_client import BaseCLI, BaseCommand
 from install.retrieval_flow_builder import JDKRetrievalFlowBuilder, Note
@@ -19,7 +22,8 @@ from loader import StyleLoader
 from wing_ui import WingUI
 from wing_ui.rich_wing_ui import RichWingUI
 from install import wing_dialog_selector
-from wing_utils.download.download_utils import DownloadUtils
+from wing_utils.download.async_download_engine import AsyncDownloadEngine
+from wing_utils.download.streaming_install_utils import StreamingInstallUtils
 from wing_utils.system import UserEnvRunner, EnvManager
 from wing_utils.system.env.path_env_utils import PathEnvUtils
 
@@ -95,6 +99,10 @@ class JdkCLI(BaseCLI[JdkCLIData]):
         try:
             downloads_dir = self.data.downloadsManager.get_current_downloads_dir() / self.data.env_manager.key.value
             extract_dir = self.data.extractManager.get_current_extract_dir() / self.data.env_manager.key.value
+            # 应用 [user] 中的限速、局域网镜像代理与离线包配置 (离线包最后应用，优先于代理)
+            BandwidthManager().apply()
+            MirrorProxyManager().apply()
+            OfflineBundleManager().apply()
 
             # 获取JDK信息
             jdk_result = (JDKRetrievalFlowBuilder.default(os="windows", arch="x86_64", selector=wing_dialog_selector)
@@ -143,26 +151,53 @@ class JdkCLI(BaseCLI[JdkCLIData]):
                     text=f"下载地址:{downloads_dir}\n你可以将下载的文件放入该文件夹中\n没有放入会导致安装失败")
                 self._print_message(f"请将JDK文件放入: {downloads_dir}", "warning")
 
-            saved_file_ok = DownloadUtils.download(url, str(downloads_dir))
-            self._print_message(f"✅ 下载完成: {saved_file_ok}", "success")
-
-            # 解压部分
-            self._print_message(f"开始解压JDK {version}...", "info")
-            extracted_path = self.data.universalExtractor.extract(str(saved_file_ok), f"{str(extract_dir)}/{version}")
-            self._print_message(f"✅ 提取完成，路径: {extracted_path}", "success")
-
-            # 选择真实的JDK路径
-            browser = RichFileBrowser(self.data.sl, extracted_path, "dir", title="请选择真实的Jdk路径",
-                                      select_regex=None,
-                                      regex_match_fullpath=False)
-            jdk_path = browser.run()
+            store = self.data.downloadsManager.get_blob_store()
+            # tar 包的条目名在解压时顺带收集，用于识别JDK根目录 (zip 直接读中央目录)
+            members = []
+            if StreamingInstallUtils.is_streamable(url):
+                # tar 包边下载边解压
+                self._print_message(f"开始下载并解压JDK {version}...", "info")
+                saved_file_ok, extracted_path = StreamingInstallUtils.download_and_extract(
+                    url, str(downloads_dir), f"{str(extract_dir)}/{version}",
+                    checksum=jdk_result.get("sha256"), store=store, names=members)
+                self._print_message(f"✅ 下载并提取完成，路径: {extracted_path}", "success")
+            else:
+                engine = AsyncDownloadEngine(store=store)
+                job = engine.submit(url, str(downloads_dir), checksum=jdk_result.get("sha256"))
+                engine.run()
+                if not job.ok:
+                    raise job.error
+                saved_file_ok = job.result
+                self._print_message(f"✅ 下载完成: {saved_file_ok}", "success")
+
+                # 解压部分
+                self._print_message(f"开始解压JDK {version}...", "info")
+                # 暂存解压后原子发布；同一压缩包已完整解压过时凭完成标记直接跳过
+                extracted_path = self.data.universalExtractor.extract(str(saved_file_ok),
+                                                                      f"{str(extract_dir)}/{version}",
+                                                                      digest=jdk_result.get("sha256"),
+                                                                      names=members)
+                if extracted_path is None:
+                    self._print_message(f"❌ 解压失败: {saved_file_ok}", "error")
+                    return
+                self._print_message(f"✅ 提取完成，路径: {extracted_path}", "success")
+
+            # 按压缩包条目识别真实的JDK路径 (release + bin/java)，识别不出或有歧义时再手动选择
+            jdk_path = ToolchainRootUtils.find_home(str(saved_file_ok), extracted_path, "jdk", names=members)
+            if jdk_path is not None:
+                self._print_message(f"✅ 已识别JDK路径: {jdk_path}", "success")
+            else:
+                browser = RichFileBrowser(self.data.sl, extracted_path, "dir", title="请选择真实的Jdk路径",
+                                          select_regex=None,
+                                          regex_match_fullpath=False)
+                jdk_path = browser.run()
 
-            # 确认JDK路径
-            confirm_path = self.data.wingUi.yes_no_ui(f"是否确认Jdk是该文件夹路径", f"Jdk路径{jdk_path}")
+                # 确认JDK路径
+                confirm_path = self.data.wingUi.yes_no_ui(f"是否确认Jdk是该文件夹路径", f"Jdk路径{jdk_path}")
 
-            if not confirm_path:
-                self._print_message("❌ 安装已取消", "error")
-                return
+                if not confirm_path:
+                    self._print_message("❌ 安装已取消", "error")
+                    return
 
             # 初始化环境变量
             if not self.do_init():
@@ -7,7 +7,7 @@ from install import wing_dialog_selector
 print("\n" + "=" * 40)
 print("[场景 2] NPM 构建者模式")
 npm_result = (NPMRetrievalFlowBuilder.default(selector=wing_dialog_selector)
-              .mirror().deal(default=Select.Option("阿里镜像 (npmmirror)"))
+              .mirror(auto=True).deal(default=Select.First)
               .select_ui()
               .fetch_data()
               .version().deal(note=[Note("LTS", "recommend")])
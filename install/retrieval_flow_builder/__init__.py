@@ -15,6 +15,7 @@
 from .base_builder import BaseRetrievalFlowBuilder, Block, Select, Note
 from .cmake_flow_builder import CMakeRetrievalFlowBuilder
 from .go_flow_builder import GoRetrievalFlowBuilder
+from .jdk_catalog import JdkCatalog
 from .jdk_flow_builder import JDKRetrievalFlowBuilder
 from .maven_flow_builder import MavenRetrievalFlowBuilder
 from .miniconda_flow_builder import MinicondaRetrievalFlowBuilder
@@ -22,4 +23,5 @@ from .npm_flow_builder import NPMRetrievalFlowBuilder
 
 __all__ = ["BaseRetrievalFlowBuilder", "Block", "Select", "Note", "CMakeRetrievalFlowBuilder",
            "JDKRetrievalFlowBuilder", "MavenRetrievalFlowBuilder",
-           "MinicondaRetrievalFlowBuilder", "NPMRetrievalFlowBuilder", "GoRetrievalFlowBuilder"]
+           "MinicondaRetrievalFlowBuilder", "NPMRetrievalFlowBuilder", "GoRetrievalFlowBuilder",
+           "JdkCatalog"]
@@ -1,6 +1,8 @@
 from typing import List, Any, Callable, Optional, Dict, Union, Self
 import re
 
+from wing_utils.common.version_utils import VersionUtils
+
 class Select:
     class First: pass
     class End: pass
@@ -15,6 +17,14 @@ class Select:
         """使用自定义函数从选项列表中查找默认值"""
         return ("find", function)
 
+    @staticmethod
+    def Version(spec: str, is_lts: Callable[[str], bool] = None) -> tuple[str, Callable]:
+        """
+        按版本规格选择满足条件的最新版本，例如 ">=17 <22"、"20 lts"、"latest"
+        :param is_lts: 判断 LTS 的函数 (参数为选项文本)，默认看选项中是否带 LTS 标注
+        """
+        return Select.Find(VersionUtils.finder(spec, is_lts))
+
 class Block:
     class First: pass
     
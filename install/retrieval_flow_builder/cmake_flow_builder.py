@@ -1,9 +1,12 @@
-from typing import Any, Callable, Optional, Dict, Self
-import requests
+from typing import Any, Callable, Optional, Dict, List, Self
 import re
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 
 from install.retrieval_flow_builder import BaseRetrievalFlowBuilder
+from loader.ini.cache_file_manager import CacheFileManager
+from wing_utils.common.html_listing_utils import HtmlListingUtils
+from wing_utils.common.version_utils import VersionUtils
+from wing_utils.download.rate_limit_utils import BandwidthScheduler
 
 # CMake 官方归档根目录
 CMAKE_BASE_URL = "https://cmake.org/files/"
@@ -12,6 +15,10 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 }
 
+CMAKE_CACHE_FILE_NAME = "cmake_files.html"
+# 缓存有效期 (秒)，过期后条件请求重新验证
+CMAKE_CACHE_TTL = 24 * 60 * 60
+
 
 class CMakeRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
     @classmethod
@@ -30,25 +37,98 @@ class CMakeRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
         """
         if self._is_interrupted: return self
         try:
-            r = requests.get(CMAKE_BASE_URL, headers=HEADERS, timeout=10)
-            r.raise_for_status()
-            soup = BeautifulSoup(r.text, 'html.parser')
-            
-            # 提取所有以 'v' 开头的文件夹链接
-            v_dirs = []
-            for a in soup.find_all('a'):
-                href = a.get('href', '')
-                if re.match(r'^v\d+\.\d+/?$', href):
-                    v_dirs.append(href.strip('/'))
-            
-            # 排序：让最新的版本在前面
-            v_dirs.sort(key=lambda x: [int(d) for d in re.findall(r'\d+', x)], reverse=True)
-            self._raw_data = v_dirs
+            self._raw_data = self.load_version_dirs(stale_while_revalidate=True)
         except Exception as e:
             print(f"❌ 访问主目录失败: {e}")
             self._is_interrupted = True
         return self
 
+    @classmethod
+    def load_version_dirs(cls, ttl: float = CMAKE_CACHE_TTL, stale_while_revalidate: bool = False) -> List[str]:
+        """
+        经缓存获取主目录并解析出版本文件夹
+        :param ttl: 缓存有效期 (秒)，为 0 时总是重新验证
+        :param stale_while_revalidate: 缓存过期时先用旧数据，后台更新
+        """
+        html = CacheFileManager().fetch_text(CMAKE_CACHE_FILE_NAME, CMAKE_BASE_URL, ttl=ttl, headers=HEADERS,
+                                             stale_while_revalidate=stale_while_revalidate)
+        return cls.parse_version_dirs(html)
+
+    @classmethod
+    def load_files(cls, version_dir: str, ttl: float = CMAKE_CACHE_TTL,
+                   stale_while_revalidate: bool = False) -> List[Dict[str, str]]:
+        """
+        经缓存获取版本目录并解析出安装包
+        :param version_dir: 版本文件夹名，例如 v3.28
+        """
+        html = CacheFileManager().fetch_text(cls.version_cache_file_name(version_dir), cls.version_url(version_dir),
+                                             ttl=ttl, headers=HEADERS, stale_while_revalidate=stale_while_revalidate)
+        return cls.parse_files(html)
+
+    @classmethod
+    def load_files_concurrently(cls, version_dirs: List[str], ttl: float = CMAKE_CACHE_TTL,
+                                max_workers: int = 4) -> Dict[str, List[Dict[str, str]]]:
+        """
+        并发获取多个版本目录 (每个目录一次请求，互不依赖)
+        :param version_dirs: 版本文件夹名列表
+        :param max_workers: 同时进行的请求数
+        :return: {版本文件夹名: 安装包列表}，顺序与 version_dirs 一致；任一目录失败时抛出它的异常
+        """
+        if not version_dirs:
+            return {}
+        # 工作线程沿用调用方的下载优先级
+        priority = BandwidthScheduler.current_priority()
+
+        def load(version_dir: str):
+            with BandwidthScheduler.priority_scope(priority):
+                return cls.load_files(version_dir, ttl=ttl)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(version_dirs)),
+                                thread_name_prefix="cmake-crawl") as pool:
+            results = pool.map(load, version_dirs)
+            return dict(zip(version_dirs, results))
+
+    @staticmethod
+    def version_url(version_dir: str) -> str:
+        return f"{CMAKE_BASE_URL}{version_dir}/"
+
+    @staticmethod
+    def version_cache_file_name(version_dir: str) -> str:
+        return f"cmake_files_{version_dir}.html"
+
+    @staticmethod
+    def parse_version_dirs(html: str) -> List[str]:
+        """
+        解析主目录页面中的版本文件夹
+        :param html: 目录页面
+        :return: 版本文件夹名 (v3.0, v3.1...)，最新的在前
+        """
+        # 提取所有以 'v' 开头的文件夹链接
+        v_dirs = []
+        for row in HtmlListingUtils.parse(html):
+            if re.match(r'^v\d+\.\d+/?$', row.href):
+                v_dirs.append(row.href.strip('/'))
+
+        # 排序：让最新的版本在前面
+        return VersionUtils.sort(v_dirs)
+
+    @staticmethod
+    def parse_files(html: str) -> List[Dict[str, str]]:
+        """
+        解析版本目录页面中的安装包
+        :param html: 目录页面
+        :return: [{"name": 文件名, "size": 大小}]
+        """
+        files_info = []
+        for row in HtmlListingUtils.parse(html):
+            filename = row.name
+            if filename in ["Parent Directory", "Name", "Last modified", "Size", "Description"] or "/" in filename:
+                continue
+            if filename.endswith(('.sha256', '.asc', '.md5')):
+                continue
+            files_info.append({"name": filename, "size": row.size or "N/A"})
+        return files_info
+
     def version_dir(self) -> Self:
         """
         选择 CMake 主版本目录
@@ -69,28 +149,11 @@ class CMakeRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
         
         target_dir = self._selected_value
         self._metadata["version_dir"] = target_dir
-        version_url = f"{CMAKE_BASE_URL}{target_dir}/"
+        version_url = self.version_url(target_dir)
         self._metadata["version_url"] = version_url
         
         try:
-            r = requests.get(version_url, headers=HEADERS, timeout=10)
-            r.raise_for_status()
-            soup = BeautifulSoup(r.text, 'html.parser')
-            
-            files_info = []
-            for tr in soup.find_all('tr'):
-                tds = tr.find_all('td')
-                a_tag = tr.find('a')
-                if a_tag:
-                    filename = a_tag.text.strip()
-                    if filename in ["Parent Directory", "Name", "Last modified", "Size", "Description"] or "/" in filename:
-                        continue
-                    if filename.endswith(('.sha256', '.asc', '.md5')):
-                        continue
-                    size = tds[3].text.strip() if len(tds) >= 4 else "N/A"
-                    files_info.append({"name": filename, "size": size})
-            
-            self._files_info = files_info
+            self._files_info = self.load_files(target_dir, stale_while_revalidate=True)
         except Exception as e:
             print(f"❌ 访问版本目录失败: {e}")
             self._is_interrupted = True
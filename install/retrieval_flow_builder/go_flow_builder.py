@@ -1,5 +1,4 @@
-from typing import Any, Callable, Optional, Dict, Self
-import requests
+from typing import Any, Callable, Optional, Dict, List, Self
 
 from install.retrieval_flow_builder import BaseRetrievalFlowBuilder
 from loader.ini.cache_file_manager import CacheFileManager
@@ -12,6 +11,8 @@ HEADERS = {
 }
 
 GO_CACHE_FILE_NAME = "go.json"
+# 缓存有效期 (秒)，过期后条件请求重新验证；界面先使用旧数据，不等待网络
+GO_CACHE_TTL = 6 * 60 * 60
 
 
 class GoRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
@@ -31,21 +32,22 @@ class GoRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
         """
         if self._is_interrupted: return self
         try:
-            cache_manager = CacheFileManager()
-
-            if cache_manager.cache_exists(GO_CACHE_FILE_NAME):
-                cache_content = cache_manager.get_cache_to_json(GO_CACHE_FILE_NAME)
-                self._raw_data = cache_content
-            else:
-                r = requests.get(GO_API_URL, headers=HEADERS, timeout=10)
-                r.raise_for_status()
-                self._raw_data = r.json()
-                cache_manager.set_cache_from_json(GO_CACHE_FILE_NAME, r.json())
+            self._raw_data = self.load_feed(stale_while_revalidate=True)
         except Exception as e:
             print(f"❌ 获取 Go 数据失败: {e}")
             self._is_interrupted = True
         return self
 
+    @staticmethod
+    def load_feed(ttl: float = GO_CACHE_TTL, stale_while_revalidate: bool = False) -> List[Dict[str, Any]]:
+        """
+        经缓存获取 Go 版本数据
+        :param ttl: 缓存有效期 (秒)，为 0 时总是重新验证
+        :param stale_while_revalidate: 缓存过期时先用旧数据，后台更新
+        """
+        return CacheFileManager().fetch_json(GO_CACHE_FILE_NAME, GO_API_URL, ttl=ttl, headers=HEADERS,
+                                             stale_while_revalidate=stale_while_revalidate)
+
     def version(self) -> Self:
         """
         准备待选的 Go 版本列表
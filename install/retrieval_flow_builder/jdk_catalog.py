@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : jdk_catalog.py
+@Path : install/retrieval_flow_builder
+@Author : Anfioo
+@Date : 2026/10/17 21:00
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+from typing import Any, Dict, List, Optional
+
+from loader.ini.cache_file_manager import CacheFileManager
+from wing_utils.common.version_utils import VersionUtils
+
+JDK_FEED_URL = "https://download.jetbrains.com/jdk/feed/v1/jdks.json"
+
+JDK_CACHE_FILE_NAME = "jdks.json"
+# 缓存有效期 (秒)，过期后条件请求重新验证；界面先使用旧数据，不等待网络
+JDK_CACHE_TTL = 6 * 60 * 60
+# 索引快照的结构版本，build_index 的输出变化时递增
+JDK_SNAPSHOT_VERSION = 3
+
+# 构建流程需要的包字段
+PACKAGE_KEYS = ("archive_file_name", "sha256", "url")
+
+
+class JdkCatalog:
+    """
+    JetBrains JDK feed 的查询索引，随 feed 一次性构建并作为快照缓存：
+    (os, arch) -> 厂商列表
+    (os, arch, vendor) -> 版本列表 (从新到旧)
+    (vendor, version, os, arch) -> 安装包
+    构建流程的每一步以及脚本化安装都只需字典查找，不再遍历整个 feed。
+    """
+
+    def __init__(self, index: Dict[str, Dict]):
+        self._vendors = index.get("vendors", {})
+        self._versions = index.get("versions", {})
+        self._packages = index.get("packages", {})
+
+    def __len__(self) -> int:
+        return len(self._packages)
+
+    @classmethod
+    def load(cls, stale_while_revalidate: bool = True, ttl: float = JDK_CACHE_TTL) -> "JdkCatalog":
+        """
+        从缓存载入索引 (必要时下载或重新验证 feed)
+        :param stale_while_revalidate: 缓存过期时先用旧索引，后台更新
+        :param ttl: feed 缓存有效期 (秒)，为 0 时总是重新验证
+        """
+        index = CacheFileManager().fetch_json(JDK_CACHE_FILE_NAME, JDK_FEED_URL, ttl=ttl,
+                                              stale_while_revalidate=stale_while_revalidate,
+                                              derive=cls.build_index, derive_version=JDK_SNAPSHOT_VERSION)
+        return cls(index)
+
+    @classmethod
+    def from_feed(cls, feed: Dict[str, Any]) -> "JdkCatalog":
+        return cls(cls.build_index(feed))
+
+    @staticmethod
+    def build_index(feed: Dict[str, Any]) -> Dict[str, Dict]:
+        """
+        遍历一次 feed 构建索引 (结果只含基础类型，可用 marshal 持久化)
+        :param feed: jdks.json 的完整内容
+        """
+        vendors: Dict[tuple, set] = {}
+        versions: Dict[tuple, set] = {}
+        packages: Dict[tuple, Dict] = {}
+        for jdk in feed.get("jdks", []):
+            vendor = jdk.get("vendor")
+            version = jdk.get("jdk_version")
+            if not vendor or not version:
+                continue
+            for pkg in jdk.get("packages", []):
+                os, arch = pkg.get("os"), pkg.get("arch")
+                key = (vendor, version, os, arch)
+                # 同一组合出现多次时保留第一个，与原先逐个遍历的结果一致
+                if key in packages:
+                    continue
+                vendors.setdefault((os, arch), set()).add(vendor)
+                versions.setdefault((os, arch, vendor), set()).add(version)
+                packages[key] = {"product": jdk.get("product"), **{k: pkg.get(k) for k in PACKAGE_KEYS}}
+        return {
+            "vendors": {k: sorted(v) for k, v in vendors.items()},
+            "versions": {k: VersionUtils.sort(v) for k, v in versions.items()},
+            "packages": packages,
+        }
+
+    def vendors(self, os: str, arch: str) -> List[str]:
+        """当前平台可选的厂商"""
+        return list(self._vendors.get((os, arch), []))
+
+    def versions(self, os: str, arch: str, vendor: str) -> List[str]:
+        """某厂商在当前平台的版本，从新到旧"""
+        return list(self._versions.get((os, arch, vendor), []))
+
+    def package(self, vendor: str, version: str, os: str, arch: str) -> Optional[Dict[str, Any]]:
+        """
+        查找安装包
+        :return: {"product", "archive_file_name", "sha256", "url"}，不存在时返回 None
+        """
+        pkg = self._packages.get((vendor, version, os, arch))
+        return dict(pkg) if pkg else None
+
+    def find(self, os: str, arch: str, vendor: Optional[str] = None,
+             version_spec: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        脚本化安装用：不经过 UI 直接找到最新的匹配包
+        :param vendor: 厂商，None 表示所有厂商中版本最新的
+        :param version_spec: 版本规格，例如 "21"、"17.0"、">=17 <22"、"lts latest"
+        :return: 安装包字典 (额外包含 vendor / version)，找不到时返回 None
+        """
+        spec = VersionUtils.parse_spec(version_spec) if version_spec else None
+        candidates = []
+        for v in ([vendor] if vendor else self.vendors(os, arch)):
+            # 版本列表已按新旧排好，第一个匹配的就是该厂商最新的
+            for version in self.versions(os, arch, v):
+                if spec and not spec.matches(version, VersionUtils.is_java_lts):
+                    continue
+                candidates.append((v, version))
+                break
+        if not candidates:
+            return None
+        best_vendor, best_version = max(candidates, key=lambda c: VersionUtils.key(c[1]))
+        return {"vendor": best_vendor, "version": best_version,
+                **self.package(best_vendor, best_version, os, arch)}
+
@@ -1,12 +1,7 @@
 from typing import Any, Callable, Optional, Dict, Self
-import requests
 
 from install.retrieval_flow_builder import BaseRetrievalFlowBuilder
-from loader.ini.cache_file_manager import CacheFileManager
-
-JDK_FEED_URL = "https://download.jetbrains.com/jdk/feed/v1/jdks.json"
-
-JDK_CACHE_FILE_NAME = "jdks.json"
+from install.retrieval_flow_builder.jdk_catalog import JdkCatalog, JDK_FEED_URL, JDK_CACHE_FILE_NAME, JDK_CACHE_TTL
 
 
 class JDKRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
@@ -26,21 +21,12 @@ class JDKRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
 
     def fetch_data(self) -> Self:
         """
-        异步/手动触发网络请求，获取 JDK 数据
+        异步/手动触发网络请求，获取 JDK 数据 (载入按平台/厂商/版本建好的索引)
         :return: Self
         """
         if self._is_interrupted: return self
         try:
-            cache_manager = CacheFileManager()
-
-            if cache_manager.cache_exists(JDK_CACHE_FILE_NAME):
-                cache_content = cache_manager.get_cache_to_json(JDK_CACHE_FILE_NAME)
-                self._raw_data = cache_content.get("jdks", [])
-            else:
-                r = requests.get(JDK_FEED_URL, timeout=10)
-                r.raise_for_status()
-                self._raw_data = r.json().get("jdks", [])
-                cache_manager.set_cache_from_json(JDK_CACHE_FILE_NAME, r.json())
+            self._raw_data = JdkCatalog.load()
         except Exception:
             self._is_interrupted = True
         return self
@@ -62,17 +48,11 @@ class JDKRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
         """
         if self._is_interrupted or not self._raw_data: return self
 
-        # 过滤当前 OS/Arch 下可选的厂商
+        # 当前 OS/Arch 下可选的厂商
         os = self._metadata.get("os")
         arch = self._metadata.get("arch")
 
-        vendors = set()
-        for jdk in self._raw_data:
-            for pkg in jdk.get("packages", []):
-                if pkg["os"] == os and pkg["arch"] == arch:
-                    vendors.add(jdk["vendor"])
-
-        self._current_options = sorted(list(vendors))
+        self._current_options = self._raw_data.vendors(os, arch)
         self._last_prompt = "选择 JDK 厂商"
         return self
 
@@ -83,21 +63,14 @@ class JDKRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
         """
         if self._is_interrupted or not self._raw_data: return self
 
-        # 过滤当前厂商下的版本
+        # 当前厂商下的版本 (从新到旧)
         vendor = self._selected_value
         self._metadata["vendor"] = vendor
 
         os = self._metadata.get("os")
         arch = self._metadata.get("arch")
 
-        versions = set()
-        for jdk in self._raw_data:
-            if jdk["vendor"] == vendor:
-                for pkg in jdk.get("packages", []):
-                    if pkg["os"] == os and pkg["arch"] == arch:
-                        versions.add(jdk["jdk_version"])
-
-        self._current_options = sorted(list(versions), reverse=True)
+        self._current_options = self._raw_data.versions(os, arch, vendor)
         self._last_prompt = f"选择 {vendor} 的版本"
         return self
 
@@ -115,16 +88,14 @@ class JDKRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
         os = self._metadata.get("os")
         arch = self._metadata.get("arch")
 
-        for jdk in self._raw_data:
-            if jdk["vendor"] == vendor and jdk["jdk_version"] == version:
-                for pkg in jdk.get("packages", []):
-                    if pkg["os"] == os and pkg["arch"] == arch:
-                        self._metadata.update({
-                            "product": jdk.get("product"),
-                            "filename": pkg["archive_file_name"],
-                            "url": pkg["url"]
-                        })
-                        return self._metadata
+        pkg = self._raw_data.package(vendor, version, os, arch)
+        if pkg:
+            self._metadata.update({
+                "product": pkg.get("product"),
+                "filename": pkg["archive_file_name"],
+                "sha256": pkg.get("sha256"),
+                "url": pkg["url"]
+            })
         return self._metadata
 
 
@@ -1,9 +1,9 @@
-from typing import Any, Callable, Optional, Dict, Self
-import requests
+from typing import Any, Callable, Optional, Dict, List, Self
 import xml.etree.ElementTree as ET
 
 from install.retrieval_flow_builder import BaseRetrievalFlowBuilder
 from loader.ini.cache_file_manager import CacheFileManager
+from wing_utils.common.version_utils import VersionUtils
 
 # Maven 元数据地址 (阿里云镜像，同步快且稳定)
 MAVEN_METADATA_URL = "https://maven.aliyun.com/repository/public/org/apache/maven/apache-maven/maven-metadata.xml"
@@ -18,7 +18,8 @@ HEADERS = {
 }
 
 MAVEN_CACHE_FILE_NAME = "maven-metadata.xml"
-
+# 缓存有效期 (秒)，过期后条件请求重新验证
+MAVEN_CACHE_TTL = 24 * 60 * 60
 
 
 class MavenRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
@@ -38,27 +39,34 @@ class MavenRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
         """
         if self._is_interrupted: return self
         try:
-            cache_manager = CacheFileManager()
-            
-            if cache_manager.cache_exists(MAVEN_CACHE_FILE_NAME):
-                cached_content = cache_manager.get_cache(MAVEN_CACHE_FILE_NAME)
-                root = ET.fromstring(cached_content)
-                versions = [v.text for v in root.findall(".//version")]
-                self._raw_data = sorted(versions, reverse=True)
-            else:
-                r = requests.get(MAVEN_METADATA_URL, headers=HEADERS, timeout=10)
-                r.raise_for_status()
-                
-                cache_manager.set_cache(MAVEN_CACHE_FILE_NAME, r.text)
-                
-                root = ET.fromstring(r.text)
-                versions = [v.text for v in root.findall(".//version")]
-                self._raw_data = sorted(versions, reverse=True)
+            self._raw_data = self.load_versions(stale_while_revalidate=True)
         except Exception as e:
             print(f"❌ 获取 Maven 数据失败: {e}")
             self._is_interrupted = True
         return self
 
+    @classmethod
+    def load_versions(cls, ttl: float = MAVEN_CACHE_TTL, stale_while_revalidate: bool = False) -> List[str]:
+        """
+        经缓存获取 Maven 版本列表
+        :param ttl: 缓存有效期 (秒)，为 0 时总是重新验证
+        :param stale_while_revalidate: 缓存过期时先用旧数据，后台更新
+        :return: 版本列表 (倒序)
+        """
+        xml_text = CacheFileManager().fetch_text(MAVEN_CACHE_FILE_NAME, MAVEN_METADATA_URL, ttl=ttl, headers=HEADERS,
+                                                 stale_while_revalidate=stale_while_revalidate)
+        return cls.parse_versions(xml_text)
+
+    @staticmethod
+    def parse_versions(xml_text: str) -> List[str]:
+        """
+        从 maven-metadata.xml 中解析版本列表
+        :param xml_text: 元数据内容
+        :return: 版本列表 (从新到旧，按数字比较：3.9.10 在 3.9.9 之前)
+        """
+        root = ET.fromstring(xml_text)
+        return VersionUtils.sort(v.text for v in root.findall(".//version"))
+
     def version(self) -> Self:
         """
         准备待选的 Maven 版本列表
@@ -1,8 +1,8 @@
-from typing import Any, Callable, Optional, Dict, Self
-import requests
-from bs4 import BeautifulSoup
+from typing import Any, Callable, Optional, Dict, List, Self
 
 from install.retrieval_flow_builder import BaseRetrievalFlowBuilder
+from loader.ini.cache_file_manager import CacheFileManager
+from wing_utils.common.html_listing_utils import HtmlListingUtils
 
 # Miniconda 目录地址
 CONDA_PAGE_URL = "https://repo.anaconda.com/miniconda/"
@@ -11,6 +11,10 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 }
 
+CONDA_CACHE_FILE_NAME = "miniconda.html"
+# 缓存有效期 (秒)，过期后条件请求重新验证
+CONDA_CACHE_TTL = 24 * 60 * 60
+
 
 class MinicondaRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
     @classmethod
@@ -29,32 +33,43 @@ class MinicondaRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
         """
         if self._is_interrupted: return self
         try:
-            r = requests.get(CONDA_PAGE_URL, headers=HEADERS, timeout=15)
-            r.raise_for_status()
-
-            soup = BeautifulSoup(r.text, 'html.parser')
-            rows = soup.find_all('tr')
-
-            file_list = []
-            for row in rows:
-                tds = row.find_all('td')
-                if len(tds) >= 4:
-                    a_tag = tds[0].find('a')
-                    if a_tag:
-                        filename = a_tag.text.strip()
-                        if "-latest-" in filename:
-                            file_list.append({
-                                "filename": filename,
-                                "size": tds[1].text.strip(),
-                                "date": tds[2].text.strip(),
-                                "sha256": tds[3].text.strip()
-                            })
-            self._raw_data = file_list
+            listing = self.load_listing(stale_while_revalidate=True)
+            self._raw_data = [f for f in listing if "-latest-" in f["filename"]]
         except Exception as e:
             print(f"❌ 获取 Miniconda 数据失败: {e}")
             self._is_interrupted = True
         return self
 
+    @classmethod
+    def load_listing(cls, ttl: float = CONDA_CACHE_TTL, stale_while_revalidate: bool = False) -> List[Dict[str, str]]:
+        """
+        经缓存获取 Miniconda 目录页面并解析
+        :param ttl: 缓存有效期 (秒)，为 0 时总是重新验证
+        :param stale_while_revalidate: 缓存过期时先用旧数据，后台更新
+        """
+        html = CacheFileManager().fetch_text(CONDA_CACHE_FILE_NAME, CONDA_PAGE_URL, ttl=ttl, headers=HEADERS,
+                                             timeout=15, stale_while_revalidate=stale_while_revalidate)
+        return cls.parse_listing(html)
+
+    @staticmethod
+    def parse_listing(html: str) -> List[Dict[str, str]]:
+        """
+        解析 Miniconda 目录页面中的全部安装包
+        :param html: 目录页面
+        :return: [{"filename", "size", "date", "sha256"}]
+        """
+        file_list = []
+        for row in HtmlListingUtils.parse(html):
+            # 文件名、大小、修改时间、sha256 四列
+            if len(row.cells) >= 4:
+                file_list.append({
+                    "filename": row.name,
+                    "size": row.size or row.cells[1],
+                    "date": row.date or row.cells[2],
+                    "sha256": row.checksum or row.cells[3]
+                })
+        return file_list
+
     def os(self) -> Self:
         """
         选择操作系统 (OS)
@@ -1,7 +1,9 @@
-from typing import Any, Callable, Optional, Dict, Self
-import requests
+from typing import Any, Callable, Optional, Dict, List, Self
+from urllib.parse import urlsplit
 
 from install.retrieval_flow_builder import BaseRetrievalFlowBuilder
+from loader.ini.cache_file_manager import CacheFileManager
+from wing_utils.download.mirror_race_utils import MirrorRaceUtils
 
 # 镜像源字典
 MIRRORS = {
@@ -17,6 +19,11 @@ HEADERS = {
     "Connection": "keep-alive"
 }
 
+MIRROR_RANK_CACHE_FILE_NAME = "node_mirror_rank.json"
+MIRROR_RANK_TTL = 6 * 60 * 60
+# index.json 按镜像分别缓存，有效期 (秒) 过后条件请求重新验证
+NODE_INDEX_CACHE_TTL = 6 * 60 * 60
+
 class NPMRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
     @classmethod
     def default(cls, selector: Callable = None) -> Self:
@@ -27,36 +34,80 @@ class NPMRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
         """
         return cls(selector=selector)
 
-    def mirror(self) -> Self:
+    def mirror(self, auto: bool = False, ttl: int = MIRROR_RANK_TTL) -> Self:
         """
         准备待选的镜像源列表
+        :param auto: 为 True 时并发测速，镜像按从快到慢排列 (配合 Select.First 即自动选最快的)
+        :param ttl: 测速结果的缓存有效期 (秒)
         :return: Self
         """
         if self._is_interrupted: return self
-        self._current_options = list(MIRRORS.keys())
+        ranking = self._rank_mirrors(ttl) if auto else list(MIRRORS.keys())
+        self._metadata["mirror_ranking"] = ranking
+        self._current_options = ranking
         self._last_prompt = "选择 Node.js 下载源"
         return self
 
+    @staticmethod
+    def _rank_mirrors(ttl: int) -> List[str]:
+        """
+        获取镜像测速排名，优先使用未过期的缓存
+        :param ttl: 缓存有效期 (秒)
+        :return: 从快到慢排列的镜像名
+        """
+        cache_manager = CacheFileManager()
+        cached = cache_manager.get_cache_to_json_if_fresh(MIRROR_RANK_CACHE_FILE_NAME, ttl)
+        if cached and sorted(cached.get("ranking", [])) == sorted(MIRRORS):
+            return cached["ranking"]
+
+        scores = MirrorRaceUtils.race(MIRRORS, probe_path="index.json")
+        ranking = [score.name for score in scores]
+        cache_manager.set_cache_from_json(MIRROR_RANK_CACHE_FILE_NAME, {
+            "ranking": ranking,
+            "scores": [score.to_dict() for score in scores]
+        })
+        return ranking
+
     def fetch_data(self) -> Self:
         """
         手动触发网络请求，获取 Node.js 版本数据
         :return: Self
         """
         if self._is_interrupted: return self
-        mirror_name = self._selected_value
-        self._metadata["mirror"] = mirror_name
-        base_url = MIRRORS[mirror_name]
-        self._metadata["base_url"] = base_url
-
-        try:
-            index_url = f"{base_url}/index.json"
-            r = requests.get(index_url, headers=HEADERS, timeout=10)
-            r.raise_for_status()
-            self._raw_data = r.json()
-        except Exception:
-            self._is_interrupted = True
+        # 选中的镜像失败时按排名顺延到其他镜像
+        ranking = self._metadata.get("mirror_ranking") or list(MIRRORS.keys())
+        candidates = [self._selected_value] + [name for name in ranking if name != self._selected_value]
+
+        for mirror_name in candidates:
+            base_url = MIRRORS[mirror_name]
+            try:
+                self._raw_data = self.load_index(base_url, stale_while_revalidate=True)
+            except Exception:
+                continue
+            self._metadata["mirror"] = mirror_name
+            self._metadata["base_url"] = base_url
+            return self
+
+        self._is_interrupted = True
         return self
 
+    @classmethod
+    def load_index(cls, base_url: str, ttl: float = NODE_INDEX_CACHE_TTL,
+                   stale_while_revalidate: bool = False) -> List[Dict[str, Any]]:
+        """
+        经缓存获取某个镜像的 index.json
+        :param base_url: 镜像根地址
+        :param ttl: 缓存有效期 (秒)，为 0 时总是重新验证
+        :param stale_while_revalidate: 缓存过期时先用旧数据，后台更新
+        """
+        return CacheFileManager().fetch_json(cls.index_cache_file_name(base_url), f"{base_url}/index.json", ttl=ttl,
+                                             headers=HEADERS, stale_while_revalidate=stale_while_revalidate)
+
+    @staticmethod
+    def index_cache_file_name(base_url: str) -> str:
+        """每个镜像一个缓存文件，例如 node_index_npmmirror.com.json"""
+        return f"node_index_{urlsplit(base_url).netloc}.json"
+
     def version(self) -> Self:
         """
         准备待选的 Node.js 版本列表
@@ -113,16 +164,22 @@ class NPMRetrievalFlowBuilder(BaseRetrievalFlowBuilder):
         version = self._metadata["version"]
         
         # 解析下载地址
-        filename, url = self._parse_download_url(base_url, version, target_arch)
-        
+        filename, url = self.parse_download_url(base_url, version, target_arch)
+        # 其他镜像上的同一文件，下载失败时作为备用地址
+        ranking = self._metadata.get("mirror_ranking") or list(MIRRORS.keys())
+        mirrors = [self.parse_download_url(MIRRORS[name], version, target_arch)[1]
+                   for name in ranking if MIRRORS[name] != base_url]
+
         self._metadata.update({
             "arch": target_arch,
             "filename": filename,
-            "url": url
+            "url": url,
+            "mirrors": mirrors
         })
         return self._metadata
 
-    def _parse_download_url(self, base_url: str, version: str, file_type: str) -> tuple[str, str]:
+    @staticmethod
+    def parse_download_url(base_url: str, version: str, file_type: str) -> tuple[str, str]:
         """
         解析 Node.js 下载链接
         :param base_url: 镜像基础地址
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : bandwidth_manager.py
+@Path : loader/ini
+@Author : Anfioo
+@Date : 2026/10/17 18:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+from typing import Dict, Optional
+
+from wing_utils import IniConfigUtils
+from wing_utils.download.rate_limit_utils import BandwidthScheduler
+
+
+class BandwidthManager:
+    """
+    下载限速配置，保存在 [user] 中：
+    bandwidth_limit = 10M
+    bandwidth_host_limits = mirrors.tuna.tsinghua.edu.cn=2M,download.oracle.com=5M
+    """
+
+    def __init__(self):
+        self.config = IniConfigUtils()
+        self.section_user = "user"
+        self.section_limit_key = "bandwidth_limit"
+        self.section_host_limits_key = "bandwidth_host_limits"
+
+    def get_global_limit(self) -> Optional[str]:
+        """获取全局限速 (原始配置文本)，未配置时返回 None"""
+        return self.config.get(self.section_user, self.section_limit_key) or None
+
+    def set_global_limit(self, rate: Optional[str]):
+        """设置全局限速，例如 "10M"；传入空值取消限速"""
+        if not rate:
+            self.config.delete(self.section_user, self.section_limit_key)
+            return
+        BandwidthScheduler.parse_rate(rate)
+        self.config.set(self.section_user, self.section_limit_key, rate)
+
+    def get_host_limits(self) -> Dict[str, str]:
+        """获取按主机的限速 主机名 -> 速率文本"""
+        raw = self.config.get(self.section_user, self.section_host_limits_key) or ""
+        limits = {}
+        for item in raw.split(","):
+            host, sep, rate = item.partition("=")
+            if sep and host.strip() and rate.strip():
+                limits[host.strip().lower()] = rate.strip()
+        return limits
+
+    def set_host_limit(self, host: str, rate: Optional[str]):
+        """设置单个主机的限速；传入空值删除该主机的限速"""
+        limits = self.get_host_limits()
+        if rate:
+            BandwidthScheduler.parse_rate(rate)
+            limits[host.strip().lower()] = rate
+        else:
+            limits.pop(host.strip().lower(), None)
+        if not limits:
+            self.config.delete(self.section_user, self.section_host_limits_key)
+            return
+        self.config.set(self.section_user, self.section_host_limits_key,
+                        ",".join(f"{h}={r}" for h, r in limits.items()))
+
+    def apply(self):
+        """把配置应用到下载层的带宽调度器"""
+        BandwidthScheduler.configure(
+            global_rate=BandwidthScheduler.parse_rate(self.get_global_limit()),
+            host_rates={host: BandwidthScheduler.parse_rate(rate) for host, rate in self.get_host_limits().items()}
+        )
@@ -1,11 +1,28 @@
 import json
+import marshal
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Optional
 
 from wing_utils import IniConfigUtils
+from wing_utils.download.http_session_utils import HttpSessionUtils
+from wing_utils.download.rate_limit_utils import BandwidthScheduler
 
 
 class CacheFileManager:
+    # 元数据旁路文件：<name>.meta.json，记录 url / ETag / Last-Modified / 获取时间 / 有效期
+    META_SUFFIX = ".meta.json"
+    # 远程数据默认有效期 (秒)，过期后用条件请求重新验证
+    DEFAULT_TTL = 24 * 60 * 60
+    # 派生快照：<name>.snapshot，保存构建器实际需要的精简结构 (marshal)
+    SNAPSHOT_SUFFIX = ".snapshot"
+
+    # 正在后台重新验证的缓存文件
+    _revalidating = set()
+    _revalidating_lock = threading.Lock()
+
     def __init__(self):
         self.config = IniConfigUtils()
         self.section_user = "user"
@@ -62,11 +79,270 @@ class CacheFileManager:
         cache_file = self.get_cache_dir() / file_name
         return cache_file.exists()
 
+    def get_cache_age(self, file_name: str) -> Optional[float]:
+        """缓存文件距上次写入的秒数，不存在时返回 None"""
+        cache_file = self.get_cache_dir() / file_name
+        if not cache_file.exists():
+            return None
+        return time.time() - cache_file.stat().st_mtime
+
+    def get_cache_to_json_if_fresh(self, file_name: str, ttl: float) -> Optional[Dict[str, Any]]:
+        """
+        读取未过期的 JSON 缓存
+
+        Args:
+            file_name: 缓存文件名
+            ttl: 有效期 (秒)
+
+        Returns:
+            解析后的JSON字典，缓存不存在、已过期或无法解析时返回 None
+        """
+        age = self.get_cache_age(file_name)
+        if age is None or age > ttl:
+            return None
+        try:
+            return self.get_cache_to_json(file_name)
+        except (OSError, json.JSONDecodeError):
+            return None
+
     def delete_cache(self, file_name: str):
         """删除缓存文件"""
         cache_file = self.get_cache_dir() / file_name
         if cache_file.exists():
             cache_file.unlink()
+        for suffix in (self.META_SUFFIX, self.SNAPSHOT_SUFFIX):
+            side_file = self.get_cache_dir() / (file_name + suffix)
+            if side_file.exists():
+                side_file.unlink()
+
+    def get_cache_meta(self, file_name: str) -> Dict[str, Any]:
+        """读取缓存的响应元数据，不存在或损坏时返回空字典"""
+        meta_file = self.get_cache_dir() / (file_name + self.META_SUFFIX)
+        try:
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def set_cache_meta(self, file_name: str, meta: Dict[str, Any]):
+        """保存缓存的响应元数据"""
+        self._write_atomic(file_name + self.META_SUFFIX, json.dumps(meta, ensure_ascii=False))
+
+    def cached_sources(self) -> Dict[str, str]:
+        """
+        所有经 fetch_json / fetch_text 缓存过的远程数据
+
+        Returns:
+            远程地址 -> 缓存文件名
+        """
+        sources = {}
+        cache_dir = self.get_cache_dir()
+        if not cache_dir.exists():
+            return sources
+        for meta_file in cache_dir.glob("*" + self.META_SUFFIX):
+            file_name = meta_file.name[:-len(self.META_SUFFIX)]
+            url = self.get_cache_meta(file_name).get("url")
+            if url and self.cache_exists(file_name):
+                sources[url] = file_name
+        return sources
+
+    def fetch_json(self, file_name: str, url: str, ttl: float = DEFAULT_TTL,
+                   headers: Optional[Dict[str, str]] = None, stale_while_revalidate: bool = False,
+                   timeout: float = 10, derive: Optional[Callable[[Any], Any]] = None,
+                   derive_version: int = 1) -> Any:
+        """
+        获取远程 JSON 并缓存，过期后用 ETag / Last-Modified 条件请求重新验证
+
+        Args:
+            file_name: 缓存文件名
+            url: 远程地址
+            ttl: 有效期 (秒)，有效期内直接使用缓存
+            headers: 额外的请求头
+            stale_while_revalidate: 缓存过期时先返回旧数据，在后台线程重新验证 (界面不等待网络)
+            timeout: 请求超时 (秒)
+            derive: 从完整 JSON 提取精简结构的函数，提供时返回值改为派生结构并缓存为快照
+            derive_version: 派生结构的版本号，derive 的逻辑变化时递增以作废旧快照
+
+        Returns:
+            解析后的JSON数据 (或 derive 的结果)
+
+        Raises:
+            requests.RequestException: 没有缓存且网络请求失败
+        """
+        data = self._fetch(file_name, url, ttl, headers, stale_while_revalidate, timeout, as_text=False)
+        if data is None:
+            return self._load(file_name, derive, derive_version)
+        return derive(data) if derive else data
+
+    def fetch_text(self, file_name: str, url: str, ttl: float = DEFAULT_TTL,
+                   headers: Optional[Dict[str, str]] = None, stale_while_revalidate: bool = False,
+                   timeout: float = 10) -> str:
+        """
+        获取远程文本 (目录页面、XML 元数据) 并缓存，重新验证规则与 fetch_json 相同
+
+        Args:
+            file_name: 缓存文件名
+            url: 远程地址
+            ttl: 有效期 (秒)，为 0 时每次都发送条件请求
+            headers: 额外的请求头
+            stale_while_revalidate: 缓存过期时先返回旧内容，在后台线程重新验证
+            timeout: 请求超时 (秒)
+
+        Returns:
+            响应文本
+
+        Raises:
+            requests.RequestException: 没有缓存且网络请求失败
+        """
+        data = self._fetch(file_name, url, ttl, headers, stale_while_revalidate, timeout, as_text=True)
+        return self.get_cache(file_name) if data is None else data
+
+    def _fetch(self, file_name: str, url: str, ttl: float, headers: Optional[Dict[str, str]],
+               stale_while_revalidate: bool, timeout: float, as_text: bool) -> Any:
+        """
+        fetch_json / fetch_text 的公共部分
+        :return: 新获取的数据；应使用缓存时返回 None
+        """
+        meta = self.get_cache_meta(file_name)
+        # 没有元数据的旧缓存视为已过期，仍可先用
+        has_cache = self.cache_exists(file_name) and meta.get("url", url) == url
+        if has_cache:
+            if time.time() - meta.get("fetched_at", 0) < ttl:
+                return None
+            if stale_while_revalidate:
+                self._revalidate_in_background(file_name, url, ttl, headers, timeout, as_text)
+                return None
+
+        try:
+            return self._revalidate(file_name, url, ttl, headers, timeout, meta if has_cache else {}, as_text)
+        except Exception:
+            if has_cache:
+                # 离线时退回旧数据
+                return None
+            raise
+
+    def _load(self, file_name: str, derive: Optional[Callable[[Any], Any]], derive_version: int) -> Any:
+        if derive:
+            return self.get_cache_snapshot(file_name, derive, derive_version)
+        return self.get_cache_to_json(file_name)
+
+    def get_cache_snapshot(self, file_name: str, derive: Callable[[Any], Any], version: int = 1) -> Any:
+        """
+        读取 JSON 缓存的派生快照
+
+        快照以 marshal 保存 derive(完整JSON) 的结果，并记录源文件的修改时间、大小与派生版本；
+        三者一致时直接载入快照，不再读取和解析完整 JSON，否则重新派生并写回。
+
+        Args:
+            file_name: 源缓存文件名
+            derive: 从完整 JSON 提取精简结构的函数 (结果只能包含 marshal 支持的基础类型)
+            version: 派生版本号
+
+        Returns:
+            派生结构
+
+        Raises:
+            FileNotFoundError: 源缓存文件不存在
+        """
+        source = self.get_cache_dir() / file_name
+        stat = source.stat()
+        key = (stat.st_mtime_ns, stat.st_size, version)
+        snapshot = self.get_cache_dir() / (file_name + self.SNAPSHOT_SUFFIX)
+        try:
+            # marshal.load 直接读文件对象时是逐段小读取，整块读入再解析快得多
+            with open(snapshot, 'rb') as f:
+                saved_key, data = marshal.loads(f.read())
+            if tuple(saved_key) == key:
+                return data
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        data = derive(self.get_cache_to_json(file_name))
+        self._write_atomic_bytes(file_name + self.SNAPSHOT_SUFFIX, marshal.dumps((key, data)))
+        return data
+
+    def _revalidate(self, file_name: str, url: str, ttl: float, headers: Optional[Dict[str, str]],
+                    timeout: float, meta: Dict[str, Any], as_text: bool = False) -> Any:
+        """
+        发送条件请求：304 只刷新获取时间并返回 None (调用方读取缓存)，200 覆盖缓存并返回新数据
+        """
+        request_headers = dict(headers or {})
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        r = HttpSessionUtils.get_session().get(url, headers=request_headers, timeout=timeout)
+        if r.status_code == 304 and meta:
+            meta.update({"fetched_at": time.time(), "ttl": ttl})
+            self.set_cache_meta(file_name, meta)
+            return None
+
+        r.raise_for_status()
+        # 数据源较小，整体收到后再计入限速配额；优先级取当前线程的 priority_scope
+        BandwidthScheduler.throttle(url, len(r.content), BandwidthScheduler.current_priority())
+        if as_text:
+            data = r.text
+            self._write_atomic(file_name, data)
+        else:
+            data = r.json()
+            # 以紧凑格式落盘 (不缩进)，体积更小，解析更快
+            self._write_atomic(file_name, json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+        self.set_cache_meta(file_name, {
+            "url": url,
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "ttl": ttl,
+        })
+        return data
+
+    def _revalidate_in_background(self, file_name: str, url: str, ttl: float, headers: Optional[Dict[str, str]],
+                                  timeout: float, as_text: bool = False):
+        """后台重新验证，同一文件同时只有一个线程"""
+        key = str(self.get_cache_dir() / file_name)
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def worker():
+            try:
+                self._revalidate(file_name, url, ttl, headers, timeout, self.get_cache_meta(file_name), as_text)
+            except Exception:
+                pass
+            finally:
+                with self._revalidating_lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def wait_for_revalidation(self, timeout: float = 30) -> bool:
+        """等待后台重新验证结束 (退出前或测试中使用)，超时返回 False"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self._revalidating_lock:
+                if not self._revalidating:
+                    return True
+            time.sleep(0.05)
+        return False
+
+    def _write_atomic(self, file_name: str, content: str):
+        """先写临时文件再替换，读者不会看到写了一半的缓存"""
+        cache_dir = self.get_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_dir / f"{file_name}.{threading.get_ident()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_file, cache_dir / file_name)
+
+    def _write_atomic_bytes(self, file_name: str, content: bytes):
+        cache_dir = self.get_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_dir / f"{file_name}.{threading.get_ident()}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_file, cache_dir / file_name)
 
     def initialize_cache(self):
         """初始化缓存目录"""
@@ -102,17 +378,18 @@ class CacheFileManager:
             )
 
     # 可选扩展：新增 fromjson 方法，用于将字典保存为JSON格式的缓存文件
-    def set_cache_from_json(self, file_name: str, data: Dict[str, Any], indent: int = 4):
+    def set_cache_from_json(self, file_name: str, data: Dict[str, Any], indent: Optional[int] = None):
         """
         将字典数据以JSON格式保存到缓存文件
 
         Args:
             file_name: 缓存文件名
             data: 要保存的字典数据
-            indent: JSON格式化缩进，默认4个空格
+            indent: JSON格式化缩进，默认不缩进 (紧凑格式)
         """
-        # 将字典转换为格式化的JSON字符串
-        json_content = json.dumps(data, ensure_ascii=False, indent=indent)
+        # 将字典转换为JSON字符串，不缩进时同时去掉分隔符后的空格
+        separators = (",", ":") if indent is None else None
+        json_content = json.dumps(data, ensure_ascii=False, indent=indent, separators=separators)
         # 调用已有的setCache方法保存
         self.set_cache(file_name, json_content)
 
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Optional, Dict
 
 from wing_utils import IniConfigUtils
+from wing_utils.download.blob_store import BlobStore
 
 
 class DownloadsManager:
@@ -34,6 +35,14 @@ class DownloadsManager:
         config_path = self.config.getConfigWorkingPath()
         return config_path / "data" / "downloads"
 
+    def get_blobs_dir(self) -> Path:
+        """获取内容寻址仓库目录 (下载目录下的 blobs)"""
+        return self.get_current_downloads_dir() / "blobs"
+
+    def get_blob_store(self) -> BlobStore:
+        """获取内容寻址下载仓库"""
+        return BlobStore(self.get_blobs_dir())
+
     def set_downloads_dir(self, path: str):
         """设置下载目录路径"""
         downloads_path = Path(path).expanduser().resolve()
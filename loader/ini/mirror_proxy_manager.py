@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : mirror_proxy_manager.py
+@Path : loader/ini
+@Author : Anfioo
+@Date : 2026/10/17 20:05
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+from typing import Optional
+
+from wing_utils import IniConfigUtils
+from wing_utils.download.mirror_proxy_utils import MirrorProxyUtils
+
+
+class MirrorProxyManager:
+    """局域网镜像代理配置：[user] mirror_proxy = http://192.168.1.10:8765"""
+
+    def __init__(self):
+        self.config = IniConfigUtils()
+        self.section_user = "user"
+        self.section_proxy_key = "mirror_proxy"
+
+    def get_proxy_url(self) -> Optional[str]:
+        """获取代理地址，未配置时返回 None"""
+        return self.config.get(self.section_user, self.section_proxy_key) or None
+
+    def set_proxy_url(self, url: Optional[str]):
+        """设置代理地址；传入空值恢复直连"""
+        if not url:
+            self.config.delete(self.section_user, self.section_proxy_key)
+            return
+        if not url.startswith(("http://", "https://")):
+            raise ValueError(f"代理地址需以 http:// 或 https:// 开头: {url}")
+        self.config.set(self.section_user, self.section_proxy_key, url.rstrip("/"))
+
+    def apply(self):
+        """按配置启用或关闭代理 (作用于共享 Session，检索构建器与下载都会经过它)"""
+        url = self.get_proxy_url()
+        if url:
+            MirrorProxyUtils.enable(url)
+        else:
+            MirrorProxyUtils.disable()
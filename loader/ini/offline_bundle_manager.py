@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : offline_bundle_manager.py
+@Path : loader/ini
+@Author : Anfioo
+@Date : 2026/10/18 01:50
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+from pathlib import Path
+from typing import Optional
+
+from wing_utils import IniConfigUtils
+from wing_utils.download.offline_bundle_utils import OfflineBundleUtils
+
+
+class OfflineBundleManager:
+    """离线包配置：[user] offline_bundle = ~/.we/data/bundles/ci.webundle"""
+
+    def __init__(self):
+        self.config = IniConfigUtils()
+        self.section_user = "user"
+        self.section_bundle_key = "offline_bundle"
+
+    def get_bundles_dir(self) -> Path:
+        """导入的离线包存放目录"""
+        return self.config.getConfigWorkingPath() / "data" / "bundles"
+
+    def get_bundle_path(self) -> Optional[Path]:
+        """获取当前离线包路径，未配置时返回 None"""
+        path = self.config.get(self.section_user, self.section_bundle_key)
+        return Path(path) if path else None
+
+    def set_bundle_path(self, path: Optional[Path]):
+        """设置离线包；传入空值退出离线模式"""
+        if not path:
+            self.config.delete(self.section_user, self.section_bundle_key)
+            return
+        path = Path(path).expanduser().resolve()
+        if not path.is_file():
+            raise FileNotFoundError(f"离线包不存在: {path}")
+        self.config.set(self.section_user, self.section_bundle_key, str(path))
+
+    def apply(self):
+        """
+        按配置启用离线模式 (命令行 --offline 指定的离线包优先)
+        在 MirrorProxyManager.apply() 之后调用，离线包的 transport 会覆盖代理
+        """
+        current = OfflineBundleUtils.current()
+        path = current.path if current else self.get_bundle_path()
+        if path:
+            OfflineBundleUtils.enable(path)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_catalog_prefetcher.py
+@Path : test/install
+@Author : Anfioo
+@Date : 2026/10/17 23:20
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import json
+import os
+import tempfile
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent
+path.insert(0, str(project_root))
+path.insert(0, str(project_root / "test" / "utils" / "download"))
+
+from range_http_server import start_server
+from install.catalog import CatalogPrefetcher
+from install.catalog.catalog_prefetcher import _Feed
+from install.retrieval_flow_builder import CMakeRetrievalFlowBuilder
+from loader.ini.cache_file_manager import CacheFileManager
+
+
+class LocalPrefetcher(CatalogPrefetcher):
+    """数据源换成本地服务，其余流程 (并发、后续数据源、错误汇总) 不变"""
+
+    def __init__(self, base: str, manager: CacheFileManager):
+        super().__init__(max_workers=4)
+        self.base = base
+        self.manager = manager
+
+    def feeds(self):
+        fetch_json = lambda name: lambda: self.manager.fetch_json(name, f"{self.base}/{name}", ttl=self.ttl)
+        return [
+            _Feed("go", "go", f"{self.base}/go.json", fetch_json("go.json")),
+            _Feed("node", "node (坏镜像)", f"{self.base}/missing.json", fetch_json("missing.json")),
+            _Feed("cmake", "cmake", f"{self.base}/files/", self.load_dirs, then=self.version_feeds),
+        ]
+
+    def load_dirs(self):
+        html = self.manager.fetch_text("cmake_files.html", f"{self.base}/files/", ttl=self.ttl)
+        return CMakeRetrievalFlowBuilder.parse_version_dirs(html)
+
+    def version_feeds(self, dirs):
+        return [_Feed("cmake", f"cmake {d}", f"{self.base}/files/{d}/",
+                      lambda d=d: self.manager.fetch_text(f"cmake_files_{d}.html", f"{self.base}/files/{d}/",
+                                                          ttl=self.ttl)) for d in dirs]
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as cache:
+        with open(os.path.join(src, "go.json"), "w", encoding="utf-8") as f:
+            json.dump([{"version": "go1.22.0", "files": []}], f)
+        for d in ("v3.27", "v3.28"):
+            os.makedirs(os.path.join(src, "files", d))
+            Path(src, "files", d, f"cmake-{d[1:]}.0-linux-x86_64.tar.gz").write_bytes(b"")
+
+        manager = CacheFileManager()
+        manager._cache_dir = Path(cache)
+        server = start_server(src)
+        try:
+            base = f"http://127.0.0.1:{server.server_address[1]}"
+            show = lambda r: print(f"  {r.name:<14} {r.seconds * 1000:6.1f} ms  {r.error or 'ok'}")
+            reports = LocalPrefetcher(base, manager).run(on_report=show)
+            by_name = {r.name: r for r in reports}
+            assert set(by_name) == {"go", "node (坏镜像)", "cmake", "cmake v3.28", "cmake v3.27"}, by_name
+            assert not by_name["node (坏镜像)"].ok and by_name["go"].ok
+            assert "v3.28" in manager.get_cache("cmake_files_v3.28.html")
+            assert manager.get_cache_meta("cmake_files.html")["url"] == f"{base}/files/"
+
+            # 第二次全部重新验证，内容未变时为 304，缓存文件保持不变
+            before = manager.get_cache("go.json")
+            assert all(r.ok for r in LocalPrefetcher(base, manager).run() if r.tool != "node")
+            assert manager.get_cache("go.json") == before
+            print("✅ 并发预取: 后续数据源 / 错误汇总 / 缓存写入")
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_catalog_store.py
+@Path : test/install
+@Author : Anfioo
+@Date : 2026/10/17 22:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import tempfile
+import time
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent
+path.insert(0, str(project_root))
+
+from install.catalog import CatalogNormalizers, CatalogRecord, CatalogStore
+
+JDK_FEED = {"jdks": [
+    {"vendor": "Eclipse Temurin", "jdk_version": "21.0.2", "packages": [
+        {"os": "linux", "arch": "aarch64", "archive_file_name": "temurin-21.0.2-linux-aarch64.tar.gz",
+         "url": "https://example.com/temurin-21.0.2-linux-aarch64.tar.gz", "sha256": "aa" * 32,
+         "archive_size": 200 * 1024 * 1024}]},
+    {"vendor": "Eclipse Temurin", "jdk_version": "22.0.1", "packages": [
+        {"os": "linux", "arch": "aarch64", "archive_file_name": "temurin-22.0.1-linux-aarch64.tar.gz",
+         "url": "https://example.com/temurin-22.0.1-linux-aarch64.tar.gz"}]},
+    {"vendor": "Amazon Corretto", "jdk_version": "17.0.10", "packages": [
+        {"os": "windows", "arch": "x86_64", "archive_file_name": "corretto-17.0.10-windows-x64.zip",
+         "url": "https://example.com/corretto-17.0.10-windows-x64.zip"}]},
+]}
+NODE_INDEX = [
+    {"version": "v21.6.0", "lts": False, "files": ["linux-x64", "win-x64-zip", "src"]},
+    {"version": "v20.11.0", "lts": "Iron", "files": ["linux-x64", "linux-arm64", "osx-arm64-tar", "headers"]},
+    {"version": "v20.9.0", "lts": "Iron", "files": ["linux-x64"]},
+]
+GO_FEED = [{"version": "go1.22.0", "stable": True, "files": [
+    {"filename": "go1.22.0.src.tar.gz", "os": "", "arch": "", "version": "go1.22.0", "kind": "source"},
+    {"filename": "go1.22.0.darwin-arm64.pkg", "os": "darwin", "arch": "arm64", "version": "go1.22.0",
+     "kind": "installer", "size": 64 * 1024 * 1024, "sha256": "bb" * 32},
+]}, {"version": "go1.22rc1", "stable": False, "files": [
+    {"filename": "go1.22rc1.darwin-arm64.pkg", "os": "darwin", "arch": "arm64", "version": "go1.22rc1",
+     "kind": "installer"}]}]
+CMAKE_FILES = [{"name": "cmake-3.28.1-linux-x86_64.tar.gz", "size": "49M"},
+               {"name": "cmake-3.28.1-macos10.10-universal.dmg", "size": "75M"},
+               {"name": "cmake-3.28.1-files-v1.json", "size": "1K"}]
+CONDA_FILES = [{"filename": "Miniconda3-latest-Linux-aarch64.sh", "size": "71.2M", "sha256": "cc" * 32},
+               {"filename": "Miniconda3-py311_23.11.0-2-Linux-aarch64.sh", "size": "71.2M", "sha256": "cc" * 32},
+               {"filename": "Miniconda3-latest-MacOSX-arm64.pkg", "size": "60M", "sha256": "dd" * 32}]
+
+
+def run_case():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = CatalogStore(Path(tmp) / "catalog.sqlite3")
+        store.replace_tool("jdk", CatalogNormalizers.jdk(JDK_FEED), "fixture")
+        store.replace_tool("node", CatalogNormalizers.node(NODE_INDEX, "https://nodejs.org/dist"), "fixture")
+        store.replace_tool("go", CatalogNormalizers.go(GO_FEED), "fixture")
+        store.replace_tool("maven", CatalogNormalizers.maven(["4.0.0-rc-2", "3.9.6", "3.9.10"]), "fixture")
+        store.replace_tool("cmake", CatalogNormalizers.cmake("https://cmake.org/files/v3.28/", CMAKE_FILES))
+        store.replace_tool("miniconda", CatalogNormalizers.miniconda(CONDA_FILES, "https://repo.anaconda.com/miniconda/"))
+
+        node = store.search("nodejs", "20", "linux", "x86_64")
+        assert [r.version for r in node] == ["20.11.0", "20.9.0"], node
+        assert node[0].url == "https://nodejs.org/dist/v20.11.0/node-v20.11.0-linux-x64.tar.gz"
+        assert store.latest("node", os="macos", arch="arm64").kind == "tar.gz"
+
+        jdk = store.latest("java", os="linux", arch="arm64", lts=True)
+        assert jdk.version == "21.0.2" and jdk.size == 200 * 1024 * 1024, jdk
+        assert store.latest("jdk", os="linux", arch="aarch64").version == "22.0.1"
+
+        go = store.search("golang", os="darwin", arch="arm64")
+        assert [r.version for r in go] == ["1.22.0", "1.22rc1"], "正式版应排在预发布版之前"
+        maven = store.search("maven", os="windows", arch="x64")
+        assert [r.version for r in maven][::2] == ["3.9.10", "3.9.6"], "maven 版本应按数字排序并对任意平台可见"
+        cmake = store.search("cmake", os="macos")
+        assert len(store.search("cmake")) == 2 and cmake[0].arch == "universal" and cmake[0].kind == "dmg"
+        conda = store.search("conda", os="linux", arch="aarch64")
+        assert len(conda) == 1 and conda[0].version == "23.11.0-2", "latest 与带版本号的文件重复时只保留一条"
+
+        query = CatalogStore.parse_query([">=17", "<22", "lts", "Linux", "arm64", "latest"])
+        assert query == {"version": ">=17 <22 lts latest", "os": "linux", "arch": "arm64"}, query
+        assert [r.version for r in store.search("jdk", **query)] == ["21.0.2"]
+        assert [r.version for r in store.search("go", "latest")] == ["1.22.0"]
+        assert [r.version for r in store.search("maven", "<3.9.10")][::2] == ["3.9.6"]
+        assert {"example.com", "nodejs.org", "cmake.org", "repo.anaconda.com"} <= store.hosts(), store.hosts()
+
+        # 大目录下的查询耗时
+        bulk = [CatalogRecord("node", "Node.js", f"{major}.{minor}.0", os_, arch, "tar.gz",
+                              f"https://example.com/{major}.{minor}/{os_}-{arch}")
+                for major in range(4, 40) for minor in range(60)
+                for os_ in ("linux", "windows", "macos") for arch in ("x64", "aarch64", "x86")]
+        store.replace_tool("node", bulk)
+        start = time.perf_counter()
+        for _ in range(100):
+            store.search("node", "20", "linux", "x64")
+        elapsed = (time.perf_counter() - start) * 10
+        print(f"✅ 统一目录: {len(bulk)} 条 node 记录，单次查询 {elapsed:.2f} ms")
+        assert elapsed < 50
+
+        # 增量同步：新发布一个版本、撤下一个版本、改动一个文件，其余不变
+        changed = [r for r in bulk if not r.url.startswith("https://example.com/4.0/")]
+        changed[0] = CatalogRecord(**{**changed[0].to_dict(), "size": 123})
+        changed.append(CatalogRecord("node", "Node.js", "40.0.0", "linux", "x64", "tar.gz",
+                                     "https://example.com/40.0/linux-x64"))
+        start = time.perf_counter()
+        delta = store.sync_tool("node", changed)
+        elapsed = (time.perf_counter() - start) * 1000
+        assert (delta.inserted, delta.updated, delta.deleted) == (1, 1, 9), delta
+        assert delta.total == len(changed) == store.sources()["node"]["count"]
+        assert store.latest("node", os="linux", arch="x64").version == "40.0.0"
+        assert not store.search("node", "4.0")
+        assert not store.sync_tool("node", changed).changed
+        # 换镜像只改地址前缀：按 厂商 + 版本 + 文件名 识别为更新
+        moved = [CatalogRecord(**{**r.to_dict(), "url": r.url.replace("example.com", "mirror.example.com")})
+                 for r in changed]
+        assert store.sync_tool("node", moved).updated == len(moved)
+        print(f"✅ 增量同步: {len(changed)} 条中 11 条变化，耗时 {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    run_case()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_jdk_catalog.py
+@Path : test/install
+@Author : Anfioo
+@Date : 2026/10/17 21:20
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent
+path.insert(0, str(project_root))
+
+from install.retrieval_flow_builder import JDKRetrievalFlowBuilder, JdkCatalog, Select
+
+
+def pkg(os, arch, version):
+    return {"os": os, "arch": arch, "archive_file_name": f"jdk-{version}-{os}-{arch}.zip",
+            "url": f"https://example.com/jdk-{version}-{os}-{arch}.zip", "sha256": "ab" * 32}
+
+
+FEED = {"jdks": [
+    {"vendor": "Oracle", "product": "OpenJDK", "jdk_version": "17.0.9",
+     "packages": [pkg("windows", "x86_64", "17.0.9"), pkg("linux", "aarch64", "17.0.9")]},
+    {"vendor": "Oracle", "product": "OpenJDK", "jdk_version": "17.0.10",
+     "packages": [pkg("windows", "x86_64", "17.0.10")]},
+    {"vendor": "Eclipse Temurin", "product": "OpenJDK", "jdk_version": "21.0.2",
+     "packages": [pkg("linux", "aarch64", "21.0.2")]},
+]}
+
+if __name__ == "__main__":
+    catalog = JdkCatalog.from_feed(FEED)
+    assert catalog.vendors("windows", "x86_64") == ["Oracle"]
+    assert catalog.versions("windows", "x86_64", "Oracle") == ["17.0.10", "17.0.9"], "版本应按数字从新到旧"
+    assert catalog.package("Oracle", "17.0.9", "linux", "aarch64")["url"].endswith("linux-aarch64.zip")
+    assert catalog.find("linux", "aarch64")["version"] == "21.0.2"
+    assert catalog.find("linux", "aarch64", version_spec="17")["vendor"] == "Oracle"
+    assert catalog.find("linux", "aarch64", version_spec=">=17 <21 lts")["version"] == "17.0.9"
+    assert catalog.find("macOS", "aarch64") is None
+
+    # 构建流程直接使用索引 (不经过 UI)
+    builder = JDKRetrievalFlowBuilder.default(os="windows", arch="x86_64")
+    builder._raw_data = catalog
+    result = (builder.vendor().deal(default=Select.First).select_ui()
+              .version().deal(default=Select.First).select_ui()
+              .data())
+    assert result["version"] == "17.0.10" and result["filename"] == "jdk-17.0.10-windows-x86_64.zip"
+    print(f"✅ JDK 索引: {result['vendor']} {result['version']}")
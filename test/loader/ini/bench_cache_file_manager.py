@@ -0,0 +1,61 @@
+import json
+import os
+import tempfile
+import time
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from install.retrieval_flow_builder.jdk_catalog import JdkCatalog, JDK_SNAPSHOT_VERSION
+from loader.ini.cache_file_manager import CacheFileManager
+
+
+def fake_feed(count: int = 800) -> dict:
+    """构造与 JetBrains jdks.json 结构相近的数据"""
+    jdks = []
+    for i in range(count):
+        packages = []
+        for os_name in ("windows", "linux", "macOS"):
+            for arch in ("x86_64", "aarch64"):
+                packages.append({
+                    "os": os_name, "arch": arch, "archive_file_name": f"jdk-{i}-{os_name}-{arch}.zip",
+                    "url": f"https://download.example.com/jdk/{i}/jdk-{i}-{os_name}-{arch}.zip",
+                    "sha256": os.urandom(32).hex(), "archive_size": 190000000 + i,
+                    "unpacked_size": 320000000 + i, "package_type": "zip",
+                    "package_root_for_jdk_home": f"jdk-{i}", "package_checksum": os.urandom(32).hex(),
+                    "package_checksum_type": "sha-256", "install_folder_size": 330000000 + i,
+                    "package_to_java_home_prefix": "", "os_version_min": None,
+                })
+        jdks.append({"vendor": f"Vendor{i % 12}", "product": "JDK", "flavour": "HotSpot",
+                     "jdk_version": f"{11 + i % 15}.0.{i}", "jdk_version_major": 11 + i % 15,
+                     "suggested_sdk_name": f"vendor-{i}", "presentable_version_string": f"Vendor {i}",
+                     "release_notes_url": f"https://example.com/{i}", "packages": packages})
+    return {"jdks": jdks}
+
+
+def measure(name: str, func, rounds: int = 10):
+    func()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    elapsed = (time.perf_counter() - started) / rounds * 1000
+    print(f"{name:12} {elapsed:8.2f} ms")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as cache:
+        manager = CacheFileManager()
+        manager._cache_dir = Path(cache)
+        feed = fake_feed()
+        manager.set_cache_from_json("pretty.json", feed, indent=4)
+        manager.set_cache_from_json("jdks.json", feed)
+        for name in ("pretty.json", "jdks.json"):
+            print(f"{name:12} {os.path.getsize(os.path.join(cache, name)) / 1024 / 1024:8.2f} MiB")
+
+        measure("原始(缩进)", lambda: manager.get_cache_to_json("pretty.json"))
+        measure("紧凑JSON", lambda: manager.get_cache_to_json("jdks.json"))
+        measure("索引快照", lambda: manager.get_cache_snapshot("jdks.json", JdkCatalog.build_index, JDK_SNAPSHOT_VERSION))
+        print(f"快照大小 {os.path.getsize(os.path.join(cache, 'jdks.json' + manager.SNAPSHOT_SUFFIX)) / 1024:.0f} KiB")
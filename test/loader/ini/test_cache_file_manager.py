@@ -0,0 +1,62 @@
+import json
+import os
+import tempfile
+import time
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+path.insert(0, str(project_root / "test" / "utils" / "download"))
+
+from range_http_server import start_server
+from loader.ini.cache_file_manager import CacheFileManager
+
+
+def write_feed(directory: str, version: str, mtime: float):
+    feed = os.path.join(directory, "jdks.json")
+    with open(feed, "w", encoding="utf-8") as f:
+        json.dump({"jdks": [{"version": version}]}, f)
+    os.utime(feed, (mtime, mtime))
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as cache:
+        manager = CacheFileManager()
+        manager._cache_dir = Path(cache)
+        now = time.time()
+        write_feed(src, "21", now - 100)
+        server = start_server(src)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/jdks.json"
+
+            # 首次获取：200，写入缓存与元数据
+            assert manager.fetch_json("jdks.json", url, ttl=60)["jdks"][0]["version"] == "21"
+            meta = manager.get_cache_meta("jdks.json")
+            assert meta["last_modified"], "应记录 Last-Modified"
+
+            # 过期后条件请求：内容未变返回 304，只刷新获取时间
+            time.sleep(0.01)
+            assert manager.fetch_json("jdks.json", url, ttl=0)["jdks"][0]["version"] == "21"
+            assert manager.get_cache_meta("jdks.json")["fetched_at"] > meta["fetched_at"]
+
+            # 上游更新：先返回旧数据，后台验证完成后得到新数据
+            write_feed(src, "25", now)
+            assert manager.fetch_json("jdks.json", url, ttl=0, stale_while_revalidate=True)["jdks"][0]["version"] == "21"
+            assert manager.wait_for_revalidation()
+            assert manager.fetch_json("jdks.json", url, ttl=60)["jdks"][0]["version"] == "25"
+
+            # 派生快照：第二次直接从快照载入
+            versions = lambda feed: [jdk["version"] for jdk in feed["jdks"]]
+            assert manager.fetch_json("jdks.json", url, ttl=60, derive=versions) == ["25"]
+            assert (Path(cache) / ("jdks.json" + manager.SNAPSHOT_SUFFIX)).exists()
+            assert manager.get_cache_snapshot("jdks.json", lambda feed: None) == ["25"]
+
+            # 离线时退回旧缓存
+            server.shutdown()
+            server.server_close()
+            assert manager.fetch_json("jdks.json", url, ttl=0)["jdks"][0]["version"] == "25"
+            print("✅ 缓存重新验证: 200 / 304 / stale-while-revalidate / 离线回退")
+        finally:
+            server.shutdown()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : bench_html_listing_utils.py
+@Path : test/utils/common
+@Author : Anfioo
+@Date : 2026/10/18 00:50
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import time
+import tracemalloc
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from wing_utils.common.html_listing_utils import HtmlListingUtils
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def soup_rows(html: str):
+    """原来的做法：整页建 BeautifulSoup 树，再逐行取单元格"""
+    from bs4 import BeautifulSoup
+    rows = []
+    for tr in BeautifulSoup(html, "html.parser").find_all("tr"):
+        a_tag = tr.find("a")
+        if a_tag:
+            rows.append((a_tag.get("href"), [td.text.strip() for td in tr.find_all("td")]))
+    return rows
+
+
+def measure(name: str, func, rounds: int = 10):
+    func()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    elapsed = (time.perf_counter() - started) / rounds * 1000
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{name:28} {elapsed:8.2f} ms  峰值内存 {peak / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    try:
+        import bs4
+    except ImportError:
+        bs4 = None
+    for fixture in ("cmake_files_v3.28.html", "miniconda.html"):
+        html = (FIXTURES / fixture).read_text(encoding="utf-8")
+        print(f"{fixture} ({len(html) / 1024:.0f} KiB, {len(HtmlListingUtils.parse(html))} 行)")
+        measure("  HtmlListingUtils", lambda: HtmlListingUtils.parse(html))
+        if bs4:
+            measure("  BeautifulSoup", lambda: soup_rows(html))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_html_listing_utils.py
+@Path : test/utils/common
+@Author : Anfioo
+@Date : 2026/10/18 00:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from install.retrieval_flow_builder.cmake_flow_builder import CMakeRetrievalFlowBuilder
+from install.retrieval_flow_builder.miniconda_flow_builder import MinicondaRetrievalFlowBuilder
+from wing_utils.common.html_listing_utils import HtmlListingUtils
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+PRE_LISTING = """<html><head><title>Index of /dist/</title></head><body>
+<h1>Index of /dist/</h1><hr><pre><a href="../">../</a>
+<a href="v20.11.0/">v20.11.0/</a>                                          09-Jan-2024 22:52       -
+<a href="node-v20.11.0.tar.gz">node-v20.11.0.tar.gz</a>                    09-Jan-2024 22:52   84M
+<a href="SHASUMS256.txt">SHASUMS256.txt</a>                                09-Jan-2024 22:52   3271
+</pre><hr></body></html>"""
+
+
+def run_fixture_case():
+    cmake_html = (FIXTURES / "cmake_files_v3.28.html").read_text(encoding="utf-8")
+    files = CMakeRetrievalFlowBuilder.parse_files(cmake_html)
+    names = [f["name"] for f in files]
+    assert "Parent Directory" not in names and not any(n.endswith(".asc") for n in names)
+    linux = next(f for f in files if f["name"] == "cmake-3.28.1-linux-x86_64.tar.gz")
+    assert linux["size"] == "50M", linux
+
+    conda_html = (FIXTURES / "miniconda.html").read_text(encoding="utf-8")
+    listing = MinicondaRetrievalFlowBuilder.parse_listing(conda_html)
+    latest = next(f for f in listing if f["filename"] == "Miniconda3-latest-Linux-x86_64.sh")
+    assert len(latest["sha256"]) == 64 and latest["date"].count(":") == 2, latest
+    assert len(listing) == conda_html.count("<td><a href=")
+    print(f"✅ 目录页面: CMake {len(files)} 个文件，Miniconda {len(listing)} 个文件")
+
+
+def run_stream_case():
+    html = (FIXTURES / "miniconda.html").read_text(encoding="utf-8")
+    whole = HtmlListingUtils.parse(html)
+    # 按任意位置切块 (标签、实体中间) 结果应一致，且第一块之后就能拿到行
+    chunks = (html[i:i + 997] for i in range(0, len(html), 997))
+    stream = HtmlListingUtils.iter_rows(chunks)
+    first = next(stream)
+    assert [first] + list(stream) == whole
+    print("✅ 增量解析: 分块结果与整页一致")
+
+
+def run_pre_case():
+    rows = HtmlListingUtils.parse(PRE_LISTING)
+    by_name = {r.name: r for r in rows}
+    assert [r.href for r in rows] == ["../", "v20.11.0/", "node-v20.11.0.tar.gz", "SHASUMS256.txt"]
+    assert by_name["node-v20.11.0.tar.gz"].size == "84M"
+    assert by_name["node-v20.11.0.tar.gz"].date == "09-Jan-2024 22:52"
+    assert by_name["v20.11.0/"].size is None
+    assert CMakeRetrievalFlowBuilder.parse_version_dirs(
+        '<pre><a href="v3.9/">v3.9/</a>\n<a href="v3.28/">v3.28/</a>\n<a href="?C=M">x</a></pre>') == ["v3.28", "v3.9"]
+    print("✅ <pre> 列表: 链接、日期、大小")
+
+
+if __name__ == "__main__":
+    run_fixture_case()
+    run_stream_case()
+    run_pre_case()
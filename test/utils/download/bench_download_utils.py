@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : bench_download_utils.py
+@Path : test/utils/download
+@Author : Anfioo
+@Date : 2026/10/17 19:10
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import multiprocessing
+import os
+import tempfile
+import time
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from range_http_server import start_server
+from wing_utils.download.download_utils import DownloadUtils
+from wing_utils.download.http_session_utils import HttpSessionUtils
+
+SIZE_MB = 256
+
+
+def serve(directory: str, queue):
+    """在子进程中运行本地服务，避免服务端的 CPU 时间计入下载进程"""
+    server = start_server(directory, support_ranges=False)
+    queue.put(server.server_address[1])
+    while True:
+        time.sleep(3600)
+
+
+def legacy_download(url: str, target: str):
+    """旧实现：iter_content(8192)，每块都更新一次进度条"""
+    with HttpSessionUtils.get_session().get(url, stream=True, timeout=30) as r, \
+            DownloadUtils._create_progress() as progress:
+        task_id = progress.add_task("legacy", total=int(r.headers.get("Content-Length", 0)))
+        with open(target, "wb") as f:
+            for chunk in r.iter_content(chunk_size=8192):
+                if chunk:
+                    f.write(chunk)
+                    progress.update(task_id, advance=len(chunk))
+
+
+def measure(name: str, func) -> float:
+    cpu, wall = time.process_time(), time.perf_counter()
+    func()
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    print(f"{name:8} CPU {cpu:6.2f}s  墙钟 {wall:6.2f}s  CPU/MB {cpu / SIZE_MB * 1000:6.2f}ms")
+    return cpu
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as dst:
+        with open(os.path.join(src, "bench.bin"), "wb") as f:
+            for _ in range(SIZE_MB):
+                f.write(os.urandom(1024 * 1024))
+
+        queue = multiprocessing.Queue()
+        server = multiprocessing.Process(target=serve, args=(src, queue), daemon=True)
+        server.start()
+        try:
+            url = f"http://127.0.0.1:{queue.get(timeout=10)}/bench.bin"
+            legacy = measure("legacy", lambda: legacy_download(url, os.path.join(dst, "legacy.bin")))
+            fast = measure("fast", lambda: DownloadUtils.download(url, os.path.join(dst, "fast"), segments=1))
+            print(f"CPU 降低 {(1 - fast / legacy) * 100:.0f}%")
+        finally:
+            server.terminate()
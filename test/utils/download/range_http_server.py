@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : range_http_server.py
+@Path : test/utils/download
+@Author : Anfioo
+@Date : 2026/10/17 10:12
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import os
+import re
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """支持单段 Range 请求的本地静态文件服务（用于模拟下载镜像）"""
+
+    support_ranges = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def end_headers(self):
+        if self.support_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        super().end_headers()
+
+    def do_GET(self):
+        self._counted(super().do_GET)
+
+    def do_HEAD(self):
+        self._counted(super().do_HEAD)
+
+    def _counted(self, handle):
+        # 统计同时处理中的请求数 (server.peak)，供测试检查单个主机的连接数上限
+        with self.server.lock:
+            self.server.active += 1
+            self.server.peak = max(self.server.peak, self.server.active)
+        try:
+            handle()
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+    def send_head(self):
+        range_header = self.headers.get("Range")
+        # 记录收到的请求 (方法, Range)，供测试统计上游被请求了多少数据
+        self.server.requests.append((self.command, range_header))
+        if not self.support_ranges or not range_header:
+            return super().send_head()
+
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return None
+
+        size = os.path.getsize(path)
+        match = re.match(r"bytes=(\d*)-(\d*)$", range_header)
+        if not match:
+            self.send_error(416)
+            return None
+        start = int(match.group(1)) if match.group(1) else 0
+        end = int(match.group(2)) if match.group(2) else size - 1
+        end = min(end, size - 1)
+        if start > end:
+            self.send_error(416)
+            return None
+
+        f = open(path, "rb")
+        f.seek(start)
+        self.send_response(206)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        self._range_remaining = end - start + 1
+        return f
+
+    def copyfile(self, source, outputfile):
+        remaining = getattr(self, "_range_remaining", None)
+        if remaining is None:
+            return super().copyfile(source, outputfile)
+        while remaining > 0:
+            chunk = source.read(min(64 * 1024, remaining))
+            if not chunk:
+                break
+            if self.server.delay:
+                # 模拟慢速镜像，让并发请求确实重叠 (在写出前等待，最后一块发出后请求立即结束)
+                time.sleep(self.server.delay)
+            outputfile.write(chunk)
+            remaining -= len(chunk)
+        self._range_remaining = None
+
+
+def start_server(directory: str, support_ranges: bool = True) -> ThreadingHTTPServer:
+    """在后台线程启动服务，返回 server（server.server_address 可取端口）"""
+    handler = type("Handler", (RangeRequestHandler,), {"support_ranges": support_ranges})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(handler, directory=directory))
+    server.requests = []
+    server.lock = threading.Lock()
+    server.active = 0
+    server.peak = 0
+    server.delay = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
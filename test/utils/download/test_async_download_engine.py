@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_async_download_engine.py
+@Path : test/utils/download
+@Author : Anfioo
+@Date : 2026/10/17 17:20
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import os
+import tempfile
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from range_http_server import start_server
+from wing_utils.download.async_download_engine import AsyncDownloadEngine
+
+if __name__ == "__main__":
+    names = ["jdk.zip", "maven.zip", "node.tar.gz", "go.zip"]
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as dst:
+        payloads = {}
+        for name in names:
+            payloads[name] = os.urandom(2 * 1024 * 1024 + len(name))
+            with open(os.path.join(src, name), "wb") as f:
+                f.write(payloads[name])
+
+        server = start_server(src)
+        try:
+            server.delay = 0.01
+            base = f"http://127.0.0.1:{server.server_address[1]}"
+            engine = AsyncDownloadEngine(max_concurrency=3, per_host_limit=2)
+            jobs = [engine.submit(f"{base}/{name}", os.path.join(dst, name.split(".")[0])) for name in names]
+            missing = engine.submit(f"{base}/missing.zip", dst)
+            engine.run()
+
+            for name, job in zip(names, jobs):
+                assert job.ok, f"{name} 下载失败: {job.error}"
+                with open(job.result, "rb") as f:
+                    assert f.read() == payloads[name], f"{name} 内容不一致"
+            assert not missing.ok and missing.error is not None, "失败任务应记录错误且不影响其它任务"
+            print(f"✅ 批量下载: {len(jobs)} 个成功, 1 个失败")
+            # 每个任务默认 4 个分段，同一主机的连接总数仍不能超过 per_host_limit
+            assert 0 < server.peak <= 2, f"同一主机的并发连接数超过上限: {server.peak}"
+            print(f"✅ 同一主机的并发连接数: 峰值 {server.peak} (上限 2)")
+        finally:
+            server.shutdown()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_checksum_utils.py
+@Path : test/utils/download
+@Author : Anfioo
+@Date : 2026/10/18 06:10
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import hashlib
+import os
+import random
+import tempfile
+import threading
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from wing_utils.download.checksum_utils import StreamingHasher
+from wing_utils.download.download_journal import DownloadJournal
+
+SEGMENTS = 4
+CHUNK = 64 * 1024
+
+if __name__ == "__main__":
+    payload = os.urandom(8 * 1024 * 1024 + 123)
+    with tempfile.TemporaryDirectory() as tmp:
+        part = Path(tmp) / "file.bin.part"
+        part.write_bytes(b"\0" * len(payload))
+        journal = DownloadJournal(part, "https://example.com/file.bin", len(payload))
+        hasher = StreamingHasher("sha256", part, journal.contiguous_end)
+        lock = threading.Lock()
+
+        def segment(start: int, end: int):
+            rng = random.Random(start)
+            with open(part, "r+b") as f:
+                for offset in range(start, end, CHUNK):
+                    chunk = payload[offset:min(offset + CHUNK, end)]
+                    with lock:
+                        f.seek(offset)
+                        f.write(chunk)
+                        f.flush()
+                    journal.mark(offset, offset + len(chunk) - 1)
+                    hasher.feed(offset, chunk)
+                    if rng.random() < 0.05:
+                        threading.Event().wait(0.001)
+
+        size = len(payload) // SEGMENTS
+        bounds = [(i * size, len(payload) if i == SEGMENTS - 1 else (i + 1) * size) for i in range(SEGMENTS)]
+        threads = [threading.Thread(target=segment, args=b) for b in reversed(bounds)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert hasher.finish(len(payload)) == hashlib.sha256(payload).hexdigest()
+        assert not hasher._catching_up
+        print("✅ 分段乱序写入时摘要正确 (读回在锁外进行)")
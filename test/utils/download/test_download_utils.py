@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_download_utils.py
+@Path : test/utils/download
+@Author : Anfioo
+@Date : 2026/10/17 10:12
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import hashlib
+import os
+import tempfile
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from range_http_server import start_server
+from wing_utils.download.blob_store import BlobStore
+from wing_utils.download.checksum_utils import ChecksumMismatchError, ChecksumUtils
+from wing_utils.download.download_journal import DownloadJournal
+from wing_utils.download.download_utils import DownloadUtils
+
+
+def run_case(support_ranges: bool):
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as dst:
+        payload = os.urandom(5 * 1024 * 1024 + 123)
+        with open(os.path.join(src, "jdk.zip"), "wb") as f:
+            f.write(payload)
+
+        server = start_server(src, support_ranges=support_ranges)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/jdk.zip"
+            saved = DownloadUtils.download(url, dst, segments=4)
+            with open(saved, "rb") as f:
+                assert f.read() == payload, "下载内容与源文件不一致"
+            print(f"✅ Range={support_ranges}: {saved}")
+        finally:
+            server.shutdown()
+
+
+def run_resume_case():
+    """模拟中断：.part 中只有前半部分有效数据，续传后应与源文件一致"""
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as dst:
+        payload = os.urandom(3 * 1024 * 1024)
+        with open(os.path.join(src, "node.tar.gz"), "wb") as f:
+            f.write(payload)
+
+        server = start_server(src)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/node.tar.gz"
+            size, _, validator = DownloadUtils.probe(url)
+            half = size // 2
+            part_path = Path(dst) / ("node.tar.gz" + DownloadUtils.PART_SUFFIX)
+            with open(part_path, "wb") as f:
+                f.write(payload[:half])
+                f.write(b"\0" * (size - half))
+            journal = DownloadJournal(part_path, url, size, validator)
+            journal.mark(0, half - 1)
+            journal.flush()
+
+            saved = DownloadUtils.download(url, dst, segments=2,
+                                           checksum=hashlib.sha256(payload).hexdigest())
+            with open(saved, "rb") as f:
+                assert f.read() == payload, "续传后内容与源文件不一致"
+            assert not part_path.exists() and not journal.journal_path.exists(), "临时文件未清理"
+            print(f"✅ 续传: {saved}")
+        finally:
+            server.shutdown()
+
+
+def run_checksum_case():
+    """边下载边校验：正确摘要通过并持久化，错误摘要隔离文件"""
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as dst:
+        payload = os.urandom(4 * 1024 * 1024 + 7)
+        with open(os.path.join(src, "go.zip"), "wb") as f:
+            f.write(payload)
+        expected = hashlib.sha256(payload).hexdigest()
+
+        server = start_server(src)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/go.zip"
+            saved = DownloadUtils.download(url, dst, segments=4, checksum=expected)
+            assert ChecksumUtils.load_digest(Path(saved), "sha256") == expected, "摘要未持久化"
+            # 缓存命中时复用持久化摘要
+            assert DownloadUtils.download(url, dst, checksum=expected) == saved
+
+            os.remove(saved)
+            try:
+                DownloadUtils.download(url, dst, checksum="0" * 64)
+                raise AssertionError("错误摘要未被发现")
+            except ChecksumMismatchError as e:
+                print(f"✅ 摘要不一致已拦截: {e}")
+            assert not os.path.exists(saved), "损坏文件未被隔离"
+            print(f"✅ 校验: {saved}")
+        finally:
+            server.shutdown()
+
+
+def run_store_case():
+    """内容寻址仓库：不同环境目录共享同一 blob，同名不同内容的文件不会被误用"""
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as dst:
+        os.makedirs(os.path.join(src, "a"))
+        os.makedirs(os.path.join(src, "b"))
+        payload = os.urandom(2 * 1024 * 1024)
+        for mirror in ("a", "b"):
+            with open(os.path.join(src, mirror, "temurin.zip"), "wb") as f:
+                f.write(payload)
+        other = os.urandom(1024)
+        with open(os.path.join(src, "temurin.zip"), "wb") as f:
+            f.write(other)
+
+        store = BlobStore(Path(dst) / "blobs")
+        server = start_server(src)
+        try:
+            base = f"http://127.0.0.1:{server.server_address[1]}"
+            jdk = DownloadUtils.download(f"{base}/a/temurin.zip", os.path.join(dst, "jdk"), store=store)
+            # 另一个镜像、另一个环境目录：内容相同，只保存一份
+            other_env = DownloadUtils.download(f"{base}/b/temurin.zip", os.path.join(dst, "graalvm"), store=store)
+            assert os.path.samefile(jdk, other_env), "相同内容应链接到同一 blob"
+            # 同名不同内容：不能复用
+            renamed = DownloadUtils.download(f"{base}/temurin.zip", os.path.join(dst, "jdk"), store=store)
+            with open(renamed, "rb") as f:
+                assert f.read() == other, "同名文件被错误复用"
+            # 再次请求第一个 url：从仓库重新链接
+            again = DownloadUtils.download(f"{base}/a/temurin.zip", os.path.join(dst, "jdk"), store=store)
+            with open(again, "rb") as f:
+                assert f.read() == payload
+            blobs = [p for p in os.listdir(store.root) if len(p) == 64]
+            assert len(blobs) == 2, f"仓库中应有 2 个 blob: {blobs}"
+            print(f"✅ 仓库: {store.root}")
+        finally:
+            server.shutdown()
+
+
+def run_mirror_failover_case():
+    """主地址失效时切换到镜像，并沿用主地址留下的分段"""
+    with tempfile.TemporaryDirectory() as dead, tempfile.TemporaryDirectory() as src, \
+            tempfile.TemporaryDirectory() as dst:
+        payload = os.urandom(2 * 1024 * 1024)
+        with open(os.path.join(src, "go.zip"), "wb") as f:
+            f.write(payload)
+
+        primary = start_server(dead)
+        mirror = start_server(src)
+        try:
+            primary_url = f"http://127.0.0.1:{primary.server_address[1]}/go.zip"
+            mirror_url = f"http://127.0.0.1:{mirror.server_address[1]}/go.zip"
+            part_path = Path(dst) / ("go.zip" + DownloadUtils.PART_SUFFIX)
+            half = len(payload) // 2
+            with open(part_path, "wb") as f:
+                f.write(payload[:half])
+                f.write(b"\0" * (len(payload) - half))
+            journal = DownloadJournal(part_path, primary_url, len(payload), "\"primary\"")
+            journal.mark(0, half - 1)
+            journal.flush()
+
+            saved = DownloadUtils.download(primary_url, dst, mirrors=[mirror_url],
+                                           checksum=hashlib.sha256(payload).hexdigest())
+            with open(saved, "rb") as f:
+                assert f.read() == payload, "切换镜像后内容不一致"
+            print(f"✅ 镜像切换: {saved}")
+        finally:
+            primary.shutdown()
+            mirror.shutdown()
+
+
+if __name__ == "__main__":
+    run_case(support_ranges=True)
+    run_case(support_ranges=False)
+    run_resume_case()
+    run_checksum_case()
+    run_store_case()
+    run_mirror_failover_case()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_http_session_utils.py
+@Path : test/utils/download
+@Author : Anfioo
+@Date : 2026/10/17 15:30
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import json
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from install.retrieval_flow_builder import NPMRetrievalFlowBuilder, Select
+from loader.ini.cache_file_manager import CacheFileManager
+from wing_utils.download.http_session_utils import HttpSessionUtils
+
+
+class StubAdapter(BaseAdapter):
+    """本地替身 transport：按 url 返回预置内容，并记录请求"""
+
+    def __init__(self, routes):
+        super().__init__()
+        self.routes = routes
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = Response()
+        response.url = request.url
+        response.request = request
+        body = self.routes.get(request.url)
+        response.status_code = 200 if body is not None else 404
+        response._content = json.dumps(body).encode("utf-8") if body is not None else b""
+        response.headers["Content-Type"] = "application/json"
+        return response
+
+    def close(self):
+        pass
+
+
+if __name__ == "__main__":
+    index = [{"version": "v20.11.1", "lts": "Iron", "npm": "10.2.4", "files": ["linux-x64", "win-x64-zip"]}]
+    stub = StubAdapter({"https://npmmirror.com/mirrors/node/index.json": index})
+    # 构建器经 CacheFileManager 取 index.json：先删掉该镜像的缓存，保证请求真正发出，结束后也不把替身数据留在缓存中
+    cache_name = NPMRetrievalFlowBuilder.index_cache_file_name("https://npmmirror.com/mirrors/node")
+    CacheFileManager().delete_cache(cache_name)
+    HttpSessionUtils.mount("https://npmmirror.com/", stub)
+    try:
+        result = (NPMRetrievalFlowBuilder.default()
+                  .mirror().deal(default=Select.Option("阿里镜像 (npmmirror)")).select_ui()
+                  .fetch_data()
+                  .version().deal(default=Select.First).select_ui()
+                  .arch().deal(default=Select.Option("linux-x64")).select_ui()
+                  .data())
+        assert result["url"] == "https://npmmirror.com/mirrors/node/v20.11.1/node-v20.11.1-linux-x64.tar.gz"
+        assert len(stub.requests) == 1, "请求应经过挂载的替身 transport"
+        assert "User-Agent" in stub.requests[0].headers
+        print(f"✅ 共享 Session + 替身 transport: {result['filename']}")
+    finally:
+        HttpSessionUtils.reset()
+        CacheFileManager().delete_cache(cache_name)
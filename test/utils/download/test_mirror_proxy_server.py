@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_mirror_proxy_server.py
+@Path : test/utils/download
+@Author : Anfioo
+@Date : 2026/10/17 20:20
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from range_http_server import start_server
+from wing_utils.download.blob_store import BlobStore
+from wing_utils.download.download_utils import DownloadUtils
+from wing_utils.download.http_session_utils import HttpSessionUtils
+from wing_utils.download.mirror_proxy_server import MirrorProxyServer
+from wing_utils.download.mirror_proxy_utils import MirrorProxyUtils
+
+
+def serve(cache: str, queue):
+    """代理运行在子进程中：同一进程内启用改写后，代理自己的上游请求也会被改写"""
+    proxy = MirrorProxyServer(BlobStore(Path(cache)), host="127.0.0.1", port=0, allowed_hosts=["127.0.0.1"])
+    proxy.start()
+    queue.put(proxy.address[1])
+    while True:
+        time.sleep(3600)
+
+
+if __name__ == "__main__":
+    assert MirrorProxyUtils.rewrite("https://go.dev/dl/?mode=json&include=all", "http://lan:8765") == \
+           "http://lan:8765/https/go.dev/dl/?mode=json&include=all"
+    assert MirrorProxyUtils.restore("/https/go.dev/dl/?mode=json") == "https://go.dev/dl/?mode=json"
+
+    # 默认拒绝一切上游；只允许列表中的主机，或显式开启 allow_any
+    with tempfile.TemporaryDirectory() as cache:
+        closed = MirrorProxyServer(BlobStore(Path(cache)), port=0)
+        scoped = MirrorProxyServer(BlobStore(Path(cache)), port=0, allowed_hosts=["Go.dev"])
+        relay = MirrorProxyServer(BlobStore(Path(cache)), port=0, allow_any=True)
+        assert closed.address[0] == "127.0.0.1", "默认只监听本机"
+        assert not closed.is_allowed("https://go.dev/dl/go1.22.linux-amd64.tar.gz")
+        assert scoped.is_allowed("https://go.dev/dl/go1.22.linux-amd64.tar.gz")
+        assert not scoped.is_allowed("http://169.254.169.254/latest/x.zip")
+        assert relay.is_allowed("http://169.254.169.254/latest/x.zip")
+        for server in (closed, scoped, relay):
+            server.httpd.server_close()
+    print("✅ 镜像代理: 默认只监听本机，只代理允许的上游主机")
+
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as cache, \
+            tempfile.TemporaryDirectory() as dst:
+        payload = os.urandom(3 * 1024 * 1024 + 7)
+        with open(os.path.join(src, "go1.22.linux-amd64.tar.gz"), "wb") as f:
+            f.write(payload)
+        with open(os.path.join(src, "index.json"), "w", encoding="utf-8") as f:
+            json.dump([{"version": "v20.11.1"}], f)
+
+        upstream = start_server(src)
+
+        # 填充结束后不保留该 url 的锁 (启用改写之前，在本进程内直接填充)
+        with tempfile.TemporaryDirectory() as local_cache:
+            local = MirrorProxyServer(BlobStore(Path(local_cache)), port=0, allowed_hosts=["127.0.0.1"])
+            blob = local.fill(f"http://127.0.0.1:{upstream.server_address[1]}/go1.22.linux-amd64.tar.gz")
+            assert blob.stat().st_size == len(payload) and local._fills == {}, "填充结束后应移除填充状态"
+            local.httpd.server_close()
+        print("✅ 镜像代理: 填充结束后释放填充状态")
+
+        # 冷启动的分段下载：上游只被完整拉取一次，客户端的 If-Range 在填充前后都匹配
+        with tempfile.TemporaryDirectory() as local_cache, tempfile.TemporaryDirectory() as out:
+            local = MirrorProxyServer(BlobStore(Path(local_cache)), port=0, allowed_hosts=["127.0.0.1"])
+            local.start()
+            upstream.requests.clear()
+            cold_url = (f"http://127.0.0.1:{local.address[1]}/http/127.0.0.1:{upstream.server_address[1]}"
+                        f"/go1.22.linux-amd64.tar.gz")
+            size, accept_ranges, validator = DownloadUtils.probe(cold_url)
+            assert size == len(payload) and accept_ranges and validator
+            saved = DownloadUtils.download(cold_url, out, segments=4)
+            with open(saved, "rb") as f:
+                assert f.read() == payload, "冷启动经代理下载的内容不一致"
+            fetched = 0
+            for method, range_header in upstream.requests:
+                if method != "GET":
+                    continue
+                if range_header is None:
+                    fetched += len(payload)
+                else:
+                    first, last = range_header[len("bytes="):].split("-")
+                    fetched += int(last) - int(first) + 1
+            assert fetched == len(payload), f"上游应只被拉取一次: {fetched} / {len(payload)} 字节"
+            # 填充后仍接受填充前拿到的校验标识
+            r = HttpSessionUtils.get_session().get(cold_url, headers={"Range": "bytes=0-9", "If-Range": validator},
+                                                   timeout=10)
+            assert r.status_code == 206 and r.content == payload[:10], r.status_code
+            assert DownloadUtils.probe(cold_url)[2] == validator, "填充前后的校验标识应一致"
+            local.shutdown()
+        print(f"✅ 镜像代理: 冷启动分段下载只拉取上游一次 ({len(upstream.requests)} 个上游请求)，校验标识稳定")
+
+        queue = multiprocessing.Queue()
+        proxy = multiprocessing.Process(target=serve, args=(cache, queue), daemon=True)
+        proxy.start()
+        proxy_port = queue.get(timeout=10)
+        MirrorProxyUtils.enable(f"http://127.0.0.1:{proxy_port}")
+        try:
+            base = f"http://127.0.0.1:{upstream.server_address[1]}"
+            url = f"{base}/go1.22.linux-amd64.tar.gz"
+
+            # 元数据原样转发
+            r = HttpSessionUtils.get_session().get(f"{base}/index.json", timeout=10)
+            assert r.json() == [{"version": "v20.11.1"}] and "/http/127.0.0.1" in r.url
+
+            # 不在允许列表中的主机 (localhost 与 127.0.0.1 按主机名区分) 被拒绝
+            port = upstream.server_address[1]
+            r = HttpSessionUtils.get_session().get(f"http://localhost:{port}/index.json", timeout=10)
+            assert r.status_code == 403, f"应拒绝未允许的主机: {r.status_code}"
+
+            # HEAD 不触发填充
+            r = HttpSessionUtils.get_session().head(url, timeout=10)
+            assert r.status_code == 200 and not os.path.exists(os.path.join(cache, "proxy")), "HEAD 不应填充仓库"
+
+            # 第一次请求：代理从上游填充仓库；客户端分段下载
+            first = DownloadUtils.download(url, os.path.join(dst, "a"), segments=4)
+            with open(first, "rb") as f:
+                assert f.read() == payload, "经代理下载的内容不一致"
+
+            # 上游下线后仍可从代理本地磁盘获取
+            upstream.shutdown()
+            upstream.server_close()
+            second = DownloadUtils.download(url, os.path.join(dst, "b"), segments=4)
+            with open(second, "rb") as f:
+                assert f.read() == payload, "代理缓存命中时内容不一致"
+
+            size, accept_ranges, validator = DownloadUtils.probe(url)
+            assert size == len(payload) and accept_ranges and validator
+            r = HttpSessionUtils.get_session().get(url, headers={"Range": "bytes=-5"}, timeout=10)
+            assert r.status_code == 206 and r.content == payload[-5:]
+            assert len(os.listdir(os.path.join(cache))) >= 2, "仓库中应有 blob 与索引"
+            print(f"✅ 镜像代理: 填充一次，后续从本地提供 (端口 {proxy_port})")
+        finally:
+            MirrorProxyUtils.disable()
+            proxy.terminate()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_mirror_race_utils.py
+@Path : test/utils/download
+@Author : Anfioo
+@Date : 2026/10/17 16:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import os
+import tempfile
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from range_http_server import start_server
+from wing_utils.download.mirror_race_utils import MirrorRaceUtils
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as empty:
+        with open(os.path.join(src, "index.json"), "wb") as f:
+            f.write(os.urandom(256 * 1024))
+
+        good = start_server(src)
+        broken = start_server(empty)
+        try:
+            mirrors = {
+                "失效镜像": f"http://127.0.0.1:{broken.server_address[1]}",
+                "本地镜像": f"http://127.0.0.1:{good.server_address[1]}",
+            }
+            scores = MirrorRaceUtils.race(mirrors, probe_path="index.json")
+            assert [s.name for s in scores] == ["本地镜像", "失效镜像"], "可用镜像应排在前面"
+            assert scores[0].ok and not scores[1].ok
+            for s in scores:
+                print(f"{s.name}: ttfb={s.ttfb} throughput={s.throughput:.0f} error={s.error}")
+            print("✅ 镜像测速排序")
+        finally:
+            good.shutdown()
+            broken.shutdown()
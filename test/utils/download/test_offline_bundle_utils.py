@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_offline_bundle_utils.py
+@Path : test/utils/download
+@Author : Anfioo
+@Date : 2026/10/18 02:10
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import json
+import os
+import tempfile
+from sys import path
+from pathlib import Path
+
+import requests
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from install.catalog import CatalogBundler, CatalogRecord, CatalogStore
+from loader.ini.cache_file_manager import CacheFileManager
+from wing_utils.download.blob_store import BlobStore
+from wing_utils.download.checksum_utils import ChecksumUtils
+from wing_utils.download.download_utils import DownloadUtils
+from wing_utils.download.http_session_utils import HttpSessionUtils
+from wing_utils.download.mirror_proxy_utils import MirrorProxyUtils
+from wing_utils.download.offline_bundle_utils import OfflineBundle, OfflineBundleUtils
+
+FEED_URL = "https://go.dev/dl/?mode=json&include=all"
+ARCHIVE_URL = "https://go.dev/dl/go1.22.0.linux-amd64.tar.gz"
+
+
+def run_bundle_case(work: Path):
+    feed = work / "go.json"
+    feed.write_text(json.dumps([{"version": "go1.22.0", "files": []}]), encoding="utf-8")
+    archive = work / "go1.22.0.linux-amd64.tar.gz"
+    archive.write_bytes(os.urandom(2 * 1024 * 1024 + 3))
+    digest = ChecksumUtils.file_digest(archive, "sha256")
+    bundle_path = work / "ci.webundle"
+    OfflineBundle.write(bundle_path, [
+        {"url": FEED_URL, "path": feed, "kind": "feed"},
+        {"url": ARCHIVE_URL, "path": archive, "kind": "artifact", "sha256": digest},
+    ])
+
+    OfflineBundleUtils.enable(bundle_path)
+    try:
+        # 数据源经 CacheFileManager 的条件请求取得
+        cache = CacheFileManager()
+        cache._cache_dir = work / "cache"
+        assert cache.fetch_json("go.json", FEED_URL, ttl=0)[0]["version"] == "go1.22.0"
+        assert cache.cached_sources() == {FEED_URL: "go.json"}
+
+        head = HttpSessionUtils.get_session().head(ARCHIVE_URL)
+        assert int(head.headers["Content-Length"]) == archive.stat().st_size
+
+        saved = DownloadUtils.download(ARCHIVE_URL, str(work / "downloads"), checksum=digest)
+        assert Path(saved).read_bytes() == archive.read_bytes()
+
+        try:
+            HttpSessionUtils.get_session().get("https://nodejs.org/dist/index.json")
+            raise AssertionError("离线包中没有的地址应报错")
+        except requests.ConnectionError as e:
+            assert "离线模式" in str(e)
+    finally:
+        OfflineBundleUtils.disable()
+    print("✅ 离线包: 数据源 / 下载 / 未收录地址")
+
+
+def run_bundler_case(work: Path):
+    store = CatalogStore(work / "catalog.sqlite3")
+    blobs = BlobStore(work / "blobs")
+    records = [CatalogRecord("go", "Go", v, "linux", "x64", "tar.gz", f"https://go.dev/dl/go{v}.linux-amd64.tar.gz")
+               for v in ("1.21.6", "1.22.0", "1.22rc1")]
+    store.replace_tool("go", records)
+    payload = work / "go1.22.0.linux-amd64.tar.gz"
+    payload.write_bytes(b"go" * 1000)
+    blobs.add(payload, ChecksumUtils.file_digest(payload, "sha256"), records[1].url)
+
+    bundler = CatalogBundler(store, blobs)
+    selected = bundler.select(["go latest linux amd64"])
+    assert [r.version for r in selected] == ["1.22.0"], selected
+    bundler.export(work / "go.webundle", selected, download_missing=False)
+    bundle = OfflineBundle(work / "go.webundle")
+    assert bundle.find(records[1].url).kind == "artifact" and bundle.records[0]["version"] == "1.22.0"
+    bundle.close()
+    try:
+        bundler.export(work / "old.webundle", [records[0]], download_missing=False)
+        raise AssertionError("仓库中没有的安装包应报错")
+    except FileNotFoundError:
+        pass
+    print("✅ 导出: 按查询选择记录，安装包取自下载仓库")
+
+
+def run_mount_order_case(work: Path):
+    """离线包与镜像代理叠加挂载：关闭时只移除自己的 transport，并恢复之前的挂载"""
+    bundle_path = work / "empty.webundle"
+    OfflineBundle.write(bundle_path, [])
+    try:
+        MirrorProxyUtils.enable("http://127.0.0.1:8765")
+        proxy_adapter = HttpSessionUtils.mounted("https://")
+        OfflineBundleUtils.enable(bundle_path)
+        assert HttpSessionUtils.mounted("https://") is not proxy_adapter
+        OfflineBundleUtils.disable()
+        assert HttpSessionUtils.mounted("https://") is proxy_adapter, "关闭离线包后应恢复镜像代理"
+        MirrorProxyUtils.disable()
+        assert HttpSessionUtils.mounted("https://") is None
+
+        OfflineBundleUtils.enable(bundle_path)
+        bundle_adapter = HttpSessionUtils.mounted("http://")
+        MirrorProxyUtils.enable("http://127.0.0.1:8765")
+        proxy_adapter = HttpSessionUtils.mounted("http://")
+        OfflineBundleUtils.disable()
+        assert HttpSessionUtils.mounted("http://") is proxy_adapter, "不应移除其它模块之后挂载的 transport"
+        assert bundle_adapter is not proxy_adapter
+    finally:
+        OfflineBundleUtils.disable()
+        MirrorProxyUtils.disable()
+        HttpSessionUtils.reset()
+    print("✅ 离线包 / 镜像代理: 关闭时只移除自己挂载的 transport")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        run_bundle_case(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        run_bundler_case(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        run_mount_order_case(Path(tmp))
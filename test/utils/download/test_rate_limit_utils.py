@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_rate_limit_utils.py
+@Path : test/utils/download
+@Author : Anfioo
+@Date : 2026/10/17 18:50
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import os
+import tempfile
+import threading
+import time
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from range_http_server import start_server
+from wing_utils.download.download_utils import DownloadUtils
+from wing_utils.download.rate_limit_utils import BandwidthScheduler, DownloadPriority, TokenBucket
+
+
+def run_download_case():
+    """全局限速 1 MiB/s 下载 3 MiB (桶内初始 1 MiB)，耗时应接近 2 秒"""
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as dst:
+        with open(os.path.join(src, "maven.zip"), "wb") as f:
+            f.write(os.urandom(3 * 1024 * 1024))
+        server = start_server(src)
+        BandwidthScheduler.configure(global_rate=BandwidthScheduler.parse_rate("1M"))
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/maven.zip"
+            start = time.perf_counter()
+            DownloadUtils.download(url, dst, segments=4)
+            elapsed = time.perf_counter() - start
+            assert 1.2 < elapsed < 4, f"限速未生效: {elapsed:.2f}s"
+            print(f"✅ 全局限速: 3 MiB 用时 {elapsed:.2f}s")
+        finally:
+            BandwidthScheduler.reset()
+            server.shutdown()
+
+
+def run_priority_case():
+    """交互式任务在等待时，后台任务不能取走令牌"""
+    bucket = TokenBucket(rate=200 * 1024, burst=64 * 1024)
+    finished = {}
+
+    def worker(name, priority):
+        for _ in range(8):
+            bucket.consume(32 * 1024, priority)
+        finished[name] = time.perf_counter()
+
+    background = threading.Thread(target=worker, args=("background", DownloadPriority.BACKGROUND))
+    interactive = threading.Thread(target=worker, args=("interactive", DownloadPriority.INTERACTIVE))
+    background.start()
+    time.sleep(0.05)
+    interactive.start()
+    background.join()
+    interactive.join()
+    assert finished["interactive"] < finished["background"], "交互式任务应先完成"
+    print("✅ 优先级: 交互式任务先于后台任务完成")
+
+
+def run_priority_scope_case():
+    """priority_scope 只作用于当前线程，退出后恢复"""
+    seen = {}
+    assert BandwidthScheduler.current_priority() == DownloadPriority.INTERACTIVE
+    with BandwidthScheduler.priority_scope(DownloadPriority.BACKGROUND):
+        other = threading.Thread(target=lambda: seen.setdefault("other", BandwidthScheduler.current_priority()))
+        other.start()
+        other.join()
+        assert BandwidthScheduler.current_priority() == DownloadPriority.BACKGROUND
+    assert BandwidthScheduler.current_priority() == DownloadPriority.INTERACTIVE
+    assert seen["other"] == DownloadPriority.INTERACTIVE
+    print("✅ priority_scope: 按线程设置默认优先级")
+
+
+if __name__ == "__main__":
+    assert BandwidthScheduler.parse_rate("10M") == 10 * 1024 * 1024
+    assert BandwidthScheduler.parse_rate("512kb/s") == 512 * 1024
+    run_download_case()
+    run_priority_case()
+    run_priority_scope_case()
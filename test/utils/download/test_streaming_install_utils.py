@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_streaming_install_utils.py
+@Path : test/utils/download
+@Author : Anfioo
+@Date : 2026/10/17 18:00
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import hashlib
+import os
+import tarfile
+import tempfile
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from range_http_server import start_server
+from wing_utils.download.checksum_utils import ChecksumMismatchError, ChecksumUtils
+from wing_utils.download.streaming_install_utils import StreamingInstallUtils
+from wing_utils.extract.staged_extract_utils import StagedExtractUtils
+
+
+def build_archive(src: str) -> bytes:
+    """生成一个带目录层级的 tar.gz，返回其内容"""
+    root = os.path.join(src, "tree", "node-v20.11.1-linux-x64", "bin")
+    os.makedirs(root)
+    for i in range(20):
+        with open(os.path.join(root, f"file{i}.bin"), "wb") as f:
+            f.write(os.urandom(64 * 1024))
+    archive = os.path.join(src, "node-v20.11.1-linux-x64.tar.gz")
+    with tarfile.open(archive, "w:gz") as tf:
+        tf.add(os.path.join(src, "tree", "node-v20.11.1-linux-x64"), arcname="node-v20.11.1-linux-x64")
+    with open(archive, "rb") as f:
+        return f.read()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as dst:
+        payload = build_archive(src)
+        server = start_server(src)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/node-v20.11.1-linux-x64.tar.gz"
+            assert StreamingInstallUtils.is_streamable(url)
+
+            # 摘要错误：解压内容被清理，缓存文件被隔离
+            bad_dest = os.path.join(dst, "bad")
+            try:
+                StreamingInstallUtils.download_and_extract(url, os.path.join(dst, "cache"), bad_dest,
+                                                           checksum="0" * 64)
+                raise AssertionError("摘要错误时应抛出 ChecksumMismatchError")
+            except ChecksumMismatchError:
+                assert not os.path.exists(bad_dest), "校验失败时不应发布解压目录"
+                assert not os.path.exists(StagedExtractUtils.stage_path(bad_dest)), "校验失败后暂存目录应被清理"
+
+            dest = os.path.join(dst, "node")
+            names = []
+            saved, extracted = StreamingInstallUtils.download_and_extract(
+                url, os.path.join(dst, "cache"), dest, checksum=hashlib.sha256(payload).hexdigest(), names=names)
+            assert "node-v20.11.1-linux-x64/bin/file0.bin" in names, "解压时应收集条目名"
+            with open(saved, "rb") as f:
+                assert f.read() == payload, "缓存文件与源文件不一致"
+            assert ChecksumUtils.load_digest(Path(saved), "sha256") == hashlib.sha256(payload).hexdigest()
+            for i in range(20):
+                expected = os.path.join(src, "tree", "node-v20.11.1-linux-x64", "bin", f"file{i}.bin")
+                actual = os.path.join(extracted, "node-v20.11.1-linux-x64", "bin", f"file{i}.bin")
+                with open(expected, "rb") as a, open(actual, "rb") as b:
+                    assert a.read() == b.read(), f"解压内容不一致: {actual}"
+            assert StagedExtractUtils.is_complete(extracted, hashlib.sha256(payload).hexdigest())
+            print(f"✅ 边下载边解压: {saved} -> {extracted}")
+
+            # 同一压缩包再次安装：凭完成标记跳过解压
+            marker_mtime = os.path.getmtime(StagedExtractUtils.marker_path(dest))
+            skipped_names = []
+            StreamingInstallUtils.download_and_extract(url, os.path.join(dst, "cache"), dest, names=skipped_names)
+            assert os.path.getmtime(StagedExtractUtils.marker_path(dest)) == marker_mtime
+            assert skipped_names == names, "跳过解压时条目名取自完成标记"
+            print("✅ 完成标记一致时跳过重复解压")
+        finally:
+            server.shutdown()
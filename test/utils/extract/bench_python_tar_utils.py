@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : bench_python_tar_utils.py
+@Path : test/utils/extract
+@Author : Anfioo
+@Date : 2026/10/18 03:20
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import io
+import os
+import random
+import shutil
+import tarfile
+import tempfile
+import time
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from wing_utils.extract.python_tar_utils import PythonTarUtils
+
+
+def make_archive(target: Path, mode: str):
+    """约 60 MiB、3000 个条目的工具链压缩包 (可压缩的文本 + 少量二进制)"""
+    rng = random.Random(3)
+    words = [os.urandom(6).hex().encode() for _ in range(256)]
+    with tarfile.open(target, mode) as tf:
+        for i in range(3000):
+            data = b" ".join(rng.choice(words) for _ in range(rng.randint(10, 1500)))
+            info = tarfile.TarInfo(f"go/src/p{i % 50}/f{i}.go")
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+        data = os.urandom(16 * 1024 * 1024)
+        info = tarfile.TarInfo("go/bin/go")
+        info.size = len(data)
+        tf.addfile(info, io.BytesIO(data))
+
+
+def two_pass(file_path: str, dest_dir: str):
+    """原实现的做法：getmembers() 先完整解压一遍统计，再逐个解压"""
+    with tarfile.open(file_path, 'r:*') as tf:
+        members = tf.getmembers()
+        sum(m.size for m in members)
+        for member in members:
+            tf.extract(member, path=dest_dir, filter='fully_trusted')
+
+
+def single_pass(archive: Path, dest: Path):
+    """extract_with_rich 现在的做法：r|* 只解压一遍"""
+    with open(archive, 'rb') as f:
+        PythonTarUtils.extract_stream(f, str(dest), extract_filter='fully_trusted')
+
+
+def timed(func, dest: Path) -> float:
+    shutil.rmtree(dest, ignore_errors=True)
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        rows = []
+        for suffix, mode in ((".tar.gz", "w:gz"), (".tar.xz", "w:xz")):
+            archive = tmp / f"go{suffix}"
+            make_archive(archive, mode)
+            dest = tmp / "out"
+            old = timed(lambda: two_pass(str(archive), str(dest)), dest)
+            new = timed(lambda: single_pass(archive, dest), dest)
+            rows.append((suffix, archive.stat().st_size, old, new))
+        print()
+        for suffix, size, old, new in rows:
+            print(f"{suffix:8} {size / 1024 / 1024:6.1f} MiB  getmembers+extract {old:6.2f} s  "
+                  f"单遍流式 {new:6.2f} s  ({old / new:.2f}x)")
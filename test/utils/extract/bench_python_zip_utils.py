@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : bench_python_zip_utils.py
+@Path : test/utils/extract
+@Author : Anfioo
+@Date : 2026/10/18 02:50
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import os
+import random
+import shutil
+import tempfile
+import time
+import zipfile
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from wing_utils.extract.python_zip_utils import PythonZipUtils
+
+ENTRIES = 5000
+WORKERS = max(os.cpu_count() or 1, 2)
+
+
+def make_archive(target: Path):
+    """5000 个条目，大小与可压缩性接近 JDK 的 class / 库文件，外加一个大文件"""
+    rng = random.Random(1)
+    words = [os.urandom(8).hex().encode() for _ in range(512)]
+    with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zf:
+        for i in range(ENTRIES):
+            size = int(rng.paretovariate(1.2) * 4096)
+            data = b" ".join(rng.choice(words) for _ in range(min(size, 2_000_000) // 17 + 1))
+            zf.writestr(f"jdk/lib/p{i % 40}/f{i}.bin", data)
+        zf.writestr("jdk/lib/modules", b" ".join(rng.choice(words) for _ in range(4_000_000)))
+
+
+def measure(name: str, func, dest: Path):
+    shutil.rmtree(dest, ignore_errors=True)
+    started = time.perf_counter()
+    assert func()
+    return name, time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = Path(tmp) / "bench.zip"
+        make_archive(archive)
+        with zipfile.ZipFile(archive) as zf:
+            unpacked = sum(i.file_size for i in zf.infolist())
+        dest = Path(tmp) / "out"
+        results = [
+            measure("单进程 extract_with_rich", lambda: PythonZipUtils.extract_with_rich(str(archive), str(dest)), dest),
+            measure(f"并行 extract_parallel ({WORKERS} 进程)",
+                    lambda: PythonZipUtils.extract_parallel(str(archive), str(dest), workers=WORKERS), dest),
+        ]
+        print(f"\n{ENTRIES} 个条目，压缩包 {archive.stat().st_size / 1024 / 1024:.1f} MiB，"
+              f"解压后 {unpacked / 1024 / 1024:.1f} MiB")
+        for name, seconds in results:
+            print(f"{name:32} {seconds:7.2f} s")
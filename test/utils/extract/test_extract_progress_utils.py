@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_extract_progress_utils.py
+@Path : test/utils/extract
+@Author : Anfioo
+@Date : 2026/10/18 03:55
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import time
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from wing_utils.extract.extract_progress_utils import ExtractProgress
+from wing_utils.ui import console
+
+if __name__ == "__main__":
+    # 非终端模式：只按 PLAIN_INTERVAL 输出文字行，不使用 Rich Live
+    lines = []
+    original_print = console.print
+    console.print = lambda text, **kwargs: lines.append(text)
+    try:
+        progress = ExtractProgress("测试解压", total=100 * 1024 * 1024, interval=0, live=False)
+        progress.PLAIN_INTERVAL = 0.05
+        started = time.monotonic()
+        with progress:
+            for i in range(100):
+                progress.advance(1024 * 1024, f"lib/file{i}")
+                time.sleep(0.002)
+        elapsed = time.monotonic() - started
+    finally:
+        console.print = original_print
+
+    assert progress.written == 100 * 1024 * 1024 and progress.completed == progress.total
+    assert 1 <= len(lines) - 1 <= elapsed / 0.05 + 1, len(lines)
+    assert lines[-1].startswith("测试解压 100%") and "解压完成" in lines[-1], lines[-1]
+    print(f"✅ 非终端模式: 100 次更新只输出 {len(lines)} 行，最后一行: {lines[-1]}")
+
+    # 进度条位置与写出字节可以是不同单位 (流式 tar：压缩字节 / 解压后字节)
+    progress = ExtractProgress("测试解压", total=1000, live=False)
+    progress._started -= 2
+    progress.update(written=40 * 1024 * 1024, completed=250)
+    assert abs(progress.eta() - 6) < 0.1, progress.eta()
+    assert 19 < progress.throughput() / 1024 / 1024 < 21
+    print(f"✅ 吞吐量与剩余时间: {progress.stats()}")
+
+    # 终端模式下走 Rich Live，finish 不额外等待
+    started = time.monotonic()
+    with ExtractProgress("测试解压", total=10, live=True) as progress:
+        progress.advance(10, "bin/java")
+    assert time.monotonic() - started < 0.5
+    print("✅ Live 模式结束无固定等待")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_python_tar_utils.py
+@Path : test/utils/extract
+@Author : Anfioo
+@Date : 2026/10/18 03:10
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import io
+import os
+import tarfile
+import tempfile
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from wing_utils.extract.python_tar_utils import PythonTarUtils
+
+
+def make_tree(root: Path) -> dict:
+    """带子目录、符号链接和大文件的工具链目录，返回 相对路径 -> 内容"""
+    contents = {
+        "node-v20/bin/node": os.urandom(3 * 1024 * 1024),
+        "node-v20/lib/node_modules/npm/package.json": b'{"name": "npm"}',
+        "node-v20/README.md": b"# node\n" * 100,
+    }
+    for name, data in contents.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_bytes(data)
+    os.symlink("../lib/node_modules/npm/package.json", root / "node-v20/bin/npm")
+    return contents
+
+
+def run_link_fallback_case(tmp: Path):
+    """无法创建符号链接时 (Windows 未开启开发者模式) 退回复制已解压的目标，流模式不能回头 seek"""
+    archive = tmp / "npm.tar.gz"
+    script = b"require('../lib/cli.js')\n"
+    with tarfile.open(archive, "w:gz") as tf:
+        info = tarfile.TarInfo("node-v20/lib/cli.js")
+        info.size = len(script)
+        tf.addfile(info, io.BytesIO(script))
+        link = tarfile.TarInfo("node-v20/bin/npm")
+        link.type, link.linkname = tarfile.SYMTYPE, "../lib/cli.js"
+        tf.addfile(link)
+        hard = tarfile.TarInfo("node-v20/bin/npm-cli.js")
+        hard.type, hard.linkname = tarfile.LNKTYPE, "node-v20/lib/cli.js"
+        tf.addfile(hard)
+
+    def refuse(*args, **kwargs):
+        raise OSError("symbolic link privilege not held")
+
+    original = os.symlink
+    os.symlink = refuse
+    try:
+        dest = tmp / "npm_out"
+        assert PythonTarUtils.extract_with_rich(str(archive), str(dest)), "链接无法创建时应退回复制"
+        assert not os.path.islink(dest / "node-v20/bin/npm")
+        assert (dest / "node-v20/bin/npm").read_bytes() == script
+        assert (dest / "node-v20/bin/npm-cli.js").read_bytes() == script
+        # 流式安装使用的 tar 过滤器同样适用
+        with open(archive, "rb") as f:
+            PythonTarUtils.extract_stream(f, str(tmp / "npm_stream"))
+        assert (tmp / "npm_stream/node-v20/bin/npm").read_bytes() == script
+    finally:
+        os.symlink = original
+    print("✅ 符号链接无法创建时复制目标文件")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        source = tmp / "src"
+        contents = make_tree(source)
+
+        for suffix, mode in ((".tar", "w"), (".tar.gz", "w:gz"), (".tar.xz", "w:xz")):
+            archive = tmp / f"node{suffix}"
+            with tarfile.open(archive, mode) as tf:
+                tf.add(source / "node-v20", arcname="node-v20")
+
+            count = PythonTarUtils.count_members(str(archive))
+            assert count == (9 if suffix == ".tar" else None), (suffix, count)
+
+            dest = tmp / f"out{suffix}"
+            assert PythonTarUtils.extract_with_rich(str(archive), str(dest))
+            for name, data in contents.items():
+                assert (dest / name).read_bytes() == data, (suffix, name)
+            assert os.readlink(dest / "node-v20/bin/npm") == "../lib/node_modules/npm/package.json"
+            print(f"✅ {suffix}: 单遍流式解压内容一致，条目数 {count if count is not None else '未预先统计'}")
+
+        assert not PythonTarUtils.extract_with_rich(str(tmp / "src/node-v20/README.md"), str(tmp / "bad"))
+        print("✅ 损坏的 tar 返回 False")
+
+        run_link_fallback_case(tmp)
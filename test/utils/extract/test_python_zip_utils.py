@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_python_zip_utils.py
+@Path : test/utils/extract
+@Author : Anfioo
+@Date : 2026/10/18 02:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import os
+import random
+import tempfile
+import zipfile
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from wing_utils.extract.python_zip_utils import PythonZipUtils
+
+
+def make_archive(target: Path, count: int) -> dict:
+    """构造带目录、空文件、大文件和越界路径的 zip，返回 文件名 -> 内容"""
+    rng = random.Random(7)
+    contents = {}
+    with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("jdk-21/legal/", b"")
+        for i in range(count):
+            name = f"jdk-21/lib/pkg{i % 17}/file{i}.class"
+            data = bytes(rng.getrandbits(8) for _ in range(rng.randint(0, 64))) * rng.randint(1, 200)
+            zf.writestr(name, data)
+            contents[name] = data
+        big = os.urandom(1024) * 4096
+        zf.writestr("jdk-21/lib/modules", big)
+        contents["jdk-21/lib/modules"] = big
+        zf.writestr("../escape.txt", b"x")
+        contents["escape.txt"] = b"x"
+    return contents
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = Path(tmp) / "jdk.zip"
+        contents = make_archive(archive, 600)
+
+        with zipfile.ZipFile(archive) as zf:
+            files = [i for i in zf.infolist() if not i.is_dir()]
+        shares = PythonZipUtils.partition(files, 4)
+        assert sorted(i.filename for s in shares for i in s) == sorted(i.filename for i in files)
+        loads = [sum(i.compress_size for i in s) for s in shares]
+        assert max(loads) - min(loads) <= max(i.compress_size for i in files), loads
+
+        dest = Path(tmp) / "out"
+        assert PythonZipUtils.extract_parallel(str(archive), str(dest), workers=3)
+        for name, data in contents.items():
+            assert (dest / name).read_bytes() == data, name
+        assert (dest / "jdk-21" / "legal").is_dir()
+        assert not (Path(tmp) / "escape.txt").exists(), "越界路径应被清理到解压目录内"
+        print(f"✅ 并行解压: {len(contents)} 个文件内容一致，各进程负载 {[l // 1024 for l in loads]} KiB")
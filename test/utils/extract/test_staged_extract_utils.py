@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_staged_extract_utils.py
+@Path : test/utils/extract
+@Author : Anfioo
+@Date : 2026/10/18 04:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import os
+import tempfile
+import zipfile
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from wing_utils.extract.extract_archiver_utils import UniversalExtractor
+from wing_utils.extract.staged_extract_utils import StagedExtractUtils
+
+
+def make_zip(target: Path, files: dict):
+    with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in files.items():
+            zf.writestr(name, data)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        v1, v2 = tmp / "jdk-21.0.1.zip", tmp / "jdk-21.0.2.zip"
+        make_zip(v1, {"jdk-21/release": b'JAVA_VERSION="21.0.1"', "jdk-21/bin/java": b"v1"})
+        make_zip(v2, {"jdk-21/release": b'JAVA_VERSION="21.0.2"', "jdk-21/bin/javac": b"v2"})
+        dest = tmp / "extract" / "21"
+
+        # 首次解压：发布到目标目录，旁边写入完成标记，不留暂存目录
+        assert UniversalExtractor.extract(str(v1), str(dest), workers=1) == str(dest)
+        assert (dest / "jdk-21/bin/java").read_bytes() == b"v1"
+        assert os.path.exists(StagedExtractUtils.marker_path(str(dest)))
+        assert sorted(os.listdir(dest.parent)) == ["21", "21.extracted"], os.listdir(dest.parent)
+        print("✅ 暂存解压后原子发布，并写入完成标记")
+
+        # 同一压缩包再次解压：凭标记跳过 (手动放入的文件仍在，说明没有重新解压)
+        (dest / "jdk-21/lib").mkdir()
+        assert UniversalExtractor.extract(str(v1), str(dest), workers=1) == str(dest)
+        assert (dest / "jdk-21/lib").is_dir()
+        print("✅ 摘要一致时跳过解压")
+
+        # 解压中断 (Ctrl-C)：目标目录保持旧的完整内容，暂存目录被清理
+        try:
+            with StagedExtractUtils.staging(str(dest)) as stage:
+                Path(stage, "half").write_bytes(b"x")
+                raise KeyboardInterrupt
+        except KeyboardInterrupt:
+            pass
+        assert not os.path.exists(StagedExtractUtils.stage_path(str(dest)))
+        assert (dest / "jdk-21/bin/java").read_bytes() == b"v1"
+        print("✅ 中断后目标目录不受影响，暂存目录已清理")
+
+        # 换一个压缩包：整体替换目标目录，旧文件不会残留
+        assert UniversalExtractor.extract(str(v2), str(dest), workers=1) == str(dest)
+        assert (dest / "jdk-21/bin/javac").read_bytes() == b"v2"
+        assert not (dest / "jdk-21/bin/java").exists()
+        assert StagedExtractUtils.is_complete(str(dest), None) is False
+        assert sorted(os.listdir(dest.parent)) == ["21", "21.extracted"], os.listdir(dest.parent)
+        print("✅ 不同压缩包整体替换目标目录")
+
+        # 解压失败：不发布、不留暂存目录
+        broken = tmp / "broken.zip"
+        broken.write_bytes(b"not a zip")
+        assert UniversalExtractor.extract(str(broken), str(tmp / "extract" / "broken"), workers=1) is None
+        assert sorted(os.listdir(dest.parent)) == ["21", "21.extracted"], os.listdir(dest.parent)
+        print("✅ 解压失败时不发布任何内容")
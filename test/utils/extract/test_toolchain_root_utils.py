@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : test_toolchain_root_utils.py
+@Path : test/utils/extract
+@Author : Anfioo
+@Date : 2026/10/18 05:20
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import io
+import os
+import tarfile
+import tempfile
+import zipfile
+from sys import path
+from pathlib import Path
+
+# 设置项目根目录到 sys.path
+project_root = Path(__file__).parent.parent.parent.parent
+path.insert(0, str(project_root))
+
+from wing_utils.extract.python_tar_utils import PythonTarUtils
+from wing_utils.extract.staged_extract_utils import StagedExtractUtils
+from wing_utils.extract.toolchain_root_utils import ToolchainRootUtils
+
+if __name__ == "__main__":
+    cases = [
+        # (条目, 工具, 期望的根目录)
+        (["jdk-21.0.2/", "jdk-21.0.2/release", "jdk-21.0.2/bin/java.exe", "jdk-21.0.2/lib/modules"], "jdk",
+         "jdk-21.0.2"),
+        (["./jdk-21.0.2.jdk/Contents/Info.plist", "./jdk-21.0.2.jdk/Contents/Home/release",
+          "./jdk-21.0.2.jdk/Contents/Home/bin/java"], "jdk", "jdk-21.0.2.jdk/Contents/Home"),
+        # JDK 8 自带的 jre 也有 bin/java，但没有 release
+        (["jdk1.8.0_402/release", "jdk1.8.0_402/bin/java", "jdk1.8.0_402/jre/bin/java"], "jdk", "jdk1.8.0_402"),
+        (["release", "bin/java", "lib/modules"], "jdk", ""),
+        (["node-v20.11.1-win-x64/node.exe", "node-v20.11.1-win-x64/npm.cmd"], "node", "node-v20.11.1-win-x64"),
+        (["node-v20.11.1-linux-x64/bin/node", "node-v20.11.1-linux-x64/lib/node_modules/npm/bin/npm-cli.js"],
+         "node", "node-v20.11.1-linux-x64"),
+        (["go/bin/go", "go/bin/gofmt", "go/pkg/tool/linux_amd64/vet"], "go", "go"),
+        (["apache-maven-3.9.6/bin/mvn", "apache-maven-3.9.6/bin/mvn.cmd", "apache-maven-3.9.6/conf/settings.xml"],
+         "maven", "apache-maven-3.9.6"),
+        (["cmake-3.28.1-macos-universal/CMake.app/Contents/bin/cmake"], "cmake",
+         "cmake-3.28.1-macos-universal/CMake.app/Contents"),
+        # 不指定工具时尝试全部标记
+        (["apache-maven-3.9.6/bin/mvn"], None, "apache-maven-3.9.6"),
+        # 歧义：两个并列的 JDK；没有任何标记
+        (["a/release", "a/bin/java", "b/release", "b/bin/java"], "jdk", None),
+        (["jdk/readme.txt", "jdk/lib/modules"], "jdk", None),
+        # 没有定义标记的工具只剥掉单一顶层目录
+        (["miniconda/", "miniconda/a/b.txt", "miniconda/c.txt"], "conda", "miniconda"),
+        (["a.txt", "b/c.txt"], "conda", None),
+    ]
+    for names, kind, expected in cases:
+        actual = ToolchainRootUtils.detect(names, kind)
+        assert actual == expected, (names, kind, actual)
+    print(f"✅ 根目录识别: {len(cases)} 个用例")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        archive = tmp / "jdk.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("jdk-21/release", b"")
+            zf.writestr("jdk-21/bin/java", b"")
+        (tmp / "out/jdk-21/bin").mkdir(parents=True)
+        assert ToolchainRootUtils.find_home(str(archive), str(tmp / "out"), "jdk") == str(tmp / "out/jdk-21")
+
+        archive = tmp / "go.tar.gz"
+        with tarfile.open(archive, "w:gz") as tf:
+            for name in ("go/bin/go", "go/VERSION"):
+                info = tarfile.TarInfo(name)
+                tf.addfile(info, io.BytesIO(b""))
+        # tar 不再单独读一遍头部，条目名在解压时收集
+        assert ToolchainRootUtils.list_members(str(archive)) is None
+        names = []
+        assert PythonTarUtils.extract_with_rich(str(archive), str(tmp / "go_out"), names=names)
+        assert names == ["go/bin/go", "go/VERSION"], names
+        assert ToolchainRootUtils.find_home(str(archive), str(tmp / "go_out"), "go", names) == str(tmp / "go_out/go")
+        assert ToolchainRootUtils.find_home(str(archive), str(tmp / "go_out"), "go") is None
+        # 解压目录中不存在识别出的路径时不返回
+        assert ToolchainRootUtils.find_home(str(archive), str(tmp / "missing"), "go", names) is None
+
+        # 条目名随完成标记保存，跳过解压时仍可识别
+        stage = tmp / "stage"
+        (stage / "go/bin").mkdir(parents=True)
+        StagedExtractUtils.publish(str(stage), str(tmp / "published"), "ab" * 32, str(archive), names)
+        assert StagedExtractUtils.members(str(tmp / "published")) == names
+        print("✅ 从 zip 中央目录 / 解压时收集的 tar 条目名定位解压后的根目录")
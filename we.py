@@ -1,4 +1,6 @@
+import multiprocessing
 import sys
+from pathlib import Path
 
 
 def cmd_help(args):
@@ -20,6 +22,10 @@ def cmd_help(args):
                 {"命令": "qr", "描述": "生成并展示支付宝、微信收款二维码"},
                 {"命令": "themes", "描述": "主题配置管理工具（交互式/命令式）"},
                 {"命令": "jdk", "描述": "JDK 环境管理工具（交互式/命令式）"},
+                {"命令": "mirror", "描述": "局域网镜像代理：serve 启动 / use <地址> 使用 / off 关闭"},
+                {"命令": "search", "描述": "搜索本地安装包目录，例如 we search node 20 linux x64"},
+                {"命令": "catalog", "描述": "安装包目录：refresh 并发预取全部版本数据 / status 查看状态"},
+                {"命令": "bundle", "描述": "离线包：export 导出 / import 导入并进入离线模式 / off 退出 / status"},
             ]
 
             # 使用 RichWingUI 打印表格
@@ -33,6 +39,7 @@ def cmd_help(args):
             # 添加使用说明
             rich_ui.print_info("使用方法: we <命令> [参数]", title="使用说明")
             rich_ui.print_info("示例: we info  # 查看项目信息", title="示例")
+            rich_ui.print_info("任意命令加 --offline <离线包> 只从离线包读取数据，不联网", title="离线模式")
         else:
             print("初始化失败")
     else:
@@ -94,6 +101,250 @@ def cmd_run_jdk(args):
         cli.execute_argv(args)
 
 
+def cmd_run_mirror(args):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="we mirror", description="局域网镜像缓存代理")
+    sub = parser.add_subparsers(dest="action", required=True)
+    serve = sub.add_parser("serve", help="启动缓存代理")
+    serve.add_argument("--host", default="127.0.0.1", help="监听地址，局域网共享时使用 0.0.0.0")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--allow", default="", help="额外允许代理的上游主机，逗号分隔 (已知的数据源与下载主机默认允许)")
+    serve.add_argument("--allow-any", action="store_true", help="允许代理任意上游主机 (开放转发，仅用于可信网络)")
+    use = sub.add_parser("use", help="让本机的检索与下载经过代理")
+    use.add_argument("url", help="例如 http://192.168.1.10:8765")
+    sub.add_parser("off", help="恢复直连")
+    sub.add_parser("status", help="查看当前配置")
+    try:
+        options = parser.parse_args(args)
+    except SystemExit:
+        return
+
+    from loader import DownloadsManager
+    from loader.ini.bandwidth_manager import BandwidthManager
+    from loader.ini.mirror_proxy_manager import MirrorProxyManager
+
+    manager = MirrorProxyManager()
+    if options.action == "serve":
+        # 共享的办公室出口：代理回源同样受 [user] 限速约束
+        BandwidthManager().apply()
+        from install.catalog import CatalogRefresher
+        from wing_utils.download.mirror_proxy_server import MirrorProxyServer
+
+        allowed = CatalogRefresher().upstream_hosts() | {h.strip() for h in options.allow.split(",") if h.strip()}
+        MirrorProxyServer(DownloadsManager().get_blob_store(), options.host, options.port, allowed,
+                          allow_any=options.allow_any).serve_forever()
+    elif options.action == "use":
+        manager.set_proxy_url(options.url)
+        print(f"✅ 已使用镜像代理: {manager.get_proxy_url()}")
+    elif options.action == "off":
+        manager.set_proxy_url(None)
+        print("✅ 已恢复直连")
+    else:
+        print(f"当前镜像代理: {manager.get_proxy_url() or '未使用'}")
+
+
+def cmd_run_search(args):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(prog="we search", description="在本地安装包目录中搜索",
+                                     epilog='示例: we search node 20 linux x64 / we search jdk ">=17 <22" lts linux aarch64 latest')
+    parser.add_argument("tool", help="jdk / node / go / maven / cmake / miniconda")
+    parser.add_argument("terms", nargs="*", help="版本或版本范围 (>=17 <22)、系统、架构，以及关键字 lts / latest")
+    parser.add_argument("--kind", help="包格式，例如 zip / tar.gz / msi")
+    parser.add_argument("--vendor", help="发行方 (部分匹配)")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--refresh", action="store_true", help="先同步刷新该工具的数据")
+    try:
+        options = parser.parse_args(args)
+    except SystemExit:
+        return
+
+    from rich.table import Table
+    from install.catalog import CatalogRefresher, CatalogStore
+    from install.catalog.catalog_store import TOOL_ALIASES
+    from wing_utils.download.rate_limit_utils import DownloadPriority
+    from wing_utils.ui import console
+
+    tool = TOOL_ALIASES.get(options.tool.lower())
+    if tool is None:
+        print(f"❌ 未知工具: {options.tool}")
+        return
+    refresher = CatalogRefresher(CatalogStore())
+    if options.refresh or tool in refresher.stale_tools([tool], max_age=float("inf")):
+        # 从未收录过的工具只能先同步拉取
+        error = refresher.refresh([tool], priority=DownloadPriority.INTERACTIVE)[tool]
+        if error is not None:
+            print(f"❌ 刷新 {tool} 数据失败: {error}")
+    else:
+        refresher.refresh_in_background([tool])
+
+    start = time.perf_counter()
+    try:
+        records = refresher.store.search(tool, kind=options.kind, vendor=options.vendor, limit=options.limit,
+                                         **CatalogStore.parse_query(options.terms))
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    elapsed = (time.perf_counter() - start) * 1000
+
+    table = Table(title=f"{tool} ({len(records)} 条，{elapsed:.1f} ms)")
+    for column in ("厂商", "版本", "系统", "架构", "格式", "大小", "下载地址"):
+        table.add_column(column, overflow="fold" if column == "下载地址" else None)
+    for r in records:
+        size = f"{r.size / 1024 / 1024:.1f} MiB" if r.size else "-"
+        version = f"{r.version} [LTS]" if r.lts else r.version
+        table.add_row(r.vendor, version, r.os, r.arch, r.kind, size, r.url)
+    console.print(table)
+    if not records:
+        print("没有匹配的安装包，可以加 --refresh 重新拉取数据")
+    # 后台刷新在结果输出之后继续，等它写完再退出
+    CatalogRefresher.wait()
+
+
+def cmd_run_catalog(args):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(prog="we catalog", description="安装包目录与版本数据缓存")
+    sub = parser.add_subparsers(dest="action", required=True)
+    refresh = sub.add_parser("refresh", help="并发预取全部版本数据并更新本地目录 (可放入 cron / systemd timer)")
+    refresh.add_argument("--workers", type=int, default=8, help="同时进行的请求数")
+    refresh.add_argument("--ttl", type=float, default=0, help="未超过该秒数的缓存不联网，默认全部重新验证")
+    sub.add_parser("status", help="查看各工具的收录条数与刷新时间")
+    try:
+        options = parser.parse_args(args)
+    except SystemExit:
+        return
+
+    from install.catalog import CatalogPrefetcher, CatalogRefresher, CatalogStore
+    from loader.ini.bandwidth_manager import BandwidthManager
+
+    BandwidthManager().apply()
+    store = CatalogStore()
+    if options.action == "status":
+        now = time.time()
+        for tool, source in sorted(store.sources().items()):
+            age = (now - source["refreshed_at"]) / 60
+            print(f"{tool:<10} {source['count']:>6} 条  {age:>7.0f} 分钟前  {source['origin'] or ''}")
+        return
+
+    def report(r):
+        status = "✅" if r.ok else f"❌ {r.error}"
+        print(f"{r.name:<36} {r.seconds * 1000:>8.0f} ms  {status}")
+
+    start = time.perf_counter()
+    reports = CatalogPrefetcher(options.workers, options.ttl).run(on_report=report)
+    # 数据源刚刚验证过，目录直接从缓存文件重建，不再联网；全部失败的工具保留旧数据
+    refresher = CatalogRefresher(store)
+    errors = refresher.refresh(sorted({r.tool for r in reports if r.ok}))
+    for tool, error in errors.items():
+        if error is not None:
+            print(f"❌ 更新目录 {tool} 失败: {error}")
+        else:
+            d = refresher.deltas[tool]
+            print(f"{tool:<10} 新增 {d.inserted}  更新 {d.updated}  删除 {d.deleted}  共 {d.total} 条")
+    failed = [r for r in reports if not r.ok]
+    print(f"共 {len(reports)} 个数据源，失败 {len(failed)} 个，总耗时 {time.perf_counter() - start:.2f} s")
+    if failed:
+        sys.exit(1)
+
+
+def cmd_run_bundle(args):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="we bundle", description="离线包：目录记录 + 安装包 + 版本数据源")
+    sub = parser.add_subparsers(dest="action", required=True)
+    export = sub.add_parser("export", help="导出离线包 (在能联网的机器上执行)",
+                            epilog='示例: we bundle export ci.webundle -s "jdk 21 linux x64" -s "node 20 lts linux x64"')
+    export.add_argument("output", help="输出文件")
+    export.add_argument("-s", "--select", action="append", required=True,
+                        help="要打包的安装包，语法同 we search，可重复")
+    export.add_argument("--kind", help="包格式，例如 zip / tar.gz")
+    export.add_argument("--limit", type=int, default=1, help="每个 --select 最多打包的安装包数 (从新到旧)")
+    export.add_argument("--no-download", action="store_true", help="只打包下载仓库中已有的安装包")
+    export.add_argument("--refresh", action="store_true", help="先预取全部版本数据源")
+    imp = sub.add_parser("import", help="导入离线包并进入离线模式")
+    imp.add_argument("bundle", help="离线包文件")
+    sub.add_parser("off", help="退出离线模式")
+    sub.add_parser("status", help="查看当前离线包")
+    try:
+        options = parser.parse_args(args)
+    except SystemExit:
+        return
+
+    from loader import DownloadsManager
+    from loader.ini.bandwidth_manager import BandwidthManager
+    from loader.ini.offline_bundle_manager import OfflineBundleManager
+    from install.catalog import CatalogBundler, CatalogPrefetcher, CatalogRefresher
+    from wing_utils.download.offline_bundle_utils import OfflineBundle
+
+    BandwidthManager().apply()
+    manager = OfflineBundleManager()
+    if options.action == "export":
+        downloads = DownloadsManager()
+        bundler = CatalogBundler(blob_store=downloads.get_blob_store(),
+                                 downloads_dir=downloads.get_current_downloads_dir())
+        if options.refresh:
+            reports = CatalogPrefetcher().run()
+            CatalogRefresher(bundler.store).refresh(sorted({r.tool for r in reports if r.ok}))
+        try:
+            records = bundler.select(options.select, kind=options.kind, limit=options.limit)
+            count = bundler.export(options.output, records, download_missing=not options.no_download,
+                                   on_record=lambda r, _: print(f"  {r.tool} {r.vendor} {r.version} {r.os}/{r.arch} {r.kind}"))
+        except (ValueError, OSError) as e:
+            # OSError 包括 FileNotFoundError 与校验失败的 ChecksumMismatchError
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"✅ 已导出 {options.output}: {len(records)} 个安装包，共 {count} 个文件")
+    elif options.action == "import":
+        bundler = CatalogBundler()
+        errors = bundler.import_bundle(options.bundle, manager.get_bundles_dir())
+        manager.set_bundle_path(manager.get_bundles_dir() / Path(options.bundle).name)
+        for tool, error in errors.items():
+            print(f"{tool:<10} {'✅' if error is None else f'— 离线包中没有数据 ({error})'}")
+        print(f"✅ 已进入离线模式: {manager.get_bundle_path()}")
+    elif options.action == "off":
+        manager.set_bundle_path(None)
+        print("✅ 已退出离线模式")
+    else:
+        path = manager.get_bundle_path()
+        if not path:
+            print("当前未使用离线包")
+            return
+        bundle = OfflineBundle(path)
+        artifacts = [e for e in bundle.entries.values() if e.kind == "artifact"]
+        print(f"当前离线包: {path}")
+        print(f"数据源 {len(bundle.entries) - len(artifacts)} 个，安装包 {len(artifacts)} 个")
+        for record in bundle.records:
+            print(f"  {record['tool']} {record['vendor']} {record['version']} {record['os']}/{record['arch']} {record['kind']}")
+        bundle.close()
+
+
+def apply_offline(args):
+    """
+    处理全局参数 --offline <离线包>，并按配置启用离线模式
+    :return: 去掉 --offline 之后的参数
+    """
+    offline = None
+    if "--offline" in args:
+        i = args.index("--offline")
+        if i + 1 >= len(args):
+            print("❌ --offline 需要离线包路径")
+            sys.exit(1)
+        offline = args[i + 1]
+        args = args[:i] + args[i + 2:]
+
+    from loader.ini.offline_bundle_manager import OfflineBundleManager
+    from wing_utils.download.offline_bundle_utils import OfflineBundleUtils
+
+    if offline:
+        OfflineBundleUtils.enable(Path(offline).expanduser())
+    OfflineBundleManager().apply()
+    return args
+
+
 def cmd_build(args):
     if not args:
         print("❌ build 需要参数: dev / prod")
@@ -189,9 +440,16 @@ COMMANDS = {
     "qr": qr,
     "themes": cmd_run_themes,
     "jdk": cmd_run_jdk,
+    "mirror": cmd_run_mirror,
+    "search": cmd_run_search,
+    "catalog": cmd_run_catalog,
+    "bundle": cmd_run_bundle,
     "init": init
 }
 
+# 会访问网络的命令，支持 --offline
+ONLINE_COMMANDS = {"jdk", "search", "catalog", "bundle"}
+
 
 def main():
     if len(sys.argv) < 2:
@@ -207,8 +465,12 @@ def main():
         cmd_help([])
         return
 
+    if command in ONLINE_COMMANDS:
+        args = apply_offline(args)
     COMMANDS[command](args)
 
 
 if __name__ == "__main__":
+    # 打包为单文件 exe 时，并行解压的子进程从这里启动，必须先交给 multiprocessing 处理
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : html_listing_utils.py
+@Path : wing_utils/common
+@Author : Anfioo
+@Date : 2026/10/18 00:20
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Iterable, Iterator, List, Optional
+
+# 单元格内容的识别顺序：摘要 > 日期 > 大小
+_CHECKSUM = re.compile(r"^[0-9a-fA-F]{32,128}$")
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}|\d{1,2}-[A-Za-z]{3}-\d{4}")
+_SIZE = re.compile(r"^\d+(?:\.\d+)?\s*(?:[KMGT]i?B?|B|bytes)?$", re.IGNORECASE)
+
+
+@dataclass
+class ListingRow:
+    """
+    目录页面中的一行
+    href: 链接地址；name: 链接文字
+    size / date / checksum: 按内容识别出的大小、修改时间、摘要，没有时为 None
+    cells: 表格各单元格的文字 (<pre> 格式的页面为链接之后按空白拆开的各段)
+    """
+    href: str
+    name: str
+    size: Optional[str] = None
+    date: Optional[str] = None
+    checksum: Optional[str] = None
+    cells: List[str] = field(default_factory=list)
+
+
+class HtmlListingParser(HTMLParser):
+    """
+    Apache / nginx 风格目录页面的增量解析器
+
+    只关心 <a href>、<tr>/<td> 与 <pre> 中的文字，不建文档树；
+    通过 feed() 分块喂入，每个完整的行立即放入 rows，可一边接收响应一边取出。
+    表格之外的链接 (例如 <pre> 列表或普通页面) 各自成为一行。
+    排序链接 (?C=N;O=D) 与页内锚点会被忽略。
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: List[ListingRow] = []
+        self._in_row = False
+        self._in_cell = False
+        self._in_pre = False
+        self._cells: List[str] = []
+        self._cell_text: List[str] = []
+        self._href: Optional[str] = None
+        self._anchor_text: Optional[List[str]] = None
+        self._name: Optional[str] = None
+        self._row_href: Optional[str] = None
+        self._tail: List[str] = []
+
+    # =========================
+    # HTMLParser 回调
+    # =========================
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href and not href.startswith(("?", "#")):
+                self._flush_pre()
+                self._href, self._anchor_text = href, []
+        elif tag == "tr":
+            self._end_row()
+            self._in_row, self._cells, self._row_href, self._name = True, [], None, None
+        elif tag in ("td", "th") and self._in_row:
+            self._end_cell()
+            self._in_cell, self._cell_text = True, []
+        elif tag == "pre":
+            self._in_pre = True
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self._anchor_text is not None:
+            name = "".join(self._anchor_text).strip()
+            if self._in_row:
+                # 一行中只取第一个文件链接
+                if self._row_href is None:
+                    self._row_href, self._name = self._href, name
+            else:
+                self._row_href, self._name, self._tail = self._href, name, []
+                if not self._in_pre:
+                    self._emit(self._row_href, self._name, [])
+                    self._row_href = None
+            self._href, self._anchor_text = None, None
+        elif tag in ("td", "th"):
+            self._end_cell()
+        elif tag == "tr":
+            self._end_row()
+        elif tag == "pre":
+            self._flush_pre()
+            self._in_pre = False
+        elif tag == "table":
+            self._end_row()
+
+    def handle_data(self, data):
+        if self._anchor_text is not None:
+            self._anchor_text.append(data)
+        if self._in_cell:
+            self._cell_text.append(data)
+        elif self._in_pre and self._row_href is not None and self._anchor_text is None:
+            # <pre> 列表中链接后面到换行为止是这一项的日期与大小
+            line, newline, _ = data.partition("\n")
+            self._tail.append(line)
+            if newline:
+                self._flush_pre()
+
+    def close(self):
+        super().close()
+        self._end_row()
+        self._flush_pre()
+
+    # =========================
+    # 行的收尾
+    # =========================
+
+    def _end_cell(self):
+        if self._in_cell:
+            self._cells.append("".join(self._cell_text).strip())
+            self._in_cell, self._cell_text = False, []
+
+    def _end_row(self):
+        if not self._in_row:
+            return
+        self._end_cell()
+        self._in_row = False
+        if self._row_href is not None:
+            self._emit(self._row_href, self._name or "", self._cells)
+        self._row_href, self._name, self._cells = None, None, []
+
+    def _flush_pre(self):
+        if self._in_pre and self._row_href is not None:
+            self._emit(self._row_href, self._name or "", "".join(self._tail).split())
+            self._row_href, self._name, self._tail = None, None, []
+
+    def _emit(self, href: str, name: str, cells: List[str]):
+        row = ListingRow(href=href, name=name, cells=cells)
+        # <pre> 格式的日期与时间是两段，合并后再识别
+        for i, cell in enumerate(cells):
+            if row.checksum is None and _CHECKSUM.match(cell):
+                row.checksum = cell
+            elif row.date is None and _DATE.search(cell):
+                row.date = cell
+                if ":" not in cell and i + 1 < len(cells) and ":" in cells[i + 1]:
+                    row.date = f"{cell} {cells[i + 1]}"
+            elif row.size is None and _SIZE.match(cell) and ":" not in cell:
+                row.size = cell
+        self.rows.append(row)
+
+
+class HtmlListingUtils:
+    """目录页面解析的入口"""
+
+    @staticmethod
+    def iter_rows(chunks: Iterable[str]) -> Iterator[ListingRow]:
+        """
+        逐块解析，每收到一块就产出其中已完整的行
+        :param chunks: 页面文本块 (例如 response.iter_content(decode_unicode=True))
+        """
+        parser = HtmlListingParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+            if parser.rows:
+                yield from parser.rows
+                parser.rows.clear()
+        parser.close()
+        yield from parser.rows
+
+    @staticmethod
+    def parse(html: str, chunk_size: int = 64 * 1024) -> List[ListingRow]:
+        """
+        解析完整的页面 (例如缓存文件)
+        :param chunk_size: 分块大小，避免一次性把超大页面交给解析器
+        """
+        return list(HtmlListingUtils.iter_rows(html[i:i + chunk_size] for i in range(0, len(html), chunk_size)))
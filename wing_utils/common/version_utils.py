@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : version_utils.py
+@Path : wing_utils/common
+@Author : Anfioo
+@Date : 2026/10/17 23:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Tuple
+
+# 排序键中保留的版本号段数
+RELEASE_PARTS = 5
+# 限定词的先后顺序：下界哨兵 < alpha < beta/ea < milestone < rc < snapshot < 正式版 < sp 及其它
+FLOOR = 0
+QUALIFIER_RANKS = {
+    "alpha": 1, "a": 1,
+    "beta": 2, "b": 2, "ea": 2, "preview": 2,
+    "milestone": 3, "m": 3,
+    "rc": 4, "cr": 4,
+    "snapshot": 5,
+    "": 6, "ga": 6, "final": 6, "release": 6,
+}
+RELEASE = 6
+OTHER = 7
+
+VersionKey = Tuple[int, ...]
+
+_PREFIX = re.compile(r"^(?:v|go|jdk-?|java-?)(?=\d)", re.IGNORECASE)
+# 旧式 Java 版本 1.8.0_392 -> 8.0.392
+_LEGACY_JAVA = re.compile(r"^1\.(\d+)\.(\d+)_(\d+)")
+_RELEASE = re.compile(r"\d+(?:\.\d+)*")
+_BUILD = re.compile(r"\+(\d+)")
+_QUALIFIER = re.compile(r"[-._]?([A-Za-z]+)[-._]?(\d*)")
+_POST_RELEASE = re.compile(r"[-._](\d+)")
+_COMPARATOR = re.compile(r"^(>=|<=|==|!=|>|<|=)?\s*(.+)$")
+
+
+@lru_cache(maxsize=None)
+def _parse(version: str) -> VersionKey:
+    text = _PREFIX.sub("", version.strip())
+    legacy = _LEGACY_JAVA.match(text)
+    if legacy:
+        release = [int(n) for n in legacy.groups()]
+        rest = text[legacy.end():]
+        # 1.8.0_392-b08 中的 b08 是构建号而不是 beta
+        java_build = re.fullmatch(r"-b(\d+)", rest)
+        if java_build:
+            return tuple((release + [0] * RELEASE_PARTS)[:RELEASE_PARTS]) + (RELEASE, 0, int(java_build.group(1)))
+    else:
+        match = _RELEASE.match(text)
+        release = [int(n) for n in match.group(0).split(".")] if match else []
+        rest = text[match.end():] if match else text
+
+    build = 0
+    build_match = _BUILD.search(rest)
+    if build_match:
+        build = int(build_match.group(1))
+        rest = rest[:build_match.start()]
+
+    rank, number = RELEASE, 0
+    qualifier = _QUALIFIER.match(rest)
+    if qualifier:
+        rank = QUALIFIER_RANKS.get(qualifier.group(1).lower(), OTHER)
+        number = int(qualifier.group(2) or 0)
+    else:
+        post = _POST_RELEASE.match(rest)
+        if post:
+            # 17.0.8-1、Miniconda 的 23.11.0-2：正式版之后的构建号
+            build = int(post.group(1))
+    return tuple((release + [0] * RELEASE_PARTS)[:RELEASE_PARTS]) + (rank, number, build)
+
+
+@lru_cache(maxsize=None)
+def _encode(key: VersionKey) -> str:
+    release = ".".join(f"{min(n, 99999):05d}" for n in key[:RELEASE_PARTS])
+    rank, number, build = key[RELEASE_PARTS:]
+    return f"{release}.{rank}.{min(number, 99999):05d}.{min(build, 99999):05d}"
+
+
+def _release_prefix(text: str) -> List[int]:
+    match = _RELEASE.match(_PREFIX.sub("", text.strip()))
+    if not match:
+        raise ValueError(f"无法识别的版本: {text}")
+    return [int(n) for n in match.group(0).split(".")][:RELEASE_PARTS]
+
+
+def _floor(release: List[int]) -> VersionKey:
+    """某个版本号前缀的最小排序键 (比它的所有预发布版都小)"""
+    return tuple((release + [0] * RELEASE_PARTS)[:RELEASE_PARTS]) + (FLOOR, 0, 0)
+
+
+def _next_prefix(release: List[int]) -> List[int]:
+    """17 -> 18，17.0 -> 17.1"""
+    return release[:-1] + [release[-1] + 1]
+
+
+@dataclass
+class VersionSpec:
+    """
+    版本范围：所有条件化为 [lower, upper) 区间，可直接在已排序的键上二分，也可换成 SQL 区间条件
+    excludes: != 排除的区间
+    lts: 只要 LTS 版本；latest: 只要最新的一个正式版
+    """
+    lower: Optional[VersionKey] = None
+    upper: Optional[VersionKey] = None
+    excludes: List[Tuple[VersionKey, VersionKey]] = field(default_factory=list)
+    lts: bool = False
+    latest: bool = False
+
+    def contains_key(self, key: VersionKey) -> bool:
+        if self.lower is not None and key < self.lower:
+            return False
+        if self.upper is not None and key >= self.upper:
+            return False
+        return not any(lo <= key < hi for lo, hi in self.excludes)
+
+    def matches(self, version: str, is_lts: Optional[Callable[[str], bool]] = None) -> bool:
+        """
+        :param is_lts: 判断 LTS 的函数，规格中含 lts 时必须提供
+        """
+        key = VersionUtils.key(version)
+        if not self.contains_key(key):
+            return False
+        if self.latest and key[RELEASE_PARTS] != RELEASE:
+            return False
+        if self.lts and not (is_lts or VersionUtils.is_lts_label)(version):
+            return False
+        return True
+
+
+class VersionIndex:
+    """
+    一组版本的排序索引：排序键只在构建时计算一次，之后的排序与范围查询都不再解析版本字符串
+    """
+
+    def __init__(self, versions: Iterable[str]):
+        entries = sorted((VersionUtils.key(v), v) for v in set(versions))
+        self._keys = [k for k, _ in entries]
+        self._versions = [v for _, v in entries]
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def newest_first(self) -> List[str]:
+        return self._versions[::-1]
+
+    def select(self, spec: "str | VersionSpec", is_lts: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """
+        按规格筛选，从新到旧
+        :param spec: 例如 ">=17 <22"、"21"、"lts"、"latest"、"20 lts"
+        :param is_lts: 判断 LTS 的函数
+        """
+        if isinstance(spec, str):
+            spec = VersionUtils.parse_spec(spec)
+        start = bisect_left(self._keys, spec.lower) if spec.lower is not None else 0
+        end = bisect_left(self._keys, spec.upper) if spec.upper is not None else len(self._keys)
+        found = []
+        for i in range(end - 1, start - 1, -1):
+            key, version = self._keys[i], self._versions[i]
+            if any(lo <= key < hi for lo, hi in spec.excludes):
+                continue
+            if spec.latest and key[RELEASE_PARTS] != RELEASE:
+                continue
+            if spec.lts and not (is_lts or VersionUtils.is_lts_label)(version):
+                continue
+            found.append(version)
+            if spec.latest:
+                break
+        return found
+
+    def latest(self, spec: "str | VersionSpec" = "", is_lts: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        found = self.select(spec, is_lts)
+        return found[0] if found else None
+
+
+class VersionUtils:
+    """
+    各工具版本号的统一解析与排序
+
+    支持 JDK (17.0.8+7、21-ea、1.8.0_392)、Node (v20.11.1)、Go (go1.22.3、go1.22rc1)、
+    Maven (3.9.6、4.0.0-rc-2、3.9.0-SNAPSHOT)、CMake 目录 (v3.28)、Miniconda (23.11.0-2)。
+    解析结果带缓存，同一字符串只解析一次。
+    """
+
+    @staticmethod
+    def key(version: str) -> VersionKey:
+        """
+        可直接比较的排序键：(5 段版本号, 限定词等级, 限定词序号, 构建号)
+        """
+        return _parse(version)
+
+    @staticmethod
+    def sort(versions: Iterable[str], reverse: bool = True) -> List[str]:
+        """按版本排序，默认从新到旧"""
+        return sorted(versions, key=_parse, reverse=reverse)
+
+    @staticmethod
+    def is_prerelease(version: str) -> bool:
+        return _parse(version)[RELEASE_PARTS] < RELEASE
+
+    @staticmethod
+    def is_java_lts(version: str) -> bool:
+        """8、11，以及 17 起每隔 4 个大版本 (17、21、25 ...) 为 LTS"""
+        major = _parse(version)[0]
+        return major in (8, 11) or (major >= 17 and (major - 17) % 4 == 0)
+
+    @staticmethod
+    def is_lts_label(option: str) -> bool:
+        """选项文本中带 LTS 标注 (例如 Node 的 "v20.11.0 [LTS: Iron]")"""
+        return "LTS" in option.upper()
+
+    @staticmethod
+    def encode(key: VersionKey) -> str:
+        """排序键转为定长字符串，字符串顺序与键的顺序一致 (用于 SQLite 索引)"""
+        return _encode(key)
+
+    @staticmethod
+    def parse_spec(spec: str) -> VersionSpec:
+        """
+        解析版本规格，条件之间为 "且" 的关系 (空格或逗号分隔)
+        不完整的版本号按前缀处理：>=17 包含 17 的所有版本，<22 不含 22 的预发布版，<=21 包含 21.x.x
+        :param spec: 例如 ">=17 <22"、"21"、"!=18"、"lts"、"latest"
+        :raises ValueError: 无法识别的条件
+        """
+        result = VersionSpec()
+        for token in re.split(r"[\s,]+", spec.strip()):
+            if not token:
+                continue
+            word = token.lower()
+            if word == "lts":
+                result.lts = True
+                continue
+            if word == "latest":
+                result.latest = True
+                continue
+            op, text = _COMPARATOR.match(token).groups()
+            release = _release_prefix(text)
+            lo, hi = _floor(release), _floor(_next_prefix(release))
+            if op == ">=":
+                result.lower = max(result.lower or lo, lo)
+            elif op == ">":
+                result.lower = max(result.lower or hi, hi)
+            elif op == "<":
+                result.upper = min(result.upper or lo, lo)
+            elif op == "<=":
+                result.upper = min(result.upper or hi, hi)
+            elif op == "!=":
+                result.excludes.append((lo, hi))
+            else:
+                result.lower = max(result.lower or lo, lo)
+                result.upper = min(result.upper or hi, hi)
+        return result
+
+    @staticmethod
+    def finder(spec: str, is_lts: Optional[Callable[[str], bool]] = None,
+               version_of: Optional[Callable[[str], str]] = None) -> Callable[[List[str]], Optional[str]]:
+        """
+        生成给 Select.Find 使用的查找函数：在选项中找出满足规格的最新版本
+        :param spec: 版本规格
+        :param is_lts: 判断 LTS 的函数 (参数为选项文本)，默认看选项中是否带 LTS 标注
+        :param version_of: 从选项文本取出版本号，默认取第一个空格前的部分
+        """
+        parsed = VersionUtils.parse_spec(spec)
+        version_of = version_of or (lambda option: str(option).split()[0] if str(option).split() else "")
+
+        def find(options: List[str]) -> Optional[str]:
+            by_version = {}
+            for option in options:
+                by_version.setdefault(version_of(option), option)
+            lts_check = is_lts or VersionUtils.is_lts_label
+            found = VersionIndex(by_version).select(parsed, lambda v: lts_check(by_version[v]))
+            return by_version[found[0]] if found else None
+
+        return find
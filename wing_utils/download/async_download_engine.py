@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : async_download_engine.py
+@Path : wing_utils/download
+@Author : Anfioo
+@Date : 2026/10/17 17:05
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from wing_utils.download.blob_store import BlobStore
+from wing_utils.download.download_utils import DownloadUtils
+from wing_utils.download.rate_limit_utils import ConnectionLimiter, DownloadPriority
+from wing_utils.ui import console
+
+
+@dataclass
+class DownloadJob:
+    url: str
+    save_dir: str
+    checksum: Optional[str] = None
+    algorithm: str = "sha256"
+    mirrors: Optional[List[str]] = None
+    priority: DownloadPriority = DownloadPriority.INTERACTIVE
+    result: Optional[str] = None  # 下载完成后的文件路径
+    error: Optional[BaseException] = None
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).netloc
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None and self.error is None
+
+
+class AsyncDownloadEngine:
+    """
+    批量下载引擎：多个安装包同时下载，共用一个 Rich 进度面板 (每个任务一行)
+
+    全局任务数受信号量限制；同一主机的连接数 (探测与每个 Range 分段都算一个连接)
+    由所有任务共用的 ConnectionLimiter 限制，分段数再多也不会超过 per_host_limit。
+    每个任务在线程中执行 DownloadUtils.download，因此续传、校验、内容寻址仓库与镜像切换全部沿用。
+    """
+
+    MAX_CONCURRENCY = 4
+    PER_HOST_LIMIT = 2
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY, per_host_limit: int = PER_HOST_LIMIT,
+                 segments: int = DownloadUtils.DEFAULT_SEGMENTS, store: Optional[BlobStore] = None):
+        """
+        :param max_concurrency: 同时进行的下载任务数上限
+        :param per_host_limit: 同一主机同时打开的连接数上限 (所有任务的分段合计)
+        :param segments: 每个任务的分段数
+        :param store: 内容寻址仓库 (可选)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.segments = segments
+        self.store = store
+        self.jobs: List[DownloadJob] = []
+
+    def submit(self, url: str, save_dir: str, checksum: Optional[str] = None, algorithm: str = "sha256",
+               mirrors: Optional[List[str]] = None,
+               priority: DownloadPriority = DownloadPriority.INTERACTIVE) -> DownloadJob:
+        """
+        加入一个下载任务 (调用 run 后才开始)
+        :param priority: 带宽调度优先级
+        :return: DownloadJob，run 结束后可读取 result / error
+        """
+        job = DownloadJob(url=url, save_dir=save_dir, checksum=checksum, algorithm=algorithm, mirrors=mirrors,
+                          priority=priority)
+        self.jobs.append(job)
+        return job
+
+    def run(self) -> List[DownloadJob]:
+        """同步入口：在新的事件循环中执行全部任务"""
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> List[DownloadJob]:
+        """
+        并发执行全部任务，单个任务失败不影响其它任务
+        :return: 任务列表 (与提交顺序一致)
+        """
+        pending = [job for job in self.jobs if job.result is None and job.error is None]
+        if not pending:
+            return self.jobs
+
+        limit = asyncio.Semaphore(self.max_concurrency)
+        connections = ConnectionLimiter(self.per_host_limit)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+        for job in pending:
+            host_limits.setdefault(job.host, asyncio.Semaphore(self.per_host_limit))
+
+        with DownloadUtils._create_progress() as progress:
+            await asyncio.gather(*(self._run_job(job, limit, host_limits[job.host], connections, progress)
+                                   for job in pending))
+
+        for job in pending:
+            if job.error is not None:
+                console.print(f"[red]下载失败: {job.url} ({job.error})[/red]")
+        return self.jobs
+
+    async def _run_job(self, job: DownloadJob, limit: asyncio.Semaphore, host_limit: asyncio.Semaphore,
+                       connections: ConnectionLimiter, progress):
+        """
+        先取得主机配额再取得全局配额，避免同一主机的排队任务占住全局名额
+        (一个主机的连接数上限为 per_host_limit，同时进行的任务也不会比它更多)
+        """
+        async with host_limit:
+            async with limit:
+                try:
+                    job.result = await asyncio.to_thread(
+                        DownloadUtils.download, job.url, job.save_dir, self.segments,
+                        job.checksum, job.algorithm, self.store, job.mirrors, progress, job.priority,
+                        connections)
+                except Exception as e:
+                    job.error = e
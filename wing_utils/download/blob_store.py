@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : blob_store.py
+@Path : wing_utils/download
+@Author : Anfioo
+@Date : 2026/10/17 14:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class BlobStore:
+    """
+    按内容寻址的下载仓库
+
+    每个文件只保存一份：blobs/<sha256>，各环境目录下的文件都是指向它的硬链接。
+    blobs/index.json 记录 url -> 摘要、文件名 -> 摘要列表，
+    因此同一个包从不同镜像、不同环境下载都能直接命中，同名但内容不同的文件也不会被误用。
+    """
+
+    INDEX_FILE_NAME = "index.json"
+    _lock = threading.Lock()
+
+    def __init__(self, root: Path):
+        """
+        :param root: 仓库目录，例如 ~/.we/data/downloads/blobs
+        """
+        self.root = Path(root)
+
+    # =========================
+    # 索引
+    # =========================
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / self.INDEX_FILE_NAME
+
+    def _read_index(self) -> Dict[str, Dict]:
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                index.setdefault("urls", {})
+                index.setdefault("files", {})
+                return index
+            except (OSError, ValueError):
+                pass
+        return {"urls": {}, "files": {}}
+
+    def _write_index(self, index: Dict[str, Dict]):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    # =========================
+    # 查询
+    # =========================
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest.lower()
+
+    def get(self, digest: str) -> Optional[Path]:
+        """按 sha256 查找 blob"""
+        path = self.blob_path(digest)
+        return path if path.is_file() else None
+
+    def digest_for_url(self, url: str) -> Optional[str]:
+        """返回 url 对应的摘要；blob 已被删除时同时清理索引"""
+        with self._lock:
+            index = self._read_index()
+            digest = index["urls"].get(url)
+            if digest and not self.blob_path(digest).is_file():
+                self._forget(index, digest)
+                self._write_index(index)
+                return None
+            return digest
+
+    def digests_for_filename(self, filename: str) -> List[str]:
+        with self._lock:
+            return list(self._read_index()["files"].get(filename, []))
+
+    def contains(self, file_path: Path, digest: Optional[str] = None) -> bool:
+        """file_path 是否就是仓库中某个 (或指定的) blob 的硬链接"""
+        file_path = Path(file_path)
+        if not file_path.exists():
+            return False
+        digests = [digest] if digest else self.digests_for_filename(file_path.name)
+        for d in digests:
+            blob = self.get(d)
+            if blob and os.path.samefile(blob, file_path):
+                return True
+        return False
+
+    # =========================
+    # 写入
+    # =========================
+
+    def add(self, file_path: Path, digest: str, url: Optional[str] = None) -> Path:
+        """
+        将下载好的文件纳入仓库，并把 file_path 变成指向 blob 的硬链接
+        :return: blob 路径
+        """
+        file_path = Path(file_path)
+        digest = digest.lower()
+        blob = self.blob_path(digest)
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            if blob.is_file():
+                # 已有相同内容，丢弃新副本，改为链接到已有 blob
+                if not os.path.samefile(blob, file_path):
+                    self._link(blob, file_path)
+            else:
+                self._link(file_path, blob)
+
+            index = self._read_index()
+            if url:
+                index["urls"][url] = digest
+            names = index["files"].setdefault(file_path.name, [])
+            if digest not in names:
+                names.append(digest)
+            self._write_index(index)
+        return blob
+
+    def link_to(self, digest: str, target: Path) -> Path:
+        """将 blob 链接到目标路径 (已存在的目标会被替换)"""
+        blob = self.get(digest)
+        if blob is None:
+            raise FileNotFoundError(f"仓库中不存在: {digest}")
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._link(blob, target)
+            index = self._read_index()
+            names = index["files"].setdefault(target.name, [])
+            if digest not in names:
+                names.append(digest)
+            self._write_index(index)
+        return target
+
+    def remember_url(self, url: str, digest: str):
+        with self._lock:
+            index = self._read_index()
+            index["urls"][url] = digest.lower()
+            self._write_index(index)
+
+    @staticmethod
+    def _link(source: Path, target: Path):
+        """硬链接 source -> target；文件系统不支持硬链接或跨盘时退回复制"""
+        tmp_target = target.with_name(target.name + ".link")
+        if tmp_target.exists():
+            tmp_target.unlink()
+        try:
+            os.link(source, tmp_target)
+        except OSError:
+            shutil.copy2(source, tmp_target)
+        os.replace(tmp_target, target)
+
+    @staticmethod
+    def _forget(index: Dict[str, Dict], digest: str):
+        index["urls"] = {u: d for u, d in index["urls"].items() if d != digest}
+        for name in list(index["files"]):
+            index["files"][name] = [d for d in index["files"][name] if d != digest]
+            if not index["files"][name]:
+                del index["files"][name]
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : checksum_utils.py
+@Path : wing_utils/download
+@Author : Anfioo
+@Date : 2026/10/17 13:20
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+
+class ChecksumMismatchError(IOError):
+    """下载文件的摘要与期望值不一致"""
+
+
+class StreamingHasher:
+    """
+    边下载边计算摘要
+
+    数据按写入顺序直接喂给 hashlib；分段下载时各分段乱序到达，
+    只有当前游标之前的数据全部写完后才会追上游标 (从刚写入、仍在页缓存中的 .part 读回缺口)。
+    SHA-2 / MD5 不能把各分段的摘要合并，因此分段下载只是部分流式：第一个分段之后的数据
+    通常要在前面的缺口补齐时读回一遍 (多为页缓存命中)，只有单连接下载完全不读回。
+    读回在锁外进行，期间其它分段的 feed 立即返回，不会被阻塞。
+    """
+
+    READ_BLOCK = 1024 * 1024
+
+    def __init__(self, algorithm: str, path: Optional[Path] = None,
+                 contiguous_end: Optional[Callable[[], int]] = None):
+        """
+        :param algorithm: sha256 / sha512 / md5
+        :param path: 正在写入的文件，用于读回游标与分段之间的缺口
+        :param contiguous_end: 返回文件开头连续已写入字节数的函数
+        """
+        self.algorithm = algorithm
+        self._hash = ChecksumUtils.new_hash(algorithm)
+        self._path = path
+        self._contiguous_end = contiguous_end
+        self._cursor = 0
+        # 为 True 时由某个线程在锁外读回，游标与 _hash 只归它使用
+        self._catching_up = False
+        self._lock = threading.Lock()
+
+    def feed(self, offset: int, chunk: bytes):
+        """通知 [offset, offset + len(chunk)) 已写入 (调用前该区间须已计入 contiguous_end)"""
+        with self._lock:
+            end = offset + len(chunk)
+            if self._catching_up or end <= self._cursor:
+                return
+            if offset <= self._cursor:
+                self._hash.update(memoryview(chunk)[self._cursor - offset:])
+                self._cursor = end
+                return
+            if self._contiguous_end is None or self._contiguous_end() < offset:
+                return
+            self._catching_up = True
+        self._catch_up()
+
+    def finish(self, size: int) -> str:
+        """读回尚未覆盖的剩余部分，返回十六进制摘要 (此时所有分段已结束)"""
+        with self._lock:
+            remaining = self._cursor < size
+        if remaining:
+            self._read_back(size)
+        return self._hash.hexdigest()
+
+    def _catch_up(self):
+        """在锁外把游标读回到 contiguous_end，读回期间新补齐的区间一并读完"""
+        try:
+            while True:
+                with self._lock:
+                    target = self._contiguous_end()
+                    if target <= self._cursor:
+                        self._catching_up = False
+                        return
+                self._read_back(target)
+        except BaseException:
+            with self._lock:
+                self._catching_up = False
+            raise
+
+    def _read_back(self, until: int):
+        with open(self._path, "rb") as f:
+            f.seek(self._cursor)
+            while self._cursor < until:
+                block = f.read(min(self.READ_BLOCK, until - self._cursor))
+                if not block:
+                    raise IOError(f"读回文件失败: {self._path} @ {self._cursor}")
+                self._hash.update(block)
+                self._cursor += len(block)
+
+
+class ChecksumUtils:
+    SUPPORTED_ALGORITHMS = ("sha256", "sha512", "md5")
+    # 摘要旁路文件：<name>.digest.json
+    DIGEST_SUFFIX = ".digest.json"
+    QUARANTINE_DIR = "quarantine"
+
+    @staticmethod
+    def new_hash(algorithm: str):
+        algorithm = algorithm.lower()
+        if algorithm not in ChecksumUtils.SUPPORTED_ALGORITHMS:
+            raise ValueError(f"不支持的摘要算法: {algorithm}，可选: {', '.join(ChecksumUtils.SUPPORTED_ALGORITHMS)}")
+        return hashlib.new(algorithm)
+
+    @staticmethod
+    def hash_file(file_path: Path, algorithm: str) -> str:
+        """完整读取文件计算摘要"""
+        h = ChecksumUtils.new_hash(algorithm)
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(StreamingHasher.READ_BLOCK), b""):
+                h.update(block)
+        return h.hexdigest()
+
+    @staticmethod
+    def _digest_path(file_path: Path) -> Path:
+        return Path(str(file_path) + ChecksumUtils.DIGEST_SUFFIX)
+
+    @staticmethod
+    def save_digest(file_path: Path, algorithm: str, digest: str):
+        """持久化文件摘要，并记录大小与修改时间用于判断是否仍然有效"""
+        file_path = Path(file_path)
+        digest_path = ChecksumUtils._digest_path(file_path)
+        data = ChecksumUtils._read_digest_file(digest_path, file_path) or {}
+        stat = file_path.stat()
+        data.update({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, algorithm.lower(): digest.lower()})
+        with open(digest_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    @staticmethod
+    def load_digest(file_path: Path, algorithm: str) -> Optional[str]:
+        """读取已持久化的摘要；文件被修改过或没有记录该算法时返回 None"""
+        file_path = Path(file_path)
+        data = ChecksumUtils._read_digest_file(ChecksumUtils._digest_path(file_path), file_path)
+        return data.get(algorithm.lower()) if data else None
+
+    @staticmethod
+    def _read_digest_file(digest_path: Path, file_path: Path) -> Optional[dict]:
+        if not digest_path.exists() or not file_path.exists():
+            return None
+        try:
+            with open(digest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        stat = file_path.stat()
+        if data.get("size") != stat.st_size or data.get("mtime_ns") != stat.st_mtime_ns:
+            return None
+        return data
+
+    @staticmethod
+    def file_digest(file_path: Path, algorithm: str) -> str:
+        """优先复用已持久化的摘要，没有时才完整计算并保存"""
+        digest = ChecksumUtils.load_digest(file_path, algorithm)
+        if digest is None:
+            digest = ChecksumUtils.hash_file(file_path, algorithm)
+            ChecksumUtils.save_digest(file_path, algorithm, digest)
+        return digest
+
+    @staticmethod
+    def quarantine(file_path: Path) -> Path:
+        """将损坏的文件移入同目录下的 quarantine/ 中，返回新路径"""
+        file_path = Path(file_path)
+        target_dir = file_path.parent / ChecksumUtils.QUARANTINE_DIR
+        target_dir.mkdir(parents=True, exist_ok=True)
+        target = target_dir / f"{file_path.name}.{time.strftime('%Y%m%d%H%M%S')}"
+        shutil.move(str(file_path), str(target))
+        digest_path = ChecksumUtils._digest_path(file_path)
+        if digest_path.exists():
+            os.remove(digest_path)
+        return target
+
+    @staticmethod
+    def verify(file_path: Path, expected: str, actual: str, algorithm: str):
+        """比较摘要，不一致时隔离文件并抛出 ChecksumMismatchError"""
+        if actual.lower() == expected.strip().lower():
+            return
+        moved = ChecksumUtils.quarantine(file_path)
+        raise ChecksumMismatchError(
+            f"{algorithm} 校验失败: 期望 {expected}，实际 {actual}，文件已隔离到 {moved}")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : download_journal.py
+@Path : wing_utils/download
+@Author : Anfioo
+@Date : 2026/10/17 11:05
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+class DownloadJournal:
+    """
+    断点续传日志：记录 <name>.part 中已经写入完成的字节区间
+
+    日志保存在 <name>.part.json，内容为 url / 文件大小 / 校验标识 (ETag 或 Last-Modified)
+    以及已完成的闭区间列表 [[start, end], ...]，重启下载时据此只请求缺失的部分。
+    """
+
+    SUFFIX = ".json"
+    # 内存中的区间变化累计到一定字节数或时间后才落盘
+    FLUSH_BYTES = 1024 * 1024
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, part_path: Path, url: str, size: int, validator: Optional[str] = None):
+        self.part_path = Path(part_path)
+        self.journal_path = Path(str(part_path) + self.SUFFIX)
+        self.url = url
+        self.size = size
+        self.validator = validator
+        self.ranges: List[Tuple[int, int]] = []
+        self._lock = threading.Lock()
+        self._dirty_bytes = 0
+        self._last_flush = time.monotonic()
+
+    @classmethod
+    def open(cls, part_path: Path, url: str, size: int, validator: Optional[str] = None,
+             adopt: bool = False) -> "DownloadJournal":
+        """
+        打开已有日志；若日志不存在或与当前资源不匹配 (url/大小/校验标识变化)，则丢弃旧的 .part 重新开始
+        :param adopt: 切换到另一个镜像继续下载同一文件时为 True，只要求文件大小一致
+        """
+        journal = cls(part_path, url, size, validator)
+        saved = journal._read()
+        same_source = saved and saved.get("url") == url and saved.get("validator") == validator
+        if (saved and part_path.exists()
+                and saved.get("size") == size
+                and (same_source or adopt)):
+            journal.ranges = [tuple(r) for r in saved.get("ranges", [])]
+        else:
+            journal.reset()
+        return journal
+
+    def _read(self) -> Optional[dict]:
+        if not self.journal_path.exists():
+            return None
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def reset(self):
+        """清空日志并删除残留的 .part 文件"""
+        with self._lock:
+            self.ranges = []
+        if self.part_path.exists():
+            self.part_path.unlink()
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+
+    def mark(self, start: int, end: int):
+        """记录闭区间 [start, end] 已写入，并按需落盘"""
+        with self._lock:
+            self.ranges = self._merge(self.ranges + [(start, end)])
+            self._dirty_bytes += end - start + 1
+            should_flush = (self._dirty_bytes >= self.FLUSH_BYTES
+                            or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL)
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        """将当前区间写入日志文件 (先写临时文件再替换，避免日志本身被写坏)"""
+        with self._lock:
+            data = {
+                "url": self.url,
+                "size": self.size,
+                "validator": self.validator,
+                "ranges": [list(r) for r in self.ranges],
+            }
+            self._dirty_bytes = 0
+            self._last_flush = time.monotonic()
+            tmp_path = Path(str(self.journal_path) + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.journal_path)
+
+    def remove(self):
+        """下载完成后删除日志"""
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+
+    @property
+    def completed_bytes(self) -> int:
+        with self._lock:
+            return sum(end - start + 1 for start, end in self.ranges)
+
+    def contiguous_end(self) -> int:
+        """文件开头连续已写入的字节数"""
+        with self._lock:
+            if self.ranges and self.ranges[0][0] == 0:
+                return self.ranges[0][1] + 1
+            return 0
+
+    def is_complete(self) -> bool:
+        return self.missing_ranges() == []
+
+    def missing_ranges(self) -> List[Tuple[int, int]]:
+        """返回尚未下载的闭区间列表"""
+        with self._lock:
+            missing = []
+            cursor = 0
+            for start, end in self.ranges:
+                if start > cursor:
+                    missing.append((cursor, start - 1))
+                cursor = max(cursor, end + 1)
+            if cursor < self.size:
+                missing.append((cursor, self.size - 1))
+            return missing
+
+    @staticmethod
+    def _merge(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """合并重叠或相邻的区间"""
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : http_session_utils.py
+@Path : wing_utils/download
+@Author : Anfioo
+@Date : 2026/10/17 15:30
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpSessionUtils:
+    """
+    全局共享的 requests.Session（单进程一个连接池）
+
+    所有检索构建器和 DownloadUtils 都通过 get_session() 发请求，
+    同一主机的多次请求复用 TCP + TLS 连接，并统一重试 / 退避策略和默认请求头。
+    mount() 可为某个 url 前缀挂载自定义 transport（例如测试用的本地替身）。
+    """
+
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 16
+    RETRIES = 3
+    BACKOFF_FACTOR = 0.5
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+    DEFAULT_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                      "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
+        "Connection": "keep-alive",
+    }
+
+    _session: Optional[requests.Session] = None
+    _transports: Dict[str, BaseAdapter] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """获取共享 Session，首次调用时创建"""
+        if cls._session is None:
+            with cls._lock:
+                if cls._session is None:
+                    cls._session = cls._build_session()
+        return cls._session
+
+    @classmethod
+    def configure(cls, pool_size: Optional[int] = None, retries: Optional[int] = None,
+                  backoff_factor: Optional[float] = None, headers: Optional[Dict[str, str]] = None):
+        """
+        调整连接池与重试策略，下一次 get_session() 时生效
+        :param pool_size: 每个主机的连接池大小
+        :param retries: 连接错误 / 5xx 的重试次数
+        :param backoff_factor: 指数退避系数 (秒)
+        :param headers: 追加的默认请求头
+        """
+        with cls._lock:
+            if pool_size is not None:
+                cls.POOL_CONNECTIONS = cls.POOL_MAXSIZE = pool_size
+            if retries is not None:
+                cls.RETRIES = retries
+            if backoff_factor is not None:
+                cls.BACKOFF_FACTOR = backoff_factor
+            if headers:
+                cls.DEFAULT_HEADERS = {**cls.DEFAULT_HEADERS, **headers}
+            cls._close_session()
+
+    @classmethod
+    def mount(cls, prefix: str, adapter: BaseAdapter):
+        """为 url 前缀挂载 transport，对当前及之后创建的 Session 都生效"""
+        with cls._lock:
+            cls._transports[prefix] = adapter
+            if cls._session is not None:
+                cls._session.mount(prefix, adapter)
+
+    @classmethod
+    def mounted(cls, prefix: str) -> Optional[BaseAdapter]:
+        """当前为 url 前缀挂载的 transport，没有时为 None (默认连接池不算)"""
+        with cls._lock:
+            return cls._transports.get(prefix)
+
+    @classmethod
+    def unmount(cls, prefix: str, adapter: Optional[BaseAdapter] = None,
+                restore: Optional[BaseAdapter] = None) -> bool:
+        """
+        移除挂载的 transport，恢复默认连接池
+        :param adapter: 指定时只有它仍是当前挂载的 transport 才移除 (其它模块之后挂载的保持不变)
+        :param restore: 移除后改为挂载的 transport (例如挂载之前的那一个)
+        :return: 是否移除
+        """
+        with cls._lock:
+            if adapter is not None and cls._transports.get(prefix) is not adapter:
+                return False
+            if restore is not None:
+                cls._transports[prefix] = restore
+            else:
+                cls._transports.pop(prefix, None)
+            cls._close_session()
+            return True
+
+    @classmethod
+    def reset(cls):
+        """关闭连接池并清除所有挂载"""
+        with cls._lock:
+            cls._transports.clear()
+            cls._close_session()
+
+    @classmethod
+    def _close_session(cls):
+        if cls._session is not None:
+            cls._session.close()
+            cls._session = None
+
+    @classmethod
+    def new_adapter(cls, adapter_class=HTTPAdapter, **kwargs) -> HTTPAdapter:
+        """
+        按当前的连接池与重试配置创建 HTTPAdapter (或其子类)
+        :param adapter_class: HTTPAdapter 子类，例如改写 url 的代理 transport
+        :param kwargs: 传给 adapter_class 的其它参数
+        """
+        retry = Retry(
+            total=cls.RETRIES,
+            backoff_factor=cls.BACKOFF_FACTOR,
+            status_forcelist=cls.RETRY_STATUS,
+            allowed_methods=frozenset(["HEAD", "GET"]),
+            raise_on_status=False,
+        )
+        return adapter_class(pool_connections=cls.POOL_CONNECTIONS, pool_maxsize=cls.POOL_MAXSIZE,
+                             max_retries=retry, **kwargs)
+
+    @classmethod
+    def _build_session(cls) -> requests.Session:
+        adapter = cls.new_adapter()
+        session = requests.Session()
+        session.headers.update(cls.DEFAULT_HEADERS)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        for prefix, transport in cls._transports.items():
+            session.mount(prefix, transport)
+        return session
@@ -0,0 +1,493 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : mirror_proxy_server.py
+@Path : wing_utils/download
+@Author : Anfioo
+@Date : 2026/10/17 19:45
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from email.utils import formatdate
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from rich.progress import Progress
+
+from wing_utils.download.blob_store import BlobStore
+from wing_utils.download.download_journal import DownloadJournal
+from wing_utils.download.download_utils import DownloadUtils
+from wing_utils.download.http_session_utils import HttpSessionUtils
+from wing_utils.download.mirror_proxy_utils import MirrorProxyUtils
+from wing_utils.ui import console
+
+
+class MirrorProxyServer:
+    """
+    局域网缓存代理 (we mirror serve)
+
+    安装包 (按后缀识别，地址不变内容就不变) 第一次被请求时在后台下载进内容寻址仓库，
+    下载过程中已写入的部分立即发给等待的客户端 (不必等整个文件)，之后直接从本地磁盘用 sendfile 发送，
+    支持 HEAD、Range 与 If-Range；ETag / Last-Modified 沿用上游的值，填充前后保持一致，客户端的续传不会失效；
+    元数据 (jdks.json、index.json 等会变化的内容) 原样转发，条件请求头一并转发，304 照常生效。
+    只代理允许列表中的上游主机 (不是任意地址的开放转发)；默认只监听本机。
+    """
+
+    DEFAULT_PORT = 8765
+    ARTIFACT_SUFFIXES = (".zip", ".tar.gz", ".tgz", ".tar.xz", ".tar.bz2", ".7z", ".msi", ".exe", ".pkg",
+                         ".sh", ".jar")
+    FORWARD_REQUEST_HEADERS = ("Accept", "Accept-Encoding", "If-None-Match", "If-Modified-Since", "Range",
+                               "If-Range")
+    FORWARD_RESPONSE_HEADERS = ("Content-Type", "Content-Length", "Content-Encoding", "Content-Range",
+                                "ETag", "Last-Modified", "Cache-Control", "Accept-Ranges")
+    # url -> 上游的 ETag / Last-Modified，随 blob 一起保存
+    VALIDATORS_FILE_NAME = "validators.json"
+
+    def __init__(self, store: BlobStore, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                 allowed_hosts: Optional[Iterable[str]] = None, allow_any: bool = False):
+        """
+        :param store: 内容寻址仓库 (与本机下载共用)
+        :param host: 监听地址，局域网共享时传 0.0.0.0
+        :param port: 监听端口，0 表示随机端口
+        :param allowed_hosts: 允许代理的上游主机；为空且未开启 allow_any 时拒绝一切请求
+        :param allow_any: 显式允许任意上游主机 (开放转发，仅用于可信网络)
+        """
+        self.store = store
+        self.fill_dir = Path(store.root) / "proxy"
+        self.allowed_hosts = {h.lower() for h in allowed_hosts or ()}
+        self.allow_any = allow_any
+        self.progress: Optional[Progress] = None
+        # url -> 正在进行的填充，填充结束且没有请求还在读取时移除
+        self._fills: Dict[str, _Fill] = {}
+        self._fills_guard = threading.Lock()
+        handler = partial(_MirrorProxyHandler, self)
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.httpd.server_address[:2]
+
+    def serve_forever(self):
+        """阻塞运行，Ctrl+C 退出"""
+        # 代理自身必须直连上游，否则请求会被改写回自己
+        MirrorProxyUtils.disable()
+        host, port = self.address
+        console.print(f"[bold green]WingEnv 镜像代理已启动: http://{host}:{port}[/bold green]")
+        console.print(f"[dim]仓库目录: {self.store.root}[/dim]")
+        if host in ("0.0.0.0", "::", ""):
+            console.print("[bold yellow]⚠️ 正在监听所有网卡，局域网内任何人都可以通过本代理下载[/bold yellow]")
+        if self.allow_any:
+            console.print("[bold yellow]⚠️ 已允许任意上游主机：代理可被用来访问本机能访问的任何地址[/bold yellow]")
+        else:
+            console.print(f"[dim]允许的上游主机: {', '.join(sorted(self.allowed_hosts)) or '无'}[/dim]")
+        with DownloadUtils._create_progress() as progress:
+            self.progress = progress
+            try:
+                self.httpd.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                self.httpd.server_close()
+                self.progress = None
+
+    def start(self) -> threading.Thread:
+        """在后台线程运行 (不显示进度条)"""
+        MirrorProxyUtils.disable()
+        thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    # =========================
+    # 仓库
+    # =========================
+
+    def is_artifact(self, url: str) -> bool:
+        return urlsplit(url).path.lower().endswith(self.ARTIFACT_SUFFIXES)
+
+    def is_allowed(self, url: str) -> bool:
+        if self.allow_any:
+            return True
+        return (urlsplit(url).hostname or "").lower() in self.allowed_hosts
+
+    def cached_blob(self, url: str) -> Optional[Path]:
+        digest = self.store.digest_for_url(url)
+        return self.store.get(digest) if digest else None
+
+    def fill(self, url: str) -> Path:
+        """
+        确保 url 对应的文件已在仓库中 (阻塞到填充结束)；同一 url 的并发请求只会下载一次
+        :return: blob 路径
+        """
+        fill = self.join_fill(url)
+        try:
+            return fill.wait_done()
+        finally:
+            self.leave_fill(fill)
+
+    def join_fill(self, url: str, start: bool = True) -> Optional["_Fill"]:
+        """
+        加入 url 正在进行的填充；没有时启动一个后台填充 (start 为 False 时返回 None)
+        用完后必须调用 leave_fill
+        """
+        with self._fills_guard:
+            fill = self._fills.get(url)
+            if fill is None:
+                if not start:
+                    return None
+                # 每个 url 单独的填充目录，避免不同来源的同名文件互相覆盖
+                work_dir = self.fill_dir / hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+                fill = _Fill(url, work_dir / DownloadUtils.get_filename_from_url(url))
+                self._fills[url] = fill
+                # 后台线程也算一个使用者：第一个客户端断开后填充照常完成
+                fill.users += 1
+                threading.Thread(target=self._run_fill, args=(fill,), daemon=True).start()
+            fill.users += 1
+            return fill
+
+    def leave_fill(self, fill: "_Fill"):
+        """最后一个使用者离开时移除填充；成功时删除填充目录 (仓库中已有硬链接)，失败时保留供下次续传"""
+        with self._fills_guard:
+            fill.users -= 1
+            if fill.users > 0:
+                return
+            if self._fills.get(fill.url) is fill:
+                del self._fills[fill.url]
+        if fill.blob is not None:
+            shutil.rmtree(fill.path.parent, ignore_errors=True)
+
+    def _run_fill(self, fill: "_Fill"):
+        """
+        后台填充：先取上游响应头，再按分段下载到填充目录，已写入的区间实时通知等待的请求
+        不经过 DownloadUtils.download 的改名：请求还在读取填充文件，Windows 上不能改名打开中的文件
+        """
+        try:
+            blob = self.cached_blob(fill.url)
+            if blob is not None:
+                fill.start(blob.stat().st_size, self.validators(fill.url, blob.name))
+                fill.finish(blob)
+                return
+            with HttpSessionUtils.get_session().head(fill.url, allow_redirects=True, timeout=30) as r:
+                r.raise_for_status()
+            etag = r.headers.get("ETag")
+            validators = {
+                # 弱 ETag 不能用于 If-Range，不沿用
+                "etag": etag if etag and not etag.startswith("W/") else None,
+                "last_modified": r.headers.get("Last-Modified"),
+                "content_type": r.headers.get("Content-Type"),
+            }
+            size = int(r.headers.get("Content-Length", 0))
+            fill.start(size, validators)
+            if size <= 0:
+                # 不知道大小就无法边下边发，交给转发
+                fill.fail(IOError(f"上游未提供文件大小: {fill.url}"))
+                return
+            fill.path.parent.mkdir(parents=True, exist_ok=True)
+            hashers = DownloadUtils._transfer(fill.url, fill.path, DownloadUtils.DEFAULT_SEGMENTS, ["sha256"],
+                                              progress=self.progress, on_data=fill.mark)
+            digest = hashers.finish(fill.path.stat().st_size)["sha256"]
+            blob = self.store.add(fill.path, digest, fill.url)
+            self._save_validators(fill.url, digest, validators)
+            fill.finish(blob)
+        except Exception as e:
+            fill.fail(e)
+        finally:
+            self.leave_fill(fill)
+
+    # =========================
+    # 校验标识
+    # =========================
+
+    def validators(self, url: str, digest: str) -> Dict[str, Optional[str]]:
+        """blob 对应的上游 ETag / Last-Modified (只在记录的摘要与 blob 一致时返回)"""
+        saved = self._read_validators().get(url)
+        if not saved or saved.get("sha256") != digest:
+            return {}
+        return saved
+
+    def _read_validators(self) -> Dict[str, Dict[str, Optional[str]]]:
+        try:
+            with open(self.fill_dir / self.VALIDATORS_FILE_NAME, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_validators(self, url: str, digest: str, validators: Dict[str, Optional[str]]):
+        with self._fills_guard:
+            saved = self._read_validators()
+            saved[url] = {**validators, "sha256": digest}
+            self.fill_dir.mkdir(parents=True, exist_ok=True)
+            path = self.fill_dir / self.VALIDATORS_FILE_NAME
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(saved, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+
+class _Fill:
+    """
+    一次正在进行的仓库填充
+
+    上游数据按分段写入 path，同时记录已写入的区间；等待中的请求读到哪里发到哪里，
+    不必等整个文件下载完 (大文件在慢速上游上也不会让客户端读超时)。
+    """
+
+    WAIT_INTERVAL = 1.0
+
+    def __init__(self, url: str, path: Path):
+        self.url = url
+        self.path = path
+        self.size = 0
+        self.validators: Dict[str, Optional[str]] = {}
+        self.ranges: List[Tuple[int, int]] = []
+        self.blob: Optional[Path] = None
+        self.error: Optional[Exception] = None
+        self.users = 0
+        self._ready = threading.Event()
+        self._cond = threading.Condition()
+
+    def start(self, size: int, validators: Dict[str, Optional[str]]):
+        """上游响应头已就绪"""
+        self.size = size
+        self.validators = validators
+        self._ready.set()
+
+    def mark(self, start: int, end: int):
+        with self._cond:
+            self.ranges = DownloadJournal._merge(self.ranges + [(start, end)])
+            self._cond.notify_all()
+
+    def finish(self, blob: Path):
+        with self._cond:
+            self.blob = blob
+            self._cond.notify_all()
+
+    def fail(self, error: Exception):
+        with self._cond:
+            self.error = error
+            self._cond.notify_all()
+        self._ready.set()
+
+    def wait_ready(self) -> bool:
+        """
+        等待上游响应头
+        :return: False 表示上游没有给出文件大小 (不缓存，改为转发)
+        """
+        self._ready.wait()
+        if self.size <= 0 and self.error is not None and not self.validators:
+            # 上游的 HEAD 就失败了 (例如 404)
+            raise self.error
+        return self.size > 0
+
+    def wait_done(self) -> Path:
+        with self._cond:
+            while self.blob is None and self.error is None:
+                self._cond.wait(self.WAIT_INTERVAL)
+        if self.blob is None:
+            raise self.error
+        return self.blob
+
+    def readable_until(self, pos: int) -> int:
+        """阻塞到 pos 处的数据已写入，返回从 pos 开始连续可读的最后一个字节；填充失败时抛出 IOError"""
+        with self._cond:
+            while True:
+                if self.blob is not None:
+                    return self.size - 1
+                for start, end in self.ranges:
+                    if start <= pos <= end:
+                        return end
+                if self.error is not None:
+                    raise IOError(f"填充中断: {self.error}")
+                self._cond.wait(self.WAIT_INTERVAL)
+
+
+class _MirrorProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "WingEnvMirror/1.0"
+
+    def __init__(self, proxy: MirrorProxyServer, *args, **kwargs):
+        self.proxy = proxy
+        super().__init__(*args, **kwargs)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self._handle(head=True)
+
+    def do_GET(self):
+        self._handle(head=False)
+
+    def _handle(self, head: bool):
+        # 状态行只能是 latin-1，中文说明放在 explain (响应体) 中
+        url = MirrorProxyUtils.restore(self.path)
+        if url is None:
+            self.send_error(400, explain="代理地址格式: /<scheme>/<host>/<path>")
+            return
+        if not self.proxy.is_allowed(url):
+            self.send_error(403, explain="上游主机不在允许列表中")
+            return
+        try:
+            if self.proxy.is_artifact(url) and self._serve_artifact(url, head):
+                return
+            self._pass_through(url, head)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except (requests.RequestException, IOError) as e:
+            # 上游返回的 4xx (例如 404) 原样告知客户端，其它错误统一为 502
+            upstream = getattr(getattr(e, "response", None), "status_code", None)
+            status = upstream if upstream and 400 <= upstream < 500 else 502
+            self.send_error(status, explain=f"上游请求失败: {e}")
+
+    # =========================
+    # 本地文件
+    # =========================
+
+    def _serve_artifact(self, url: str, head: bool) -> bool:
+        """
+        从仓库或正在进行的填充提供安装包
+        HEAD 不触发下载：既没有缓存也没有进行中的填充时转发给上游
+        :return: False 表示交给转发处理
+        """
+        blob = self.proxy.cached_blob(url)
+        if blob is not None:
+            self._serve_file(blob, blob.stat().st_size, self.proxy.validators(url, blob.name), head)
+            return True
+        fill = self.proxy.join_fill(url, start=not head)
+        if fill is None:
+            return False
+        try:
+            if not fill.wait_ready():
+                return False
+            if fill.error is not None:
+                # 加入时填充已经失败，响应头还没发出，按上游错误回复
+                raise fill.error
+            if fill.blob is not None:
+                self._serve_file(fill.blob, fill.size, fill.validators, head)
+            else:
+                self._serve_file(fill.path, fill.size, fill.validators, head, fill)
+            return True
+        finally:
+            self.proxy.leave_fill(fill)
+
+    def _serve_file(self, path: Path, size: int, validators: Dict[str, Optional[str]], head: bool,
+                    fill: Optional[_Fill] = None):
+        """
+        发送本地文件 (或正在填充的文件)，处理 Range 与 If-Range
+        :param validators: 上游的 ETag / Last-Modified；没有记录时用 blob 的摘要与修改时间
+        :param fill: 正在进行的填充，数据按已写入的区间陆续发送
+        """
+        etag = validators.get("etag")
+        last_modified = validators.get("last_modified")
+        if fill is None and not validators:
+            # 没有上游记录 (代理升级前填充的 blob)：用摘要与修改时间；
+            # 有记录时原样沿用，不能额外补 ETag，否则客户端按 ETag 优先换了校验标识，续传日志会失效
+            etag = f'"{path.name}"'
+            last_modified = formatdate(path.stat().st_mtime, usegmt=True)
+        start, end = 0, size - 1
+        status = 200
+
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and (if_range is None or if_range in (etag, last_modified)):
+            parsed = _parse_range(range_header, size)
+            if parsed is None:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start, end = parsed
+            status = 206
+
+        self.send_response(status)
+        self.send_header("Content-Type", validators.get("content_type") or "application/octet-stream")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        if etag:
+            self.send_header("ETag", etag)
+        if last_modified:
+            self.send_header("Last-Modified", last_modified)
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        if head or size == 0:
+            return
+        pos = start
+        try:
+            # 正在填充时先等到起点的数据写入 (此时填充文件才一定存在)
+            until = end if fill is None else min(fill.readable_until(pos), end)
+            with open(path, "rb") as f:
+                while True:
+                    # socket.sendfile 在支持的平台上使用 os.sendfile，数据不经过用户态
+                    self.connection.sendfile(f, offset=pos, count=until - pos + 1)
+                    pos = until + 1
+                    if pos > end:
+                        break
+                    until = min(fill.readable_until(pos), end)
+        except OSError:
+            # 响应头已发出 (填充中断或客户端断开)，只能断开连接让客户端重试
+            self.close_connection = True
+
+    # =========================
+    # 转发
+    # =========================
+
+    def _pass_through(self, url: str, head: bool):
+        headers = {k: self.headers[k] for k in self.proxy.FORWARD_REQUEST_HEADERS if self.headers.get(k)}
+        session = HttpSessionUtils.get_session()
+        method = session.head if head else session.get
+        with method(url, headers=headers, stream=True, timeout=30, allow_redirects=True) as r:
+            self.send_response(r.status_code)
+            for key in self.proxy.FORWARD_RESPONSE_HEADERS:
+                if key in r.headers:
+                    self.send_header(key, r.headers[key])
+            chunked = not head and "Content-Length" not in r.headers and r.status_code not in (204, 304)
+            if chunked:
+                self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            if head or r.status_code in (204, 304):
+                return
+            # 原样转发 (不解压)，Content-Encoding 已随响应头一起转发
+            for chunk in r.raw.stream(DownloadUtils.MIN_BUFFER_SIZE, decode_content=False):
+                if chunked:
+                    self.wfile.write(f"{len(chunk):X}\r\n".encode("ascii") + chunk + b"\r\n")
+                else:
+                    self.wfile.write(chunk)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """解析单个 Range: bytes=a-b / a- / -n，不满足时返回 None"""
+    match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header)
+    if not match or (not match.group(1) and not match.group(2)) or size == 0:
+        return None
+    if not match.group(1):
+        length = int(match.group(2))
+        if length == 0:
+            return None
+        return max(0, size - length), size - 1
+    start = int(match.group(1))
+    end = int(match.group(2)) if match.group(2) else size - 1
+    if start >= size or end < start:
+        return None
+    return start, min(end, size - 1)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : mirror_proxy_utils.py
+@Path : wing_utils/download
+@Author : Anfioo
+@Date : 2026/10/17 19:30
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from wing_utils.download.http_session_utils import HttpSessionUtils
+
+
+class MirrorProxyUtils:
+    """
+    局域网缓存代理 (we mirror serve) 的客户端部分
+
+    代理地址格式：<proxy>/<scheme>/<host><path>?<query>
+    例如 https://download.jetbrains.com/jdk/feed/v1/jdks.json
+    -> http://192.168.1.10:8765/https/download.jetbrains.com/jdk/feed/v1/jdks.json
+    enable() 在共享 Session 上挂载改写 url 的 transport，
+    JDK_FEED_URL、MIRRORS、GO_API_URL 等所有经过 HttpSessionUtils 的请求都会走代理。
+    """
+
+    PREFIXES = ("http://", "https://")
+
+    _proxy_base: Optional[str] = None
+    _adapter: Optional[BaseAdapter] = None
+    # 启用前各前缀上挂载的 transport (例如离线包)，关闭时恢复
+    _previous: Dict[str, Optional[BaseAdapter]] = {}
+
+    @staticmethod
+    def rewrite(url: str, proxy_base: str) -> str:
+        """
+        把原始地址改写为代理地址；已经指向代理的地址保持不变
+        :param url: 原始地址
+        :param proxy_base: 代理根地址，例如 http://192.168.1.10:8765
+        """
+        proxy_base = proxy_base.rstrip("/")
+        if url.startswith(proxy_base + "/"):
+            return url
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            return url
+        target = f"{proxy_base}/{parts.scheme}/{parts.netloc}{parts.path or '/'}"
+        if parts.query:
+            target += f"?{parts.query}"
+        return target
+
+    @staticmethod
+    def restore(proxy_path: str) -> Optional[str]:
+        """
+        从代理请求路径还原原始地址 (rewrite 的逆操作)
+        :param proxy_path: 例如 /https/download.jetbrains.com/jdk/feed/v1/jdks.json
+        :return: 原始地址，格式不合法时返回 None
+        """
+        scheme, _, rest = proxy_path.lstrip("/").partition("/")
+        if scheme not in ("http", "https") or not rest or rest.startswith("/"):
+            return None
+        return f"{scheme}://{rest}"
+
+    @classmethod
+    def enable(cls, proxy_base: str):
+        """让共享 Session 的所有请求经过代理"""
+        adapter = HttpSessionUtils.new_adapter(_MirrorProxyAdapter, proxy_base=proxy_base)
+        for prefix in cls.PREFIXES:
+            current = HttpSessionUtils.mounted(prefix)
+            if cls._adapter is None or current is not cls._adapter:
+                cls._previous[prefix] = current
+            HttpSessionUtils.mount(prefix, adapter)
+        cls._proxy_base = proxy_base.rstrip("/")
+        cls._adapter = adapter
+
+    @classmethod
+    def disable(cls):
+        """恢复启用前的状态 (直连或之前挂载的 transport)；只移除自己挂载的 transport"""
+        if cls._proxy_base is None:
+            return
+        for prefix in cls.PREFIXES:
+            HttpSessionUtils.unmount(prefix, cls._adapter, cls._previous.pop(prefix, None))
+        cls._proxy_base = None
+        cls._adapter = None
+
+    @classmethod
+    def current(cls) -> Optional[str]:
+        """当前生效的代理地址"""
+        return cls._proxy_base
+
+
+class _MirrorProxyAdapter(HTTPAdapter):
+    """发送前把请求地址改写为代理地址的 transport"""
+
+    def __init__(self, proxy_base: str, **kwargs):
+        self.proxy_base = proxy_base
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        request.url = MirrorProxyUtils.rewrite(request.url, self.proxy_base)
+        return super().send(request, **kwargs)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : mirror_race_utils.py
+@Path : wing_utils/download
+@Author : Anfioo
+@Date : 2026/10/17 16:10
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+from wing_utils.download.http_session_utils import HttpSessionUtils
+
+
+@dataclass
+class MirrorScore:
+    name: str
+    url: str
+    ttfb: Optional[float] = None  # 首字节时间 (秒)
+    throughput: float = 0.0  # 字节 / 秒
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.ttfb is not None
+
+    def estimate(self, sample_bytes: int) -> float:
+        """估算拉取 sample_bytes 所需的秒数，失败的镜像排在最后"""
+        if not self.ok:
+            return float("inf")
+        if self.throughput <= 0:
+            return self.ttfb
+        return self.ttfb + sample_bytes / self.throughput
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class MirrorRaceUtils:
+    """并发探测所有镜像，按首字节时间和吞吐量排序"""
+
+    SAMPLE_BYTES = 64 * 1024
+    TIMEOUT = 5
+
+    @staticmethod
+    def probe(name: str, base_url: str, probe_path: str = "", sample_bytes: int = SAMPLE_BYTES,
+              timeout: float = TIMEOUT) -> MirrorScore:
+        """
+        对单个镜像发起一次小的 Range 请求
+        :param name: 镜像名
+        :param base_url: 镜像根地址
+        :param probe_path: 探测路径，例如 index.json 或目标文件的相对路径
+        """
+        url = f"{base_url.rstrip('/')}/{probe_path.lstrip('/')}" if probe_path else base_url
+        score = MirrorScore(name=name, url=base_url)
+        headers = {"Range": f"bytes=0-{sample_bytes - 1}"}
+        start = time.perf_counter()
+        try:
+            with HttpSessionUtils.get_session().get(url, headers=headers, stream=True, timeout=timeout) as r:
+                r.raise_for_status()
+                received = 0
+                first_byte_at = None
+                for chunk in r.iter_content(chunk_size=8192):
+                    if first_byte_at is None:
+                        first_byte_at = time.perf_counter()
+                    received += len(chunk)
+                    # 服务器忽略 Range 时也只读取样本大小
+                    if received >= sample_bytes:
+                        break
+                end = time.perf_counter()
+            first_byte_at = first_byte_at or end
+            score.ttfb = first_byte_at - start
+            transfer = end - first_byte_at
+            score.throughput = received / transfer if transfer > 0 else 0.0
+        except Exception as e:
+            score.error = str(e)
+        return score
+
+    @staticmethod
+    def race(mirrors: Dict[str, str], probe_path: str = "", sample_bytes: int = SAMPLE_BYTES,
+             timeout: float = TIMEOUT) -> List[MirrorScore]:
+        """
+        并发探测所有镜像
+        :param mirrors: 镜像名 -> 根地址
+        :return: 从快到慢排序的 MirrorScore 列表
+        """
+        if not mirrors:
+            return []
+        with ThreadPoolExecutor(max_workers=len(mirrors)) as pool:
+            futures = [pool.submit(MirrorRaceUtils.probe, name, url, probe_path, sample_bytes, timeout)
+                       for name, url in mirrors.items()]
+            scores = [f.result() for f in futures]
+        return sorted(scores, key=lambda s: s.estimate(sample_bytes))
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : offline_bundle_utils.py
+@Path : wing_utils/download
+@Author : Anfioo
+@Date : 2026/10/18 01:10
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import json
+import threading
+import time
+import zipfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from wing_utils.download.http_session_utils import HttpSessionUtils
+
+MANIFEST_NAME = "manifest.json"
+BUNDLE_FORMAT = 1
+
+
+@dataclass
+class BundleEntry:
+    """
+    离线包中的一个文件
+    url: 原始地址 (离线时按它查找)
+    member: zip 中的成员名
+    kind: feed (版本数据源) / artifact (安装包)
+    """
+    url: str
+    member: str
+    kind: str
+    size: int
+    sha256: Optional[str] = None
+    content_type: Optional[str] = None
+
+
+class OfflineBundle:
+    """
+    可移植的离线包：一个 zip 文件，manifest.json 记录 url -> 成员的索引
+
+    版本数据源 (jdks.json、index.json、目录页面等) 压缩保存；安装包本身已是压缩格式，按原样存储 (ZIP_STORED)，
+    读取时直接定位到文件中的偏移，不需要解压。
+    manifest 中的 records 是导出时选中的目录记录 (CatalogRecord.to_dict)。
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path)
+        manifest = json.loads(self._zip.read(MANIFEST_NAME))
+        if manifest.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"不支持的离线包格式: {manifest.get('format')}")
+        self.created_at: float = manifest.get("created_at", 0)
+        self.records: List[Dict[str, Any]] = manifest.get("records", [])
+        self.entries: Dict[str, BundleEntry] = {}
+        for item in manifest.get("entries", []):
+            entry = BundleEntry(**item)
+            self.entries[OfflineBundle.normalize_url(entry.url)] = entry
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """与 requests 发出的地址保持一致 (编码、默认路径等)"""
+        return requests.Request("GET", url).prepare().url
+
+    def find(self, url: str) -> Optional[BundleEntry]:
+        return self.entries.get(OfflineBundle.normalize_url(url))
+
+    def open(self, entry: BundleEntry):
+        """打开成员，返回可流式读取的文件对象"""
+        with self._lock:
+            return self._zip.open(entry.member)
+
+    def read(self, entry: BundleEntry) -> bytes:
+        with self._lock:
+            return self._zip.read(entry.member)
+
+    def close(self):
+        self._zip.close()
+
+    # =========================
+    # 写入
+    # =========================
+
+    @staticmethod
+    def write(path: Union[str, Path], files: List[Dict[str, Any]],
+              records: Optional[List[Dict[str, Any]]] = None) -> List[BundleEntry]:
+        """
+        生成离线包 (先写临时文件，完成后替换)
+        :param path: 输出路径
+        :param files: [{"url", "path", "kind", "name"?, "sha256"?, "content_type"?}]，name 为包内显示的文件名
+        :param records: 选中的目录记录
+        :return: 写入的条目
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        entries, seen = [], set()
+        with zipfile.ZipFile(tmp_path, "w") as zf:
+            for i, item in enumerate(files):
+                if item["url"] in seen:
+                    continue
+                seen.add(item["url"])
+                source = Path(item["path"])
+                member = f"{item['kind']}s/{i:05d}-{item.get('name') or source.name}"
+                compress = zipfile.ZIP_DEFLATED if item["kind"] == "feed" else zipfile.ZIP_STORED
+                zf.write(source, member, compress_type=compress)
+                entries.append(BundleEntry(url=item["url"], member=member, kind=item["kind"],
+                                           size=source.stat().st_size, sha256=item.get("sha256"),
+                                           content_type=item.get("content_type")))
+            manifest = {"format": BUNDLE_FORMAT, "created_at": time.time(),
+                        "entries": [asdict(e) for e in entries], "records": records or []}
+            zf.writestr(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False), compress_type=zipfile.ZIP_DEFLATED)
+        tmp_path.replace(path)
+        return entries
+
+
+class OfflineBundleUtils:
+    """
+    离线模式：在共享 Session 上挂载从离线包读取的 transport
+
+    启用后所有经过 HttpSessionUtils 的请求 (检索构建器的数据源、CacheFileManager 的条件请求、
+    DownloadUtils 的下载) 都由离线包应答，完全不联网；离线包中没有的地址直接报连接错误。
+    """
+
+    PREFIXES = ("http://", "https://")
+
+    _bundle: Optional[OfflineBundle] = None
+    _adapter: Optional[BaseAdapter] = None
+    # 启用前各前缀上挂载的 transport (例如镜像代理)，关闭时恢复
+    _previous: Dict[str, Optional[BaseAdapter]] = {}
+
+    @classmethod
+    def enable(cls, bundle_path: Union[str, Path]):
+        bundle = OfflineBundle(bundle_path)
+        adapter = _OfflineBundleAdapter(bundle)
+        for prefix in cls.PREFIXES:
+            current = HttpSessionUtils.mounted(prefix)
+            if cls._adapter is None or current is not cls._adapter:
+                cls._previous[prefix] = current
+            HttpSessionUtils.mount(prefix, adapter)
+        if cls._bundle is not None:
+            cls._bundle.close()
+        cls._bundle = bundle
+        cls._adapter = adapter
+
+    @classmethod
+    def disable(cls):
+        """只移除自己挂载的 transport 并恢复启用前的挂载；之后被其它模块覆盖的前缀保持不变"""
+        if cls._bundle is None:
+            return
+        for prefix in cls.PREFIXES:
+            HttpSessionUtils.unmount(prefix, cls._adapter, cls._previous.pop(prefix, None))
+        cls._bundle.close()
+        cls._bundle = None
+        cls._adapter = None
+
+    @classmethod
+    def current(cls) -> Optional[OfflineBundle]:
+        """当前生效的离线包"""
+        return cls._bundle
+
+
+class _OfflineBundleAdapter(BaseAdapter):
+    """按请求地址从离线包中取出内容，构造 200 响应 (HEAD 只返回头部)"""
+
+    def __init__(self, bundle: OfflineBundle):
+        super().__init__()
+        self.bundle = bundle
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        entry = self.bundle.find(request.url)
+        if entry is None:
+            raise requests.ConnectionError(f"离线模式: 离线包 {self.bundle.path.name} 中没有 {request.url}",
+                                           request=request)
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8" if entry.kind == "feed" else None
+        response.headers = CaseInsensitiveDict({"Content-Length": str(entry.size)})
+        if entry.content_type:
+            response.headers["Content-Type"] = entry.content_type
+        if request.method == "HEAD":
+            response._content = b""
+        else:
+            response.raw = self.bundle.open(entry)
+        return response
+
+    def close(self):
+        pass
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : rate_limit_utils.py
+@Path : wing_utils/download
+@Author : Anfioo
+@Date : 2026/10/17 18:20
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import re
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+
+class DownloadPriority(IntEnum):
+    """数值越小优先级越高"""
+    INTERACTIVE = 0  # 用户正在等待的安装
+    BACKGROUND = 1  # 后台预取、目录刷新等
+
+
+class TokenBucket:
+    """
+    令牌桶限速器 (线程安全)
+    允许令牌透支：一次消耗超过桶容量的数据块也能通过，随后按速率等待补齐，
+    这样无论分块大小如何，长期平均速率都不超过 rate。
+    有更高优先级的线程在等待时，低优先级线程不会取走令牌。
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        :param rate: 字节 / 秒，<= 0 表示不限速
+        :param burst: 桶容量 (字节)，默认等于 1 秒的流量
+        """
+        self.rate = rate
+        self.capacity = burst if burst else rate
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._cond = threading.Condition()
+        self._waiting = {priority: 0 for priority in DownloadPriority}
+
+    def consume(self, amount: int, priority: DownloadPriority = DownloadPriority.INTERACTIVE):
+        """取走 amount 个令牌，不足时阻塞"""
+        if self.rate <= 0 or amount <= 0:
+            return
+        with self._cond:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    self._refill()
+                    blocked = any(self._waiting[p] for p in DownloadPriority if p < priority)
+                    if not blocked and self._tokens > 0:
+                        self._tokens -= amount
+                        return
+                    deficit = -self._tokens if self._tokens <= 0 else 0
+                    self._cond.wait(timeout=max(0.005, deficit / self.rate))
+            finally:
+                self._waiting[priority] -= 1
+                self._cond.notify_all()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+
+class BandwidthScheduler:
+    """
+    下载带宽调度：一个全局令牌桶 + 按主机的令牌桶
+    所有下载路径 (单连接、分段、批量、边下边解压) 每收到一块数据都调用 throttle。
+    """
+
+    _global: Optional[TokenBucket] = None
+    _host_rates: Dict[str, float] = {}
+    _hosts: Dict[str, TokenBucket] = {}
+    _lock = threading.Lock()
+    # 当前线程的默认优先级 (priority_scope)，供不直接传 priority 的请求使用
+    _local = threading.local()
+
+    _UNITS = {"": 1, "B": 1, "K": 1024, "KB": 1024, "M": 1024 ** 2, "MB": 1024 ** 2, "G": 1024 ** 3, "GB": 1024 ** 3}
+
+    @staticmethod
+    def parse_rate(text: Optional[str]) -> float:
+        """
+        解析速率配置，例如 "512K"、"10M"、"1.5MB"、"2048"，单位为每秒
+        :return: 字节 / 秒，空值或 0 表示不限速
+        """
+        if not text:
+            return 0
+        match = re.fullmatch(r"\s*([\d.]+)\s*([KMG]?B?)(?:/S)?\s*", text.upper())
+        if not match:
+            raise ValueError(f"无法解析的速率: {text}")
+        return float(match.group(1)) * BandwidthScheduler._UNITS[match.group(2)]
+
+    @classmethod
+    def configure(cls, global_rate: float = 0, host_rates: Optional[Dict[str, float]] = None):
+        """
+        设置限速
+        :param global_rate: 全局上限 (字节 / 秒)，0 表示不限速
+        :param host_rates: 主机名 -> 上限 (字节 / 秒)
+        """
+        with cls._lock:
+            cls._global = TokenBucket(global_rate) if global_rate > 0 else None
+            cls._host_rates = {host.lower(): rate for host, rate in (host_rates or {}).items() if rate > 0}
+            cls._hosts = {}
+
+    @classmethod
+    def reset(cls):
+        """取消全部限速"""
+        cls.configure()
+
+    @classmethod
+    @contextmanager
+    def priority_scope(cls, priority: DownloadPriority) -> Iterator[None]:
+        """在 with 块内把当前线程的请求标记为 priority (例如目录刷新、预取标记为 BACKGROUND)"""
+        previous = cls.current_priority()
+        cls._local.priority = priority
+        try:
+            yield
+        finally:
+            cls._local.priority = previous
+
+    @classmethod
+    def current_priority(cls) -> DownloadPriority:
+        return getattr(cls._local, "priority", DownloadPriority.INTERACTIVE)
+
+    @classmethod
+    def throttle(cls, url: str, amount: int, priority: DownloadPriority = DownloadPriority.INTERACTIVE):
+        """
+        记录收到的 amount 字节，超出配额时阻塞当前线程
+        :param url: 数据来源地址 (用于匹配主机限速)
+        """
+        if cls._global is None and not cls._host_rates:
+            return
+        host_bucket = cls._host_bucket(url)
+        if host_bucket is not None:
+            host_bucket.consume(amount, priority)
+        if cls._global is not None:
+            cls._global.consume(amount, priority)
+
+    @classmethod
+    def _host_bucket(cls, url: str) -> Optional[TokenBucket]:
+        if not cls._host_rates:
+            return None
+        host = (urlparse(url).hostname or "").lower()
+        rate = cls._host_rates.get(host)
+        if rate is None:
+            return None
+        with cls._lock:
+            bucket = cls._hosts.get(host)
+            if bucket is None:
+                bucket = cls._hosts[host] = TokenBucket(rate)
+            return bucket
+
+
+class ConnectionLimiter:
+    """
+    按主机限制同时进行的 HTTP 请求数 (线程安全)
+    探测、单连接下载与每个 Range 分段都要先取得所属主机的名额，
+    因此多个任务共用一个实例时，同一主机的连接总数不会超过 per_host。
+    """
+
+    def __init__(self, per_host: int):
+        """
+        :param per_host: 同一主机同时打开的连接数上限
+        """
+        self.per_host = max(1, per_host)
+        self._hosts: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """在 with 块内占用 url 所属主机的一个连接名额，名额用完时阻塞"""
+        semaphore = self._semaphore(url)
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    def _semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            semaphore = self._hosts.get(host)
+            if semaphore is None:
+                semaphore = self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+            return semaphore
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : streaming_install_utils.py
+@Path : wing_utils/download
+@Author : Anfioo
+@Date : 2026/10/17 17:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from wing_utils.download.blob_store import BlobStore
+from wing_utils.download.checksum_utils import ChecksumUtils, StreamingHasher
+from wing_utils.download.download_utils import DownloadUtils, _ProgressTicker
+from wing_utils.download.http_session_utils import HttpSessionUtils
+from wing_utils.download.rate_limit_utils import BandwidthScheduler, DownloadPriority
+from wing_utils.extract.python_tar_utils import PythonTarUtils
+from wing_utils.extract.staged_extract_utils import StagedExtractUtils
+from wing_utils.ui import console
+
+
+class StreamingInstallUtils:
+    """
+    tar 包边下载边解压：HTTP 响应体只读一遍，同时写入下载缓存、计算摘要并送入 tarfile 流式解压，
+    下载结束时解压也随之结束，省去下载完成后再完整读一遍文件的时间。
+    """
+
+    STREAMABLE_SUFFIXES = (".tar.gz", ".tgz", ".tar.xz", ".tar.bz2", ".tar")
+
+    @staticmethod
+    def is_streamable(url_or_name: str) -> bool:
+        """是否为可以流式解压的 tar 包"""
+        name = DownloadUtils.get_filename_from_url(url_or_name).lower()
+        return name.endswith(StreamingInstallUtils.STREAMABLE_SUFFIXES)
+
+    @staticmethod
+    def download_and_extract(download_url: str, save_dir: str, dest_dir: str, checksum: Optional[str] = None,
+                             algorithm: str = "sha256", store: Optional[BlobStore] = None,
+                             priority: DownloadPriority = DownloadPriority.INTERACTIVE,
+                             names: Optional[List[str]] = None) -> Tuple[str, str]:
+        """
+        下载 tar 包并同时解压
+        缓存中已有完整文件时没有可省的下载时间，直接走 DownloadUtils.download + 普通解压。
+        两种情况都先解压到暂存目录，校验通过后原子替换 dest_dir 并写入完成标记 (见 StagedExtractUtils)。
+        :param download_url: 下载地址
+        :param save_dir: 下载缓存目录 (保留一份完整的包，供重装和仓库去重使用)
+        :param dest_dir: 解压目录
+        :param checksum: 期望的十六进制摘要 (可选)，不一致时删除已解压的内容并抛出 ChecksumMismatchError
+        :param algorithm: 摘要算法
+        :param store: 内容寻址仓库 (可选)
+        :param priority: 带宽调度优先级
+        :param names: 传入列表时追加全部条目名 (解压时顺带收集；跳过解压时取自完成标记)
+        :return: (缓存文件路径, 解压目录)
+        """
+        save_dir_path = Path(save_dir)
+        save_dir_path.mkdir(parents=True, exist_ok=True)
+        filename = DownloadUtils.get_filename_from_url(download_url)
+        full_path = save_dir_path / filename
+        part_path = save_dir_path / (filename + DownloadUtils.PART_SUFFIX)
+
+        cached = full_path.exists() or (store is not None and store.digest_for_url(download_url))
+        if cached:
+            saved = DownloadUtils.download(download_url, save_dir, checksum=checksum, algorithm=algorithm,
+                                           store=store, priority=priority)
+            digest = ChecksumUtils.file_digest(Path(saved), "sha256")
+            if StagedExtractUtils.is_complete(dest_dir, digest):
+                console.print(f"[bold green]✅ 已解压过同一压缩包，跳过: {dest_dir}[/bold green]")
+                if names is not None:
+                    names.extend(StagedExtractUtils.members(dest_dir) or [])
+                return saved, dest_dir
+            members: List[str] = []
+            with StagedExtractUtils.staging(dest_dir) as stage:
+                if not PythonTarUtils.extract_with_rich(saved, stage, names=members):
+                    raise IOError(f"解压失败: {saved}")
+                StagedExtractUtils.publish(stage, dest_dir, digest, saved, members)
+            if names is not None:
+                names.extend(members)
+            return saved, dest_dir
+
+        # sha256 总是计算：仓库去重与完成标记都要用
+        algorithms = [algorithm.lower()] if checksum else []
+        if "sha256" not in algorithms:
+            algorithms.append("sha256")
+        hashers = {algo: StreamingHasher(algo) for algo in algorithms}
+        members: List[str] = []
+
+        with StagedExtractUtils.staging(dest_dir) as stage, \
+                HttpSessionUtils.get_session().get(download_url, stream=True, timeout=30) as r:
+            r.raise_for_status()
+            total_size = int(r.headers.get("Content-Length", 0))
+            with DownloadUtils._create_progress() as progress, open(part_path, "wb") as cache_file:
+                task_id = progress.add_task(f"下载并解压 {filename}", total=total_size)
+                ticker = _ProgressTicker(progress, task_id)
+
+                def on_read(n: int):
+                    ticker.advance(n)
+                    BandwidthScheduler.throttle(download_url, n, priority)
+
+                reader = _TeeReader(r.raw, cache_file, hashers, on_read)
+                try:
+                    PythonTarUtils.extract_stream(
+                        reader, stage, names=members,
+                        on_member=lambda m: progress.update(task_id, description=f"解压 {_short(m.name)}"))
+                    # tar 结束标记之后可能还有填充块，读完才能得到完整的缓存文件和摘要
+                    reader.drain()
+                    ticker.flush()
+                except BaseException:
+                    cache_file.close()
+                    part_path.unlink(missing_ok=True)
+                    raise
+                progress.update(task_id, description=f"下载并解压 {filename}")
+
+            digests = {algo: hasher.finish(reader.offset) for algo, hasher in hashers.items()}
+            os.replace(part_path, full_path)
+            # 校验通过后才发布；不一致时异常离开 with，暂存目录被删除，目标目录保持原样
+            if checksum:
+                ChecksumUtils.verify(full_path, checksum, digests[algorithm.lower()], algorithm)
+            StagedExtractUtils.publish(stage, dest_dir, digests["sha256"], str(full_path), members)
+        if store is not None:
+            store.add(full_path, digests["sha256"], download_url)
+        for algo, digest in digests.items():
+            ChecksumUtils.save_digest(full_path, algo, digest)
+        if names is not None:
+            names.extend(members)
+        console.print(f"[bold green]✅ 下载与解压同时完成: {dest_dir}[/bold green]")
+        return str(full_path), dest_dir
+
+
+class _TeeReader:
+    """只读流包装：tarfile 读到的每一块同时写入缓存文件、送入摘要并推进进度"""
+
+    def __init__(self, raw, sink, hashers: Dict[str, StreamingHasher], on_read):
+        self._raw = raw
+        self._sink = sink
+        self._hashers = hashers
+        self._on_read = on_read
+        self.offset = 0
+
+    def read(self, size: int = -1) -> bytes:
+        # 与 iter_content 一致，按 Content-Encoding 解码
+        data = self._raw.read(None if size is None or size < 0 else size, decode_content=True)
+        if data:
+            self._sink.write(data)
+            for hasher in self._hashers.values():
+                hasher.feed(self.offset, data)
+            self.offset += len(data)
+            self._on_read(len(data))
+        return data
+
+    def drain(self):
+        while self.read(DownloadUtils.CHUNK_SIZE * 8):
+            pass
+
+
+def _short(name: str, width: int = 40) -> str:
+    return name if len(name) <= width else ".." + name[-(width - 2):]
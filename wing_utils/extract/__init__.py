@@ -13,11 +13,14 @@
 @QQ Email : 3485977506@qq.com
 """
 from .extract_archiver_utils import UniversalExtractor
+from .extract_progress_utils import ExtractProgress
 from .python_compress import PythonGzipUtils
 from .python_single_file_utils import PythonSingleFileUtils
 from .python_tar_utils import PythonTarUtils
 from .python_zip_utils import PythonZipUtils
 from .seven_zip_utils import SevenZipUtils
+from .staged_extract_utils import StagedExtractUtils
+from .toolchain_root_utils import ToolchainRootUtils
 
-__all__ = ["UniversalExtractor", "PythonGzipUtils", "PythonSingleFileUtils", "PythonTarUtils", "PythonZipUtils",
-           "SevenZipUtils"]
+__all__ = ["UniversalExtractor", "ExtractProgress", "PythonGzipUtils", "PythonSingleFileUtils", "PythonTarUtils", "PythonZipUtils",
+           "SevenZipUtils", "StagedExtractUtils", "ToolchainRootUtils"]
@@ -1,12 +1,15 @@
 import os
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 
 from rich.panel import Panel
 
+from wing_utils.download.checksum_utils import ChecksumUtils
 from wing_utils.extract.python_single_file_utils import PythonSingleFileUtils
 from wing_utils.extract.python_tar_utils import PythonTarUtils
 from wing_utils.extract.python_zip_utils import PythonZipUtils
 from wing_utils.extract.seven_zip_utils import SevenZipUtils
+from wing_utils.extract.staged_extract_utils import StagedExtractUtils
 
 from wing_utils.ui import console
 
@@ -16,8 +19,18 @@ class UniversalExtractor:
     EXTERNAL_TOOLS = ('.7z', '.rar')
 
     @staticmethod
-    def extract(file_path: str, dest_dir: Optional[str] = None) -> Optional[str]:
-        """万能解压入口"""
+    def extract(file_path: str, dest_dir: Optional[str] = None, workers: Optional[int] = None,
+                digest: Optional[str] = None, names: Optional[List[str]] = None) -> Optional[str]:
+        """
+        万能解压入口
+        先解压到目标目录旁的暂存目录，成功后原子替换目标目录并写入完成标记；
+        目标目录的完成标记与压缩包摘要一致时直接跳过解压
+        :param file_path: 压缩包路径
+        :param dest_dir: 解压目录，默认为去掉后缀的同名目录
+        :param workers: 自带 ZIP 解压器的进程数；1 为单进程逐个解压，默认按 CPU 核数并行 (小档案自动退回单进程)
+        :param digest: 压缩包的 sha256，不提供时计算 (下载时已保存的摘要会被复用)
+        :param names: 传入列表时追加 tar 包的条目名 (自带解压器顺带收集；跳过解压时取自完成标记)
+        """
         if not os.path.exists(file_path):
             print(f"❌ 错误: 文件不存在 -> {file_path}")
             return None
@@ -25,9 +38,31 @@ class UniversalExtractor:
         # 1. 自动计算目标目录 (防止解压后文件散落)
         if dest_dir is None:
             # 去掉后缀作为文件夹名 e.g., "data.7z" -> "data"
-            dest_dir = os.path.abspath(os.path.splitext(file_path)[0])
+            dest_dir = os.path.splitext(file_path)[0]
+        dest_dir = os.path.abspath(dest_dir)
 
-        os.makedirs(dest_dir, exist_ok=True)
+        digest = digest or ChecksumUtils.file_digest(Path(file_path), "sha256")
+        if StagedExtractUtils.is_complete(dest_dir, digest):
+            console.print(f"[bold green]✅ 已解压过同一压缩包，跳过: {dest_dir}[/bold green]")
+            if names is not None:
+                names.extend(StagedExtractUtils.members(dest_dir) or [])
+            return dest_dir
+
+        os.makedirs(os.path.dirname(dest_dir), exist_ok=True)
+        members: List[str] = []
+        with StagedExtractUtils.staging(dest_dir) as stage:
+            if not UniversalExtractor._extract_into(file_path, stage, workers, members):
+                StagedExtractUtils.discard(stage)
+                return None
+            published = StagedExtractUtils.publish(stage, dest_dir, digest, file_path, members)
+        if names is not None:
+            names.extend(members)
+        return published
+
+    @staticmethod
+    def _extract_into(file_path: str, dest_dir: str, workers: Optional[int],
+                      names: Optional[List[str]] = None) -> bool:
+        """按格式选择解压器，解压到 dest_dir"""
         ext = os.path.splitext(file_path)[1].lower()
 
         # 2. 核心逻辑策略
@@ -42,7 +77,7 @@ class UniversalExtractor:
         if SevenZipUtils.is_installed():
             success = SevenZipUtils.extract_with_rich(file_path, dest_dir)
             if success:
-                return dest_dir
+                return True
         console.print(
             Panel(
                 "可以尝试安装7z以获得更好的体验 https://www.7-zip.org/",
@@ -63,19 +98,20 @@ class UniversalExtractor:
         if ext in UniversalExtractor.PYTHON_SUPPORTED:
             try:
                 if ext == '.zip':
-                    if PythonZipUtils.extract_with_rich(file_path, dest_dir):
-                        return dest_dir
+                    if workers == 1:
+                        return PythonZipUtils.extract_with_rich(file_path, dest_dir)
+                    return PythonZipUtils.extract_parallel(file_path, dest_dir, workers=workers)
                 elif ext in ('.tar', '.tgz', '.tar.gz', '.tar.bz2', '.tar.xz'):
-                    if PythonTarUtils.extract_with_rich(file_path, dest_dir):
-                        return dest_dir
+                    if PythonTarUtils.extract_with_rich(file_path, dest_dir, names=names):
+                        return True
                 elif ext in ('.gz', '.bz2', '.xz'):
                     if PythonSingleFileUtils.extract_with_rich(file_path, dest_dir):
-                        return dest_dir
+                        return True
             except Exception as e:
                 print(f"❌ Python 工具解压失败: {e}")
 
         print(f"⚠️ 无法处理该格式: {ext} (建议安装 7-Zip)")
-        return None
+        return False
 
     @staticmethod
     def extract_dir(directory: str) -> None:
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : extract_progress_utils.py
+@Path : wing_utils/extract
+@Author : Anfioo
+@Date : 2026/10/18 03:40
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import sys
+import threading
+import time
+from typing import Optional
+
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, BarColumn, SpinnerColumn
+
+from wing_utils.ui import console
+
+
+class ExtractProgress:
+    """
+    解压进度：按字节计算，而不是按条目数
+
+    written 为已写出的解压后字节数 (用于显示与吞吐量)；completed / total 为进度条的位置，
+    单位可以与 written 不同 (流式 tar 的总量只知道压缩后大小，位置取已读取的压缩字节)。
+    advance / update 可以在任意线程里高频调用，渲染按 interval 合并；
+    标准输出不是终端时 (日志、CI) 不使用 Rich Live，每隔 plain_interval 打印一行文字。
+
+    用法:
+        with ExtractProgress("Python Zip 解压任务", total=total_size) as progress:
+            progress.advance(len(chunk), name)
+    """
+
+    INTERVAL = 0.1
+    PLAIN_INTERVAL = 2.0
+
+    def __init__(self, title: str, total: int, interval: Optional[float] = None, live: Optional[bool] = None):
+        """
+        :param title: 面板标题
+        :param total: 进度条总量 (字节)
+        :param interval: 两次渲染的最小间隔 (秒)
+        :param live: 是否使用 Rich Live，默认当标准输出是终端时使用
+        """
+        self.title = title
+        self.total = max(total, 1)
+        self.written = 0
+        self.completed = 0
+        self.current = ""
+        self._interval = self.INTERVAL if interval is None else interval
+        self._live_mode = sys.__stdout__.isatty() if live is None else live
+        self._lock = threading.Lock()
+        self._started = self._last = self._last_plain = time.monotonic()
+        self._progress: Optional[Progress] = None
+        self._live: Optional[Live] = None
+        self._task_id = None
+
+    def __enter__(self) -> "ExtractProgress":
+        self._started = self._last = self._last_plain = time.monotonic()
+        if self._live_mode:
+            self._progress = Progress(
+                SpinnerColumn(style="bold cyan"),
+                "[bold blue]{task.fields[status]}[/bold blue]",
+                "•",
+                BarColumn(style="white", complete_style="green", finished_style="bold green", pulse_style="green"),
+                "[progress.percentage]{task.percentage:>3.0f}%",
+                "[white]{task.fields[stats]}[/white]",
+                "[progress.description]{task.description}",
+            )
+            self._task_id = self._progress.add_task("[cyan]准备解压...[/cyan]", total=self.total,
+                                                    status="运行中", stats="")
+            self._live = Live(Panel(self._progress, title=f"[bold green]{self.title}[/bold green]", expand=True),
+                              console=console, refresh_per_second=10)
+            self._live.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.finish()
+        if self._live is not None:
+            self._live.__exit__(exc_type, exc, tb)
+            self._live = None
+
+    # =========================
+    # 更新
+    # =========================
+
+    def advance(self, written: int, name: Optional[str] = None):
+        """写出了 written 字节 (进度条位置同步前进)"""
+        with self._lock:
+            self.written += written
+            self.completed += written
+            if name is not None:
+                self.current = name
+        self._maybe_render()
+
+    def update(self, written: Optional[int] = None, completed: Optional[int] = None, name: Optional[str] = None):
+        """
+        设置绝对值
+        :param written: 已写出的解压后字节数
+        :param completed: 进度条位置
+        :param name: 当前条目
+        """
+        with self._lock:
+            if written is not None:
+                self.written = written
+            if completed is not None:
+                self.completed = completed
+            if name is not None:
+                self.current = name
+        self._maybe_render()
+
+    def finish(self):
+        """把进度条推到 100% 并立即渲染最终状态 (不额外等待)"""
+        with self._lock:
+            self.completed = self.total
+        self._render(final=True)
+
+    # =========================
+    # 统计
+    # =========================
+
+    def throughput(self) -> float:
+        """平均解压速度 (解压后字节 / 秒)"""
+        elapsed = time.monotonic() - self._started
+        return self.written / elapsed if elapsed > 0 else 0.0
+
+    def eta(self) -> Optional[float]:
+        """按进度条位置的平均速度估算剩余秒数，尚无进度时为 None"""
+        elapsed = time.monotonic() - self._started
+        if self.completed <= 0 or elapsed <= 0:
+            return None
+        return max(self.total - self.completed, 0) * elapsed / self.completed
+
+    def stats(self) -> str:
+        eta = self.eta()
+        eta_text = "--" if eta is None else f"{eta:.0f}s"
+        return f"{self.written / 1024 / 1024:.1f} MiB • {self.throughput() / 1024 / 1024:.1f} MiB/s • 剩余 {eta_text}"
+
+    # =========================
+    # 渲染
+    # =========================
+
+    def _maybe_render(self):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last < self._interval:
+                return
+            self._last = now
+        self._render()
+
+    def _render(self, final: bool = False):
+        name = (self.current[:50] + '..') if len(self.current) > 52 else self.current
+        if self._progress is not None:
+            if final:
+                self._progress.update(self._task_id, completed=self.total, stats=self.stats(), status="已完成",
+                                      description="[bold green]解压完成[/bold green]")
+                self._progress.refresh()
+            else:
+                self._progress.update(self._task_id, completed=self.completed, stats=self.stats(),
+                                      description=f"[cyan]正在解压:[/cyan] [yellow]{name}[/yellow]")
+            return
+        now = time.monotonic()
+        if not final and now - self._last_plain < self.PLAIN_INTERVAL:
+            return
+        self._last_plain = now
+        percent = 100 if final else int(self.completed * 100 / self.total)
+        console.print(f"{self.title} {percent:>3d}% {self.stats()} {'解压完成' if final else name}",
+                      markup=False, highlight=False)
@@ -1,22 +1,26 @@
 import os
+import re
+import shutil
 import tarfile
-import time
-from typing import Optional
+from typing import BinaryIO, Callable, List, Optional
 from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import Progress, BarColumn, SpinnerColumn, TextColumn
+from wing_utils.extract.extract_progress_utils import ExtractProgress
 from wing_utils.ui import console
 
+# gzip / bzip2 / xz 的文件头
+_COMPRESSED_MAGIC = (b"\x1f\x8b", b"BZh", b"\xfd7zXZ")
+
 
 class PythonTarUtils:
     """使用 Python 内置库实现的 Tar 解压工具，支持 Rich 美化输出"""
 
     @classmethod
-    def extract_with_rich(cls, file_path: str, dest_dir: Optional[str] = None) -> bool:
+    def extract_with_rich(cls, file_path: str, dest_dir: Optional[str] = None,
+                          names: Optional[List[str]] = None) -> bool:
         """
         使用 Python tarfile 库解压，提供类似 7z 的 Rich 界面
         注：tar 格式通常不直接支持密码加密
+        :param names: 传入列表时追加全部条目名 (供识别工具链根目录，不必再解压一遍读头部)
         """
         if not os.path.exists(file_path):
             console.print(f"[bold red]错误:[/bold red] 文件不存在 {file_path}")
@@ -31,79 +35,42 @@ class PythonTarUtils:
         archive_name = os.path.basename(file_path)
         console.print(f"\n[bold cyan]开始解析 TAR: [green]{archive_name}[/green][/bold cyan]")
 
-        # 2. 设置 Rich 进度条
-        progress = Progress(
-            SpinnerColumn(style="bold cyan"),
-            "[bold blue]{task.fields[status]}[/bold blue]",
-            "•",
-            BarColumn(style="white", complete_style="green", finished_style="bold green", pulse_style="green"),
-            "[progress.percentage]{task.percentage:>3.0f}%",
-            "[progress.description]{task.description}",
-        )
-
-        task_id = progress.add_task("[cyan]扫描档案中...[/cyan]", total=100, status="运行中")
+        compressed_size = os.path.getsize(file_path)
 
         try:
-            # 使用 errorlevel=1 确保遇到损坏的 tar 会抛出异常
-            with tarfile.open(file_path, 'r:*', errorlevel=1) as tf:
-                # 打印档案基本信息
-                # 注意：对于巨大的 tar 文件，getmembers() 可能会有轻微延迟
-                members = tf.getmembers()
-                total_files = len(members)
-                total_size = sum(m.size for m in members)
-
-                # 模拟 7z 的元数据展示
-                console.print(f"[white]Scanning the archive for entries:[/white]")
-                console.print(
-                    f"[bold magenta]{total_files} items[/bold magenta], [bold green]{total_size / 1024 / 1024:.2f} MiB[/bold green]")
-                console.print(f"[dim]--[/dim]")
-
-                meta_data = {
-                    "Path": file_path,
-                    "Type": "tar (posix)",
-                    "Physical Size": f"{os.path.getsize(file_path)} bytes",
-                    "Total Items": str(total_files)
-                }
-
-                alt_color = True
-                for k, v in meta_data.items():
-                    color = "bold cyan" if alt_color else "bold green"
-                    console.print(f"  [white]{k:15}[/white] : [{color}]{v}[/{color}]")
-                    alt_color = not alt_color
-
-                # 3. 开始解压逻辑
-                extracted_count = 0
-
-                with Live(Panel(progress, title="[bold green]Python Tar 解压任务[/bold green]", expand=True),
-                          console=console, refresh_per_second=10):
-
-                    for member in members:
-                        # 格式化显示路径
-                        display_name = (member.name[:50] + '..') if len(member.name) > 52 else member.name
-                        progress.update(task_id,
-                                        description="[cyan]正在提取:[/cyan] [yellow]{name}[/yellow]".format(
-                                            name=display_name))
-
-                        # 执行解压
-                        tf.extract(member, path=dest_dir, filter='fully_trusted')
-
-                        # 更新进度
-                        extracted_count += 1
-                        percentage = int((extracted_count / total_files) * 100)
-                        progress.update(task_id, completed=percentage)
-
-                    # 完成状态
-                    progress.update(
-                        task_id,
-                        description="[bold green]解压完成[/bold green]",
-                        completed=100,
-                        status="已完成"
-                    )
-                    progress.refresh()
-                    time.sleep(0.5)
-
-                console.print("\n[bold green]✅ Tar 解压完成！[/bold green]")
-                return True
+            # 只有未压缩的 tar 能靠 seek 跳过数据廉价地数出条目；压缩包数条目等于多解压一遍，不数
+            total_files = cls.count_members(file_path)
+            console.print(f"[white]Scanning the archive for entries:[/white]")
+            console.print(
+                f"[bold magenta]{total_files if total_files is not None else '?'} items[/bold magenta], "
+                f"[bold green]{compressed_size / 1024 / 1024:.2f} MiB[/bold green] (compressed)")
+            console.print(f"[dim]--[/dim]")
+
+            meta_data = {
+                "Path": file_path,
+                "Type": "tar (posix)",
+                "Physical Size": f"{compressed_size} bytes",
+                "Total Items": str(total_files) if total_files is not None else "流式解压，边解边计"
+            }
+
+            alt_color = True
+            for k, v in meta_data.items():
+                color = "bold cyan" if alt_color else "bold green"
+                console.print(f"  [white]{k:15}[/white] : [{color}]{v}[/{color}]")
+                alt_color = not alt_color
+
+            # 3. 单遍流式解压：进度条按底层文件已读取的 (压缩) 字节推进，同时统计写出的解压后字节
+            with open(file_path, 'rb') as raw, \
+                    ExtractProgress("Python Tar 解压任务", total=compressed_size) as progress:
+                reader = _CountingReader(raw, lambda consumed: progress.update(completed=consumed))
+
+                def on_member(member: tarfile.TarInfo):
+                    progress.update(written=progress.written + member.size, name=member.name)
+
+                cls.extract_stream(reader, dest_dir, on_member=on_member, extract_filter='fully_trusted', names=names)
+
+            console.print("\n[bold green]✅ Tar 解压完成！[/bold green]")
+            return True
 
         except tarfile.ReadError:
             console.print(f"\n[bold red]❌ 错误: 无法读取或损坏的 Tar 文件[/bold red]")
@@ -112,10 +79,102 @@ class PythonTarUtils:
             console.print(f"\n[bold red]运行时异常: {e}[/bold red]")
             return False
 
+    @staticmethod
+    def count_members(file_path: str) -> Optional[int]:
+        """
+        未压缩 tar 的条目数 (只读头部，数据块靠 seek 跳过)；压缩的 tar 返回 None
+        """
+        with open(file_path, 'rb') as f:
+            magic = f.read(6)
+        if magic.startswith(_COMPRESSED_MAGIC):
+            return None
+        try:
+            with tarfile.open(file_path, 'r:', errorlevel=1) as tf:
+                return sum(1 for _ in tf)
+        except tarfile.ReadError:
+            return None
+
+    @classmethod
+    def extract_stream(cls, fileobj: BinaryIO, dest_dir: str,
+                       on_member: Optional[Callable[[tarfile.TarInfo], None]] = None,
+                       extract_filter: str = "tar", names: Optional[List[str]] = None) -> List[str]:
+        """
+        以流模式 (r|*) 解压：只顺序读取 fileobj 一遍，不需要完整文件，也不需要 seek
+        适用于边下载边解压；流在校验完成前不可信，因此使用 tar 过滤器拒绝越界路径
+        符号链接与硬链接在流结束后再创建：tarfile 在无法创建链接时 (Windows 未开启开发者模式) 会回头读取目标条目，
+        流模式不能 seek，这里改为从磁盘上已解压的目标复制
+        :param fileobj: 只需实现 read(n) 的二进制流
+        :param dest_dir: 解压目录
+        :param on_member: 每解压一个条目后的回调 (用于刷新进度)
+        :param extract_filter: tarfile 解压过滤器，本地可信文件可用 fully_trusted
+        :param names: 传入列表时追加全部条目名
+        :return: 解压出的顶层条目名 (用于校验失败时清理)
+        """
+        os.makedirs(dest_dir, exist_ok=True)
+        top_level = []
+        links: List[tarfile.TarInfo] = []
+        with tarfile.open(fileobj=fileobj, mode="r|*", errorlevel=1) as tf:
+            for member in tf:
+                if member.issym() or member.islnk():
+                    links.append(member)
+                else:
+                    tf.extract(member, path=dest_dir, filter=extract_filter)
+                if names is not None:
+                    names.append(member.name)
+                top = os.path.normpath(member.name).split(os.sep)[0]
+                if top not in ("", ".") and top not in top_level:
+                    top_level.append(top)
+                if on_member:
+                    on_member(member)
+        for member in links:
+            cls._make_link(member, dest_dir, extract_filter)
+        return top_level
+
+    @staticmethod
+    def _make_link(member: tarfile.TarInfo, dest_dir: str, extract_filter: str):
+        """创建链接条目；系统不允许创建时复制已解压的目标 (与 tarfile 在可 seek 模式下的退化行为一致)"""
+        member = getattr(tarfile, f"{extract_filter}_filter")(member, dest_dir)
+        if member is None:
+            return
+        target = os.path.join(dest_dir, member.name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.lexists(target):
+            os.remove(target)
+        if member.issym():
+            source = os.path.normpath(os.path.join(os.path.dirname(target), member.linkname))
+        else:
+            source = os.path.join(dest_dir, member.linkname)
+        try:
+            if member.issym():
+                os.symlink(member.linkname, target)
+            else:
+                os.link(source, target)
+            return
+        except (OSError, NotImplementedError):
+            pass
+        if os.path.isdir(source):
+            shutil.copytree(source, target, symlinks=True)
+        else:
+            shutil.copy2(source, target)
+
+
+class _CountingReader:
+    """包装底层文件，记录解压器已经读走的字节数 (压缩后的位置)"""
+
+    def __init__(self, raw: BinaryIO, on_read: Optional[Callable[[int], None]] = None):
+        self._raw = raw
+        self._on_read = on_read
+        self.consumed = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self.consumed += len(data)
+        if self._on_read:
+            self._on_read(self.consumed)
+        return data
+
 
 # --- 使用示例 ---
 if __name__ == "__main__":
-    import re  # 补齐正则依赖
-
     # 替换为你实际的 tar 文件名，如 test.tar.gz
     PythonTarUtils.extract_with_rich("seven_zip_utils.tar", "./output")
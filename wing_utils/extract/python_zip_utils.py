@@ -1,20 +1,29 @@
+import heapq
+import mmap
+import multiprocessing
 import os
+import queue
 import re
-import time
 import zipfile
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
 from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import Progress, BarColumn, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from wing_utils.extract.extract_progress_utils import ExtractProgress
 from wing_utils.ui import console
 
 
 class PythonZipUtils:
     """使用 Python 内置库实现的 Zip 解压工具，支持 Rich 美化输出"""
 
+    # 并行解压：条目数或解压后大小低于阈值时进程池的启动开销不划算，退回单进程
+    PARALLEL_MIN_FILES = 256
+    PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+    # 工作进程每写入这么多字节向主进程汇报一次进度
+    REPORT_BYTES = 1024 * 1024
+    COPY_BUFFER = 1024 * 1024
+
     @classmethod
     def extract_with_rich(cls, file_path: str, dest_dir: Optional[str] = None, password: Optional[str] = None) -> bool:
         """
@@ -32,18 +41,6 @@ class PythonZipUtils:
         archive_name = os.path.basename(file_path)
         console.print(f"\n[bold cyan]开始解析 ZIP: [green]{archive_name}[/green][/bold cyan]")
 
-        # 2. 设置 Rich 进度条 (保持与 7z 风格一致)
-        progress = Progress(
-            SpinnerColumn(style="bold cyan"),
-            "[bold blue]{task.fields[status]}[/bold blue]",
-            "•",
-            BarColumn(style="white", complete_style="green", finished_style="bold green", pulse_style="green"),
-            "[progress.percentage]{task.percentage:>3.0f}%",
-            "[progress.description]{task.description}",
-        )
-
-        task_id = progress.add_task("[cyan]准备解压...[/cyan]", total=100, status="运行中")
-
         try:
             with zipfile.ZipFile(file_path, 'r') as zf:
                 # 打印档案基本信息
@@ -71,38 +68,18 @@ class PythonZipUtils:
                     console.print(f"  [white]{k:15}[/white] : [{color}]{v}[/{color}]")
                     alt_color = not alt_color
 
-                # 3. 开始解压逻辑
+                # 3. 开始解压逻辑：按写出的字节推进进度，大文件也能连续显示
                 pwd_bytes = password.encode('utf-8') if password else None
-                extracted_count = 0
-
-                with Live(Panel(progress, title="[bold green]Python Zip 解压任务[/bold green]", expand=True),
-                          console=console, refresh_per_second=10):
 
+                with ExtractProgress("Python Zip 解压任务", total=total_size) as progress:
                     for member in info_list:
-                        # 更新当前处理的文件名
-                        display_name = (member.filename[:50] + '..') if len(member.filename) > 52 else member.filename
-                        progress.update(task_id,
-                                        description="[cyan]正在解压:[/cyan] [yellow]{display_name}[/yellow]".format(
-                                            display_name=display_name))
-
-                        # 执行解压
-                        zf.extract(member, path=dest_dir, pwd=pwd_bytes)
-
-                        # 更新进度百分比
-                        extracted_count += 1
-                        percentage = int((extracted_count / total_files) * 100)
-                        progress.update(task_id, completed=percentage)
-
-                    # 完成状态
-                    progress.update(
-                        task_id,
-                        description="[bold green]解压完成[/bold green]",
-                        completed=100,
-                        status="已完成"
-                    )
-                    # 添加刷新和足够长的等待时间
-                    progress.refresh()
-                    time.sleep(1)  # 增加到 2 秒
+                        target = _member_path(dest_dir, member.filename)
+                        if member.is_dir():
+                            os.makedirs(target, exist_ok=True)
+                            continue
+                        os.makedirs(os.path.dirname(target), exist_ok=True)
+                        _copy_member(zf, member.filename, target, pwd_bytes, cls.COPY_BUFFER,
+                                     lambda n, name=member.filename: progress.advance(n, name))
 
                 console.print("\n[bold green]✅ 解压完成！[/bold green]")
                 return True
@@ -118,6 +95,170 @@ class PythonZipUtils:
             return False
 
 
+    @classmethod
+    def extract_parallel(cls, file_path: str, dest_dir: Optional[str] = None, password: Optional[str] = None,
+                         workers: Optional[int] = None) -> bool:
+        """
+        多进程并行解压 (inflate 是 CPU 密集型，单进程只能用满一个核)
+
+        条目按压缩后大小均分给各工作进程，每个进程以 mmap 打开自己的 ZipFile 句柄；
+        目录由主进程一次性预先创建，各进程汇报写入的字节数，进度在主进程的 Rich 面板中汇总。
+        小档案直接走 extract_with_rich。
+        :param workers: 进程数，默认 CPU 核数
+        """
+        if not os.path.exists(file_path):
+            console.print(f"[bold red]错误:[/bold red] 文件不存在 {file_path}")
+            return False
+        if dest_dir is None:
+            dest_dir = os.path.splitext(file_path)[0]
+        workers = workers or os.cpu_count() or 1
+
+        try:
+            with zipfile.ZipFile(file_path, 'r') as zf:
+                info_list = zf.infolist()
+        except zipfile.BadZipFile as e:
+            console.print(f"\n[bold red]❌ 无法读取 ZIP: {e}[/bold red]")
+            return False
+        files = [info for info in info_list if not info.is_dir()]
+        total_size = sum(info.file_size for info in files)
+        if workers < 2 or (len(files) < cls.PARALLEL_MIN_FILES and total_size < cls.PARALLEL_MIN_BYTES):
+            return cls.extract_with_rich(file_path, dest_dir, password)
+
+        archive_name = os.path.basename(file_path)
+        console.print(f"\n[bold cyan]开始并行解压 ZIP: [green]{archive_name}[/green][/bold cyan]")
+        console.print(f"[bold magenta]{len(files)} files[/bold magenta], "
+                      f"[bold green]{total_size / 1024 / 1024:.2f} MiB[/bold green], [cyan]{workers} 个进程[/cyan]")
+
+        # 目录一次建好，工作进程只写文件
+        for directory in sorted({os.path.dirname(_member_path(dest_dir, info.filename)) for info in files} |
+                                {_member_path(dest_dir, info.filename) for info in info_list if info.is_dir()}):
+            os.makedirs(directory, exist_ok=True)
+
+        shares = [share for share in cls.partition(files, workers) if share]
+        pwd_bytes = password.encode('utf-8') if password else None
+        # spawn 方式 (Windows) 下子进程只能通过 initializer 拿到队列
+        reports = multiprocessing.get_context().Queue()
+        try:
+            with ExtractProgress(f"Python Zip 并行解压任务 ({len(shares)} 个进程)", total=total_size) as progress:
+                with ProcessPoolExecutor(max_workers=len(shares), initializer=_init_worker,
+                                         initargs=(reports,)) as pool:
+                    futures = [pool.submit(_extract_share, file_path, dest_dir, [i.filename for i in share],
+                                           pwd_bytes, cls.REPORT_BYTES, cls.COPY_BUFFER)
+                               for share in shares]
+                    while not all(f.done() for f in futures):
+                        try:
+                            progress.advance(reports.get(timeout=ExtractProgress.INTERVAL))
+                        except queue.Empty:
+                            pass
+                    for f in futures:
+                        f.result()
+                # 进程池退出时工作进程已把队列中的数据全部写出，取完最后几份进度，written 才是真实的解压字节数
+                while True:
+                    try:
+                        progress.advance(reports.get_nowait())
+                    except queue.Empty:
+                        break
+        except RuntimeError as e:
+            if 'password' in str(e).lower():
+                console.print(f"\n[bold red]❌ 需要密码或密码错误[/bold red]")
+            else:
+                console.print(f"\n[bold red]❌ 运行时错误: {e}[/bold red]")
+            return False
+        except Exception as e:
+            console.print(f"\n[bold red]运行时异常: {e}[/bold red]")
+            return False
+        finally:
+            reports.close()
+
+        console.print("\n[bold green]✅ 解压完成！[/bold green]")
+        return True
+
+    @staticmethod
+    def partition(infos: List[zipfile.ZipInfo], workers: int) -> List[List[zipfile.ZipInfo]]:
+        """
+        按压缩后大小把条目分成 workers 份 (从大到小依次放入当前最轻的一份)
+        压缩后大小近似于 inflate 的工作量，各份耗时接近
+        """
+        heap: List[Tuple[int, int]] = [(0, i) for i in range(workers)]
+        shares: List[List[zipfile.ZipInfo]] = [[] for _ in range(workers)]
+        for info in sorted(infos, key=lambda i: i.compress_size, reverse=True):
+            load, index = heapq.heappop(heap)
+            shares[index].append(info)
+            # 每个条目至少算 1，避免大量空文件全部落到同一份
+            heapq.heappush(heap, (load + max(info.compress_size, 1), index))
+        return shares
+
+
+def _member_path(dest_dir: str, filename: str) -> str:
+    """与 ZipFile.extract 相同的路径清理：去掉盘符、绝对路径与 .. (防止越界写入)"""
+    arcname = filename.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid = ('', os.path.curdir, os.path.pardir)
+    arcname = os.path.sep.join(x for x in arcname.split(os.path.sep) if x not in invalid)
+    if os.path.sep == '\\':
+        arcname = zipfile.ZipFile._sanitize_windows_name(arcname, os.path.sep)
+    return os.path.join(dest_dir, arcname)
+
+
+class _MappedArchive:
+    """给 mmap 补上 ZipFile 需要的 seekable (3.13 之前的 mmap 没有)"""
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+        self.read = mapped.read
+        self.seek = mapped.seek
+        self.tell = mapped.tell
+
+    @staticmethod
+    def seekable() -> bool:
+        return True
+
+
+def _copy_member(zf: zipfile.ZipFile, name: str, target: str, pwd: Optional[bytes], buffer_size: int,
+                 on_chunk: Callable[[int], None]):
+    """分块解压一个条目，每写出一块回调一次 (目录需已存在)"""
+    with zf.open(name, pwd=pwd) as source, open(target, 'wb') as out:
+        while True:
+            chunk = source.read(buffer_size)
+            if not chunk:
+                break
+            out.write(chunk)
+            on_chunk(len(chunk))
+
+
+_reports = None
+
+
+def _init_worker(reports):
+    global _reports
+    _reports = reports
+
+
+def _extract_share(file_path: str, dest_dir: str, names: List[str], pwd: Optional[bytes],
+                   report_bytes: int, buffer_size: int) -> int:
+    """
+    工作进程：解压分到的条目 (目录已由主进程创建)
+    :return: 写入的字节数
+    """
+    written = pending = 0
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+            zipfile.ZipFile(_MappedArchive(mapped)) as zf:
+        for name in names:
+            def on_chunk(n):
+                nonlocal written, pending
+                pending += n
+                if pending >= report_bytes:
+                    _reports.put(pending)
+                    written, pending = written + pending, 0
+
+            _copy_member(zf, name, _member_path(dest_dir, name), pwd, buffer_size, on_chunk)
+    if pending:
+        _reports.put(pending)
+    return written + pending
+
+
 # --- 使用示例 ---
 if __name__ == "__main__":
     # 确保你有一个 test.zip 或者修改为你的文件名
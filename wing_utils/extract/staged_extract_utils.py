@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : staged_extract_utils.py
+@Path : wing_utils/extract
+@Author : Anfioo
+@Date : 2026/10/18 04:20
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+
+class StagedExtractUtils:
+    """
+    暂存解压与原子发布
+
+    先解压到目标目录旁边的暂存目录 (同一文件系统)，全部完成后批量 fsync 目录项，
+    再用一次 os.rename 换到目标位置；中途崩溃或 Ctrl-C 只会留下暂存目录，目标目录要么是旧的完整内容，要么是新的完整内容。
+    发布后在目标目录旁写入完成标记 (<目标目录>.extracted)，记录压缩包的 sha256，
+    同一个压缩包再次安装时凭标记直接跳过解压；解压时收集到的条目名也记在标记中，跳过解压时仍可用于识别根目录。
+    """
+
+    STAGE_SUFFIX = ".partial"
+    OLD_SUFFIX = ".old"
+    MARKER_SUFFIX = ".extracted"
+
+    @staticmethod
+    def stage_path(dest_dir: str) -> str:
+        """目标目录旁的暂存目录: <父目录>/.<名称>.partial"""
+        dest_dir = os.path.abspath(dest_dir)
+        return os.path.join(os.path.dirname(dest_dir), f".{os.path.basename(dest_dir)}{StagedExtractUtils.STAGE_SUFFIX}")
+
+    @staticmethod
+    def marker_path(dest_dir: str) -> str:
+        return os.path.abspath(dest_dir) + StagedExtractUtils.MARKER_SUFFIX
+
+    @staticmethod
+    @contextmanager
+    def staging(dest_dir: str) -> Iterator[str]:
+        """
+        提供一个干净的暂存目录；with 块内抛出异常 (包括 KeyboardInterrupt) 时删除它
+        上次崩溃遗留的暂存目录会先被清掉
+        """
+        stage = StagedExtractUtils.stage_path(dest_dir)
+        StagedExtractUtils.discard(stage)
+        os.makedirs(stage)
+        try:
+            yield stage
+        except BaseException:
+            StagedExtractUtils.discard(stage)
+            raise
+
+    @staticmethod
+    def publish(stage: str, dest_dir: str, digest: Optional[str] = None, archive: Optional[str] = None,
+                members: Optional[List[str]] = None) -> str:
+        """
+        fsync 暂存目录后原子替换目标目录，并写入完成标记
+        :param stage: 暂存目录
+        :param dest_dir: 目标目录 (已存在时被整体替换)
+        :param digest: 压缩包的 sha256，提供时写入完成标记
+        :param archive: 压缩包路径 (写入标记，便于排查)
+        :param members: 压缩包的条目名 (写入标记)
+        :return: 目标目录
+        """
+        dest_dir = os.path.abspath(dest_dir)
+        StagedExtractUtils.fsync_tree(stage)
+        # 旧标记先失效：替换过程中崩溃时，目标目录不会被误认为是完整的
+        marker = StagedExtractUtils.marker_path(dest_dir)
+        if os.path.exists(marker):
+            os.remove(marker)
+        old = None
+        if os.path.lexists(dest_dir):
+            old = dest_dir + StagedExtractUtils.OLD_SUFFIX
+            StagedExtractUtils.discard(old)
+            os.rename(dest_dir, old)
+        os.rename(stage, dest_dir)
+        StagedExtractUtils._fsync_dir(os.path.dirname(dest_dir))
+        if old is not None:
+            StagedExtractUtils.discard(old)
+        if digest:
+            StagedExtractUtils.write_marker(dest_dir, digest, archive, members)
+        return dest_dir
+
+    @staticmethod
+    def write_marker(dest_dir: str, digest: str, archive: Optional[str] = None, members: Optional[List[str]] = None):
+        marker = StagedExtractUtils.marker_path(dest_dir)
+        tmp = marker + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"sha256": digest.lower(), "archive": os.path.basename(archive) if archive else None,
+                       "extracted_at": time.time(), "members": members or None}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, marker)
+
+    @staticmethod
+    def is_complete(dest_dir: str, digest: Optional[str]) -> bool:
+        """目标目录存在且完成标记中的摘要与 digest 一致"""
+        if not digest or not os.path.isdir(dest_dir):
+            return False
+        try:
+            with open(StagedExtractUtils.marker_path(dest_dir), "r", encoding="utf-8") as f:
+                return json.load(f).get("sha256") == digest.lower()
+        except (OSError, ValueError):
+            return False
+
+    @staticmethod
+    def members(dest_dir: str) -> Optional[List[str]]:
+        """完成标记中记录的条目名，没有记录时为 None"""
+        try:
+            with open(StagedExtractUtils.marker_path(dest_dir), "r", encoding="utf-8") as f:
+                return json.load(f).get("members")
+        except (OSError, ValueError):
+            return None
+
+    # =========================
+    # fsync
+    # =========================
+
+    @staticmethod
+    def fsync_tree(root: str):
+        """
+        自底向上 fsync 所有目录，使目录项 (文件名) 落盘；文件内容由系统回写
+        Windows 无法打开目录句柄，跳过
+        """
+        if os.name == "nt":
+            return
+        for directory, _, _ in os.walk(root, topdown=False):
+            StagedExtractUtils._fsync_dir(directory)
+
+    @staticmethod
+    def _fsync_dir(directory: str):
+        if os.name == "nt":
+            return
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def discard(path: str):
+        """删除暂存目录 (或任意残留路径)"""
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.lexists(path):
+            os.remove(path)
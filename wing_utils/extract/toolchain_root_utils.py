@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+------------------Project Information------------------
+@Project : WingShake->WingEnv
+@File : toolchain_root_utils.py
+@Path : wing_utils/extract
+@Author : Anfioo
+@Date : 2026/10/18 05:00
+------------------------Contact------------------------
+@Github : https://github.com/Anfioo
+@Gmail : anfioozys@gmail.com
+@QQ Email : 3485977506@qq.com
+"""
+import os
+import posixpath
+import zipfile
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class ToolchainRootUtils:
+    """
+    根据压缩包的条目列表识别工具链的根目录 (JAVA_HOME、GOROOT 等)
+
+    只看条目名，不遍历解压后的磁盘目录：zip 读中央目录；tar 没有目录，条目名由解压时顺带收集后传入。
+    识别规则：某个目录下同时存在某一组标记文件 (例如 JDK 的 release + bin/java)，该目录即为根目录；
+    找不到或找到多个互不包含的候选时视为有歧义，返回 None，由调用方退回手动选择。
+    """
+
+    # 工具 -> 标记组，任一组中的文件全部存在即命中
+    MARKERS: Dict[str, List[Tuple[str, ...]]] = {
+        "jdk": [("release", "bin/java"), ("release", "bin/java.exe")],
+        "node": [("bin/node",), ("node.exe",)],
+        "go": [("bin/go",), ("bin/go.exe",)],
+        "maven": [("bin/mvn",), ("bin/mvn.cmd",)],
+        "cmake": [("bin/cmake",), ("bin/cmake.exe",)],
+    }
+
+    @staticmethod
+    def list_members(file_path: str) -> Optional[List[str]]:
+        """
+        读取 zip 的条目名 (只读中央目录)
+        tar 不在这里读：压缩的 tar 读头部等于再解压一遍，应使用解压时收集的条目名
+        :return: 条目名列表，不是 zip 或读取失败时为 None
+        """
+        try:
+            if zipfile.is_zipfile(file_path):
+                with zipfile.ZipFile(file_path) as zf:
+                    return zf.namelist()
+        except (OSError, zipfile.BadZipFile):
+            return None
+        return None
+
+    @staticmethod
+    def detect(names: Iterable[str], kind: Optional[str] = None) -> Optional[str]:
+        """
+        从条目名中识别根目录
+        :param names: 条目名 (zip / tar 格式，目录可带结尾的 /)
+        :param kind: 工具类型 (MARKERS 的键)；为 None 时尝试全部标记；
+                     没有定义标记的类型只剥掉单一的顶层目录
+        :return: 相对路径 ("" 表示压缩包根目录本身)，有歧义时为 None
+        """
+        files = ToolchainRootUtils._normalize(names)
+        if kind is not None and kind not in ToolchainRootUtils.MARKERS:
+            return ToolchainRootUtils.strip_single_top(files)
+        groups = ToolchainRootUtils.MARKERS[kind] if kind else [
+            group for groups in ToolchainRootUtils.MARKERS.values() for group in groups]
+
+        candidates: Set[str] = set()
+        for group in groups:
+            first = group[0]
+            for name in files:
+                if name != first and not name.endswith("/" + first):
+                    continue
+                root = name[:len(name) - len(first)].rstrip("/")
+                if all(posixpath.join(root, marker) in files for marker in group[1:]):
+                    candidates.add(root)
+        return ToolchainRootUtils._pick(candidates)
+
+    @staticmethod
+    def strip_single_top(names: Iterable[str]) -> Optional[str]:
+        """
+        逐层剥掉唯一的顶层目录 (例如 apache-maven-3.9.6/ 或 jdk-21.jdk/Contents/Home/)
+        :return: 剥到的相对路径；顶层本来就有多个条目时为 None
+        """
+        files = ToolchainRootUtils._normalize(names)
+        root = ""
+        while True:
+            prefix = root + "/" if root else ""
+            children = {name[len(prefix):].split("/", 1)[0] for name in files if name.startswith(prefix)}
+            # 只有一个子项，且它是目录 (存在更深的条目)
+            if len(children) != 1:
+                break
+            child = prefix + children.pop()
+            if child in files:
+                break
+            root = child
+        return root or None
+
+    @staticmethod
+    def find_home(file_path: str, extracted_dir: str, kind: Optional[str] = None,
+                  names: Optional[Iterable[str]] = None) -> Optional[str]:
+        """
+        识别解压后工具链的根目录
+        :param file_path: 压缩包路径
+        :param extracted_dir: 解压目录
+        :param kind: 工具类型
+        :param names: 解压时收集的条目名 (tar 包)；为空时读取 zip 的中央目录
+        :return: 根目录的绝对路径，无法确定时为 None
+        """
+        names = names or ToolchainRootUtils.list_members(file_path)
+        if not names:
+            return None
+        root = ToolchainRootUtils.detect(names, kind)
+        if root is None:
+            return None
+        home = os.path.abspath(os.path.join(extracted_dir, *root.split("/")) if root else extracted_dir)
+        return home if os.path.isdir(home) else None
+
+    @staticmethod
+    def _normalize(names: Iterable[str]) -> Set[str]:
+        """统一分隔符，去掉 ./ 前缀与目录的结尾 /，只保留文件 (目录由文件路径隐含)"""
+        files = set()
+        for name in names:
+            name = name.replace("\\", "/")
+            while name.startswith("./"):
+                name = name[2:]
+            if name and not name.endswith("/"):
+                files.add(name.strip("/"))
+        return files
+
+    @staticmethod
+    def _pick(candidates: Set[str]) -> Optional[str]:
+        """唯一候选直接返回；多个候选时，最浅的一个包含其余全部 (例如 JDK 8 自带的 jre) 才返回它"""
+        if not candidates:
+            return None
+        shallowest = min(candidates, key=lambda c: (c.count("/") if c else -1, c))
+        prefix = shallowest + "/" if shallowest else ""
+        if all(c == shallowest or c.startswith(prefix) for c in candidates):
+            return shallowest
+        return None